@@ -0,0 +1,61 @@
+"""Many small GETs against a slow API: the sync client one at a time, then the asyncio client.
+
+    python benchmarks/bench_async.py [--requests 200] [--latency-ms 50] [--limits 8,32,64]
+
+The local server waits ``--latency-ms`` before every response, standing in for
+a remote platform API. The sync run issues the GETs one after another; each
+async run keeps up to ``limit`` in flight with async_http.gather_limited and
+checks that it returns the same results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_server import serve  # noqa: E402
+
+from pymlokit.utils import async_http, http  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--limits", default="8,32,64")
+    args = parser.parse_args()
+
+    base, stats, server = serve(latency_s=args.latency_ms / 1000)
+    urls = [f"{base}/items/{i}" for i in range(args.requests)]
+    print(f"{args.requests} GETs, {args.latency_ms:.0f} ms server latency")
+    try:
+        start = time.perf_counter()
+        expected = [http.get_json(u) for u in urls]
+        sync_s = time.perf_counter() - start
+        print(f"  sync, sequential      {sync_s:6.2f} s  {stats.connections:3d} connections")
+
+        for limit in (int(n) for n in args.limits.split(",")):
+            stats.connections = 0
+
+            async def fetch_all() -> list:
+                return await async_http.gather_limited((async_http.get_json(u) for u in urls), limit)
+
+            start = time.perf_counter()
+            results = async_http.run(fetch_all())
+            async_s = time.perf_counter() - start
+            assert results == expected
+            print(
+                f"  async, {limit:3d} in flight  {async_s:6.2f} s  {stats.connections:3d} connections"
+                f"  ({sync_s / async_s:.0f}x)"
+            )
+    finally:
+        http.close_connections()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Sequential get_json latency over HTTPS: pooled keep-alive, resumed TLS sessions and fresh connections.
+
+    python benchmarks/bench_connections.py [--requests 300]
+
+Four runs against a local HTTPS server:
+
+- keep-alive: the server keeps connections open, so the pool reuses one.
+- close, resumed: the server answers with ``Connection: close``, so every
+  request opens a connection, but the pool offers the host's last TLS
+  session and the handshake is resumed.
+- close, full handshake: as above, with the pool (and its TLS sessions)
+  dropped before each request.
+- close, new SSL context: as above, and the SSL context is rebuilt for
+  every request too (the CA store is reloaded), which is what each request
+  cost before contexts were cached.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_server import serve  # noqa: E402
+
+from pymlokit.utils import http  # noqa: E402
+
+
+def run(requests: int, close: bool, fresh: bool, new_context: bool) -> tuple[float, int, int]:
+    base, stats, server = serve(close=close, tls=True)
+    try:
+        http.get_json(f"{base}/warmup")
+        stats.connections = stats.resumed = 0
+        start = time.perf_counter()
+        for i in range(requests):
+            if fresh:
+                http.close_connections()
+            if new_context:
+                http._ssl_context.cache_clear()
+            status, _ = http.get_json(f"{base}/items/{i}")
+            assert status == 200, status
+        elapsed = time.perf_counter() - start
+    finally:
+        http.close_connections()
+        server.shutdown()
+    return elapsed / requests * 1000, stats.connections, stats.resumed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{args.requests} sequential GETs over HTTPS")
+    for label, close, fresh, new_context in (
+        ("keep-alive", False, False, False),
+        ("close, resumed", True, False, False),
+        ("close, full handshake", True, True, False),
+        ("close, new SSL context", True, True, True),
+    ):
+        ms, connections, resumed = run(args.requests, close, fresh, new_context)
+        print(f"  {label:<23} {ms:6.2f} ms/request  {connections:4d} new connections, {resumed:4d} resumed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Memory and parse time of listing records: NamedTuple (AzureModel) against the equivalent dict.
+
+    python benchmarks/bench_records.py [--pages 1000] [--per-page 1000]
+
+Synthetic AzureML model pages are decoded from JSON text one at a time, so
+every string is its own object as with real responses, and parsed either by
+azureml_api._model_page or by a dict-literal parser with the same fields and
+coercions. The retained size of the whole result list is measured with
+tracemalloc; parse time is measured in a separate run without it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymlokit.platforms import azureml_api  # noqa: E402
+
+
+def page_text(page: int, per_page: int) -> str:
+    prefix = "/subscriptions/0000/resourceGroups/rg/providers/Microsoft.MachineLearningServices/workspaces/ws/models"
+    return json.dumps(
+        {
+            "value": [
+                {
+                    "id": f"{prefix}/model-{page * per_page + i}:1",
+                    "name": f"model-{page * per_page + i}",
+                    "modelType": "custom",
+                    "createdTime": "2024-01-01T00:00:00.000Z",
+                    "modifiedTime": "2024-01-02T00:00:00.000Z",
+                    "url": f"aml://asset/{page * per_page + i:032x}/model",
+                }
+                for i in range(per_page)
+            ]
+        }
+    )
+
+
+def dict_page(payload: Any) -> list[dict[str, str]]:
+    out = []
+    for m in payload.get("value") or []:
+        mid = str(m.get("id", "") or "")
+        if mid:
+            out.append(
+                {
+                    "id": mid,
+                    "name": str(m.get("name", "") or ""),
+                    "model_type": str(m.get("modelType", "") or ""),
+                    "created_time": str(m.get("createdTime", "") or ""),
+                    "modified_time": str(m.get("modifiedTime", "") or ""),
+                    "asset_id": azureml_api._asset_id(str(m.get("url", "") or "")),
+                    "provisioning_state": "",
+                }
+            )
+    return out
+
+
+PARSERS: dict[str, Callable[[Any], list]] = {"dict": dict_page, "AzureModel": azureml_api._model_page}
+
+
+def build(parse: Callable[[Any], list], pages: int, per_page: int) -> tuple[list, float]:
+    out: list = []
+    elapsed = 0.0
+    for p in range(pages):
+        payload = json.loads(page_text(p, per_page))
+        start = time.perf_counter()
+        out.extend(parse(payload))
+        elapsed += time.perf_counter() - start
+    return out, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--per-page", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{args.pages * args.per_page} records ({args.pages} pages of {args.per_page})")
+    for label, parse in PARSERS.items():
+        gc.collect()
+        tracemalloc.start()
+        records, _ = build(parse, args.pages, args.per_page)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        container = sum(sys.getsizeof(r) for r in records) / len(records)
+        del records
+        gc.collect()
+        _, parse_s = build(parse, args.pages, args.per_page)
+        print(
+            f"  {label:<10} retained {retained / 2**20:6.0f} MiB  {container:4.0f} B/record container"
+            f"  parse {parse_s / (args.pages * args.per_page) * 1e6:5.2f} us/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Local HTTP(S) server for the benchmarks: answers every GET with a small JSON page.
+
+``latency_s`` delays each response to stand in for a remote API, ``close``
+sends ``Connection: close`` so every request needs a new connection, and
+``tls`` serves HTTPS with a throwaway self-signed certificate (made with the
+``openssl`` command). ``stats`` counts connections and resumed TLS handshakes.
+"""
+
+from __future__ import annotations
+
+import http.server
+import json
+import os
+import socketserver
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class Stats:
+    connections: int = 0
+    resumed: int = 0
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.stats.connections += 1
+            if isinstance(self.connection, ssl.SSLSocket) and self.connection.session_reused:
+                self.server.stats.resumed += 1
+
+    def do_GET(self) -> None:
+        if self.server.latency_s:
+            time.sleep(self.server.latency_s)
+        body = json.dumps({"path": self.path, "value": [{"id": i, "name": f"item-{i}"} for i in range(20)]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.server.close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, latency_s: float, close: bool) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency_s = latency_s
+        self.close = close
+        self.lock = threading.Lock()
+        self.stats = Stats()
+
+
+def _self_signed(directory: str) -> tuple[str, str]:
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+         "-keyout", key, "-out", cert],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def serve(latency_s: float = 0.0, close: bool = False, tls: bool = False) -> tuple[str, Stats, _Server]:
+    """Start a server on a free port in a daemon thread; returns its base URL, its stats and the server."""
+    server = _Server(latency_s, close)
+    scheme = "http"
+    if tls:
+        with tempfile.TemporaryDirectory() as tmp:
+            ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ctx.load_cert_chain(*_self_signed(tmp))
+        server.socket = ctx.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"{scheme}://127.0.0.1:{server.server_port}", server.stats, server
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import io
+import json
+import shlex
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from pymlokit import registry
+from pymlokit.cli import (
+    get_opt,
+    parse_cache_max_age,
+    parse_output_format,
+    resolve,
+    run_entry,
+    start_diagnostics,
+    stop_diagnostics,
+)
+from pymlokit.utils import http_cache
+from pymlokit.utils.arg_utils import parse_arguments
+from pymlokit.utils.iterators import ContextThreadPool
+from pymlokit.utils.table import format_table
+
+# Process-wide settings: they can only be given once, on the /batch command line.
+BATCH_OPTIONS = ("timing", "timing-log", "token-cache", "inventory", "output", "cache-max-age")
+
+
+# The running batch job's output buffer and whether to echo it; a context variable rather than a
+# thread-local so the pool threads a job fans out to (ContextThreadPool) print into the same buffer.
+_capture: ContextVar[tuple[io.StringIO, bool] | None] = ContextVar("pymlokit_batch_capture", default=None)
+
+
+class _JobOutput(io.TextIOBase):
+    """Stands in for sys.stdout during a batch so each job's prints, from any of its threads, land in its own buffer."""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def capture(self, buf: io.StringIO, echo: bool) -> None:
+        _capture.set((buf, echo))
+
+    def release(self) -> None:
+        _capture.set(None)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        capture = _capture.get()
+        if capture is None:
+            return self._stream.write(s)
+        buf, echo = capture
+        if echo:
+            self._stream.write(s)
+        return buf.write(s)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+@dataclass
+class JobResult:
+    index: int
+    module: str
+    platform: str
+    ok: bool
+    seconds: float
+    detail: str
+    output: str
+
+
+def load_batch(path: str) -> list[list[str]]:
+    """Read batch jobs from ``path``.
+
+    A file starting with ``[`` is JSON: a list whose items are either argv lists
+    (``["check", "/platform:bigml", ...]``) or objects such as
+    ``{"module": "check", "platform": "bigml", "credential": "..."}``. Anything
+    else has one invocation per line, quoted as in a shell; blank lines and
+    lines starting with ``#`` are skipped.
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        jobs = []
+        for item in json.loads(text):
+            if isinstance(item, list):
+                jobs.append([str(a) for a in item])
+            elif isinstance(item, dict):
+                rest = [f"/{k}:{v}" if v != "" else f"/{k}" for k, v in item.items() if k != "module"]
+                jobs.append([str(item.get("module", "")), *rest])
+            else:
+                raise ValueError(f"batch entries must be lists or objects, got {type(item).__name__}")
+        return jobs
+    return [shlex.split(line) for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _misplaced_options(module: str, options: dict[str, str]) -> list[str]:
+    # query-inventory's /inventory is the file it reads, not the one to record into.
+    local = module in registry.LOCAL_MODULES
+    return [f"/{k}" for k in BATCH_OPTIONS if k in options and not (local and k == "inventory")]
+
+
+def _run_job(index: int, module: str, options: dict[str, str], out: _JobOutput, echo: bool) -> JobResult:
+    buf = io.StringIO()
+    out.capture(buf, echo)
+    # Like a single run, only listings use the response cache; polls and downloads always go to the server.
+    http_cache.set_active(module.startswith("list-") and "no-cache" not in options)
+    start = time.perf_counter()
+    ok = True
+    detail = ""
+    try:
+        entry = resolve(module, options)
+        if entry is None:
+            ok = False
+        else:
+            run_entry(entry, options)
+    except Exception as ex:
+        ok = False
+        detail = str(ex)
+        print("")
+        print(f"[-] ERROR : {ex}")
+    finally:
+        out.release()
+    output = buf.getvalue()
+    if not detail:
+        # Modules report failures as "[-] ERROR" lines rather than exceptions.
+        for line in output.splitlines():
+            if line.startswith("[-] ERROR"):
+                ok = False
+                detail = line.split(":", 1)[-1].strip()
+                break
+    return JobResult(
+        index=index,
+        module=module,
+        platform=get_opt(options, "platform").lower(),
+        ok=ok,
+        seconds=time.perf_counter() - start,
+        detail=detail,
+        output=output,
+    )
+
+
+def run_batch(options: dict[str, str]) -> None:
+    """Run every job in /batch:<file> in this process, sharing connection pools, tokens and sessions."""
+    try:
+        jobs = load_batch(options["batch"])
+    except (OSError, ValueError) as ex:
+        print("")
+        print(f"[-] ERROR: Could not read batch file: {ex}")
+        return
+    parsed = [(argv[0].lower() if argv else "", parse_arguments(argv[1:])) for argv in jobs]
+    for i, (module, job_options) in enumerate(parsed, 1):
+        misplaced = _misplaced_options(module, job_options)
+        if misplaced:
+            print("")
+            print(f"[-] ERROR: Batch job {i} sets {', '.join(misplaced)}; these apply to the whole batch, so give them")
+            print("           after /batch:<file> instead.")
+            return
+    try:
+        parallel = int(get_opt(options, "parallel") or 1)
+    except ValueError:
+        parallel = 0
+    if parallel < 1:
+        print("")
+        print("[-] ERROR: /parallel must be a positive number of jobs.")
+        return
+    cache_max_age_s = parse_cache_max_age(options)
+    if cache_max_age_s is None:
+        return
+    output_format = parse_output_format(options)
+    if output_format is None:
+        return
+
+    # One cache for the whole batch, switched on per job by _run_job; entries are scoped by each
+    # request's own Authorization/Cookie headers since the jobs may use different credentials.
+    lists = any(module.startswith("list-") for module, _ in parsed)
+    start_diagnostics(options, "" if lists else None, cache_max_age_s, output_format)
+    real_stdout = sys.stdout
+    out = _JobOutput(real_stdout)
+    results: list[JobResult] = []
+    start = time.perf_counter()
+    sys.stdout = out
+    try:
+        # Each job runs in its own copy of this context, so its capture and cache switch stay its own.
+        with ContextThreadPool(max_workers=parallel) as pool:
+            futures = [
+                pool.submit(_run_job, i, module, job_options, out, parallel == 1)
+                for i, (module, job_options) in enumerate(parsed, 1)
+            ]
+            for future in futures:
+                result = future.result()
+                if parallel > 1:
+                    real_stdout.write(f"\n[*] INFO: Batch job {result.index}/{len(jobs)}\n{result.output}")
+                results.append(result)
+    finally:
+        sys.stdout = real_stdout
+        elapsed = time.perf_counter() - start
+        print("")
+        print(f"[*] INFO: Batch summary ({len(jobs)} jobs, {parallel} at a time)")
+        print("")
+        # Always a text table: with /output:ndjson|csv stdout carries only the jobs' records.
+        print(
+            format_table(
+                ["#", "Module", "Platform", "Result", "Seconds", "Detail"],
+                [[r.index, r.module, r.platform, "OK" if r.ok else "FAILED", f"{r.seconds:.2f}", r.detail] for r in results],
+            )
+        )
+        print("")
+        failed = sum(1 for r in results if not r.ok)
+        print(
+            f"[*] INFO: {len(results) - failed} succeeded, {failed} failed in {elapsed:.2f}s "
+            f"(jobs took {sum(r.seconds for r in results):.2f}s in total)"
+        )
+        print("")
+        stop_diagnostics()
@@ -1,353 +1,122 @@
 from __future__ import annotations
 
+import os
 import sys
+
+from pymlokit import registry
 from pymlokit.utils.arg_utils import APPROVED_MODULES, help_me, parse_arguments
 
 
-def _get_opt(options: dict[str, str], key: str) -> str:
+def get_opt(options: dict[str, str], key: str) -> str:
     return options.get(key, "")
 
 
-def _dispatch(
-    module: str,
-    platform: str,
-    credential: str,
-    options: dict[str, str],
+def resolve(module: str, options: dict[str, str]) -> registry.ModuleEntry | None:
+    """Validate one invocation and return its registry entry, printing why when it is unusable."""
+    if module not in APPROVED_MODULES:
+        print("")
+        print("[-] ERROR: Invalid module given. Use pymlokit --help to see approved modules.")
+        return None
+    if module in registry.LOCAL_MODULES:
+        return registry.LOCAL_MODULES[module]
+
+    if "platform" not in options:
+        print("")
+        print("[-] ERROR: Must supply a platform. Use pymlokit --help for syntax.")
+        return None
+    if "credential" not in options:
+        print("")
+        print("[-] ERROR: Must supply both a module and credential. Use pymlokit --help for syntax.")
+        return None
+
+    platform = options["platform"].lower()
+    entry = registry.lookup(platform, module)
+    if entry is None:
+        print("")
+        print(f"[-] ERROR: That module is not supported for {platform}. Please see README")
+        print("")
+        return None
+    missing = registry.missing_options(entry, options)
+    if missing:
+        print("")
+        print("[-] ERROR: Missing one of required command arguments: " + " ".join(f"/{name}:..." for name in missing))
+        print("")
+        return None
+    return entry
+
+
+def run_entry(entry: registry.ModuleEntry, options: dict[str, str]) -> None:
+    run = entry.load()
+    credential, platform = get_opt(options, "credential"), get_opt(options, "platform").lower()
+    run(credential, platform, *(get_opt(options, name) for name in entry.options))
+
+
+def start_diagnostics(
+    options: dict[str, str], cache_credential: str | None, cache_max_age_s: float, output_format: str = "table"
 ) -> None:
-    platform_l = platform.lower()
-    module_l = module.lower()
-
-    if platform_l == "azureml":
-        if module_l == "check":
-            from pymlokit.modules.azureml.check import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.azureml.list_projects import run
-
-            run(credential, platform_l, _get_opt(options, "subscription-id"))
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.azureml.list_models import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "subscription-id"),
-                _get_opt(options, "region"),
-                _get_opt(options, "resource-group"),
-                _get_opt(options, "workspace"),
-            )
-            return
-        if module_l == "list-datasets":
-            from pymlokit.modules.azureml.list_datasets import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "subscription-id"),
-                _get_opt(options, "region"),
-                _get_opt(options, "resource-group"),
-                _get_opt(options, "workspace"),
-            )
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.azureml.download_model import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "subscription-id"),
-                _get_opt(options, "region"),
-                _get_opt(options, "resource-group"),
-                _get_opt(options, "workspace"),
-                _get_opt(options, "model-id"),
-            )
-            return
-        if module_l == "download-dataset":
-            from pymlokit.modules.azureml.download_dataset import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "subscription-id"),
-                _get_opt(options, "region"),
-                _get_opt(options, "resource-group"),
-                _get_opt(options, "workspace"),
-                _get_opt(options, "dataset-id"),
-            )
-            return
-        if module_l == "poison-model":
-            from pymlokit.modules.azureml.poison_model import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "subscription-id"),
-                _get_opt(options, "region"),
-                _get_opt(options, "resource-group"),
-                _get_opt(options, "workspace"),
-                _get_opt(options, "model-id"),
-                _get_opt(options, "source-dir"),
-            )
-            return
-
-    if platform_l == "bigml":
-        if module_l == "check":
-            from pymlokit.modules.bigml.check import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.bigml.list_projects import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.bigml.list_models import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-datasets":
-            from pymlokit.modules.bigml.list_datasets import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.bigml.download_model import run
-
-            run(credential, platform_l, _get_opt(options, "model-id"))
-            return
-        if module_l == "download-dataset":
-            from pymlokit.modules.bigml.download_dataset import run
-
-            run(credential, platform_l, _get_opt(options, "dataset-id"))
-            return
-
-    if platform_l == "vertexai":
-        if module_l == "check":
-            from pymlokit.modules.vertexai.check import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.vertexai.list_projects import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.vertexai.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "project"))
-            return
-        if module_l == "list-datasets":
-            from pymlokit.modules.vertexai.list_datasets import run
-
-            run(credential, platform_l, _get_opt(options, "project"))
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.vertexai.download_model import run
-
-            run(credential, platform_l, _get_opt(options, "project"), _get_opt(options, "model-id"))
-            return
-        if module_l == "download-dataset":
-            from pymlokit.modules.vertexai.download_dataset import run
-
-            run(credential, platform_l, _get_opt(options, "project"), _get_opt(options, "dataset-id"))
-            return
-
-    if platform_l == "mlflow":
-        if module_l == "check":
-            from pymlokit.modules.mlflow.check import run
-
-            run(credential, platform_l, _get_opt(options, "url"))
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.mlflow.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "url"))
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.mlflow.download_model import run
-
-            run(credential, platform_l, _get_opt(options, "url"), _get_opt(options, "model-id"))
-            return
-
-    if platform_l == "sagemaker":
-        if module_l == "check":
-            from pymlokit.modules.sagemaker.check import run
-
-            run(credential, platform_l, _get_opt(options, "region"))
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.sagemaker.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "region"))
-            return
-        if module_l == "list-notebooks":
-            from pymlokit.modules.sagemaker.list_notebooks import run
-
-            run(credential, platform_l, _get_opt(options, "region"))
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.sagemaker.download_model import run
-
-            run(credential, platform_l, _get_opt(options, "region"), _get_opt(options, "model-id"))
-            return
-        if module_l == "poison-model":
-            from pymlokit.modules.sagemaker.poison_model import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "region"),
-                _get_opt(options, "model-id"),
-                _get_opt(options, "source-dir"),
-            )
-            return
-        if module_l == "add-notebook-trigger":
-            from pymlokit.modules.sagemaker.add_notebook_trigger import run
-
-            run(
-                credential,
-                platform_l,
-                _get_opt(options, "region"),
-                _get_opt(options, "notebook-name"),
-                _get_opt(options, "script"),
-            )
-            return
-
-    if platform_l == "palantir":
-        if module_l == "check":
-            from pymlokit.modules.palantir.check import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-datasets":
-            from pymlokit.modules.palantir.list_datasets import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "download-dataset":
-            from pymlokit.modules.palantir.download_dataset import run
-
-            run(credential, platform_l, _get_opt(options, "dataset-id"))
-            return
-        if module_l == "upload-dataset":
-            from pymlokit.modules.palantir.upload_dataset import run
-
-            run(credential, platform_l, _get_opt(options, "dataset-name"), _get_opt(options, "source-dir"))
-            return
-
-    if platform_l == "clearml":
-        if module_l == "check":
-            from pymlokit.modules.clearml.check import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.clearml.list_projects import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.clearml.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"), _get_opt(options, "project-id"))
-            return
-        if module_l == "list-datasets":
-            from pymlokit.modules.clearml.list_datasets import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"), _get_opt(options, "project-id"))
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.clearml.download_model import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"), _get_opt(options, "model-id"))
-            return
-
-    if platform_l == "wandb":
-        if module_l == "check":
-            from pymlokit.modules.wandb.check import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.wandb.list_projects import run
-
-            run(credential, platform_l)
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.wandb.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "project"))
-            return
-        if module_l == "list-datasets":
-            from pymlokit.modules.wandb.list_datasets import run
-
-            run(credential, platform_l, _get_opt(options, "project"))
-            return
-        if module_l == "download-model":
-            from pymlokit.modules.wandb.download_model import run
-
-            run(credential, platform_l, _get_opt(options, "project"), _get_opt(options, "model-id"))
-            return
-        if module_l == "download-dataset":
-            from pymlokit.modules.wandb.download_dataset import run
-
-            run(credential, platform_l, _get_opt(options, "project"), _get_opt(options, "dataset-id"))
-            return
-
-    if platform_l == "metaflow":
-        if module_l == "check":
-            from pymlokit.modules.metaflow.check import run
-
-            run(credential, platform_l, _get_opt(options, "service-url"))
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.metaflow.list_projects import run
-
-            run(credential, platform_l, _get_opt(options, "service-url"))
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.metaflow.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "service-url"), _get_opt(options, "project"))
-            return
-
-    if platform_l == "zenml":
-        if module_l == "check":
-            from pymlokit.modules.zenml.check import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.zenml.list_projects import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-
-    if platform_l == "kubeflow":
-        if module_l == "check":
-            from pymlokit.modules.kubeflow.check import run
+    """Turn on timing, the token file, the inventory, the response cache (unless ``cache_credential`` is None) and
+    the output format.
+
+    With a machine output format the records keep stdout to themselves and every
+    other message goes to stderr until stop_diagnostics.
+    """
+    from pymlokit.utils import http_cache, inventory, table, timing, token_cache
+
+    if output_format != "table":
+        table.set_output(output_format, sys.stdout)
+        sys.stdout = sys.stderr
+    if "timing" in options or "timing-log" in options:
+        timing.enable(get_opt(options, "timing-log"))
+    if "token-cache" in options:
+        token_cache.enable_file(
+            get_opt(options, "token-cache") or os.path.join(http_cache.root_directory(), "tokens.json")
+        )
+    if "inventory" in options:
+        import sqlite3
+
+        try:
+            inventory.enable(get_opt(options, "inventory"))
+        except (OSError, sqlite3.Error) as ex:
+            print(f"[*] INFO: Inventory disabled ({ex})")
+    if cache_credential is not None and "no-cache" not in options:
+        try:
+            http_cache.enable(cache_credential, max_age_s=cache_max_age_s)
+        except OSError as ex:
+            print(f"[*] INFO: Response cache disabled ({ex})")
+
+
+def stop_diagnostics() -> None:
+    from pymlokit.utils import http_cache, inventory, table, timing, token_cache
+
+    if timing.is_enabled():
+        timing.print_summary()
+        timing.disable()
+    http_cache.disable()
+    inventory.disable()
+    token_cache.disable_file()
+    stream = table.reset_output()
+    if stream is not None:
+        sys.stdout = stream
+
+
+def parse_output_format(options: dict[str, str]) -> str | None:
+    from pymlokit.utils.table import OUTPUT_FORMATS
+
+    fmt = get_opt(options, "output").lower() or "table"
+    if fmt not in OUTPUT_FORMATS:
+        print("")
+        print(f"[-] ERROR: /output must be one of: {', '.join(OUTPUT_FORMATS)}.")
+        return None
+    return fmt
 
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-        if module_l == "list-projects":
-            from pymlokit.modules.kubeflow.list_projects import run
 
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-        if module_l == "list-models":
-            from pymlokit.modules.kubeflow.list_models import run
-
-            run(credential, platform_l, _get_opt(options, "api-url"))
-            return
-
-    print("")
-    print(f"[-] ERROR: That module is not supported for {platform_l}. Please see README")
-    print("")
+def parse_cache_max_age(options: dict[str, str]) -> float | None:
+    try:
+        return float(get_opt(options, "cache-max-age") or 0)
+    except ValueError:
+        print("")
+        print("[-] ERROR: /cache-max-age must be a number of seconds.")
+        return None
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -360,6 +129,12 @@ def main(argv: list[str] | None = None) -> None:
         help_me()
         return
 
+    if argv[0][1:].lower().startswith("batch:") and argv[0][0] in ("/", "-"):
+        from pymlokit.batch import run_batch
+
+        run_batch(parse_arguments(argv))
+        return
+
     module = argv[0].lower()
     options = parse_arguments(argv[1:])
 
@@ -367,22 +142,28 @@ def main(argv: list[str] | None = None) -> None:
         help_me()
         return
 
-    if module not in APPROVED_MODULES:
-        print("")
-        print("[-] ERROR: Invalid module given. Use pymlokit --help to see approved modules.")
+    entry = resolve(module, options)
+    if entry is None:
         return
 
-    if "platform" not in options:
-        print("")
-        print("[-] ERROR: Must supply a platform. Use pymlokit --help for syntax.")
+    cache_max_age_s = parse_cache_max_age(options)
+    if cache_max_age_s is None:
         return
-    if "credential" not in options:
-        print("")
-        print("[-] ERROR: Must supply both a module and credential. Use pymlokit --help for syntax.")
+    output_format = parse_output_format(options)
+    if output_format is None:
         return
 
+    diagnostics = options
+    if module in registry.LOCAL_MODULES:
+        # Their /inventory is the file to read; opening it for writing would create it.
+        diagnostics = {k: v for k, v in options.items() if k != "inventory"}
+    start_diagnostics(
+        diagnostics, options["credential"] if module.startswith("list-") else None, cache_max_age_s, output_format
+    )
     try:
-        _dispatch(module, options["platform"], options["credential"], options)
+        run_entry(entry, options)
     except Exception as ex:
         print("")
         print(f"[-] ERROR : {ex}")
+    finally:
+        stop_diagnostics()
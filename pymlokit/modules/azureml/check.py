@@ -1,5 +1,6 @@
-from pymlokit.platforms.azureml_api import creds_valid, list_subscriptions
+from pymlokit.platforms.azureml_api import list_subscriptions
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
  
  
@@ -12,7 +13,9 @@ def run(credential: str, platform: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         subs = list_subscriptions(credential)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -22,10 +25,9 @@ def run(credential: str, platform: str) -> None:
  
      print("[*] INFO: Listing subscriptions user has acess to")
      print("")
-     subs = list_subscriptions(credential)
      print_table(
          ["Name", "Subscription ID", "Status"],
-         [[s["display_name"], s["id"], s["state"]] for s in subs],
+         ([s.display_name, s.id, s.state] for s in subs),
      )
      print("")
  
@@ -1,7 +1,9 @@
 import os
  
-from pymlokit.platforms.azureml_api import creds_valid, download_blob, get_dataset, get_datastore
+from pymlokit.platforms.azureml_api import download_blob, get_dataset, get_datastore
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
  
  
@@ -28,7 +30,10 @@ def run(
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     dataset_id = inventory.resolve_id("azureml", f"{subscription_id}/{resource_group}/{workspace}", "dataset", dataset_id)
+     try:
+         dataset = get_dataset(credential, subscription_id, region, resource_group, workspace, dataset_id)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -39,11 +44,10 @@ def run(
      print(f"[*] INFO: Getting Azure file path for dataset with ID: {dataset_id}")
      print("")
  
-     dataset = get_dataset(credential, subscription_id, region, resource_group, workspace, dataset_id)
      if not dataset:
          return
  
-     azure_file_path = str(dataset.get("azure_file_path", "") or "")
+     azure_file_path = dataset.azure_file_path
      print(azure_file_path)
      print("")
  
@@ -64,21 +68,18 @@ def run(
      print(relative_path)
      print("")
      print("[*] INFO: Datastore Name: ")
-     print(str(dataset.get("datastore_name", "") or ""))
+     print(dataset.datastore_name)
      print("")
  
-     datastore = get_datastore(credential, subscription_id, region, resource_group, workspace, str(dataset.get("datastore_name", "") or ""))
+     datastore = get_datastore(credential, subscription_id, region, resource_group, workspace, dataset.datastore_name)
      if not datastore:
          return
  
-     content = download_blob(datastore["account_name"], datastore["credential"], storage_container, relative_path)
-     if not content:
-         return
- 
      file_out = f"MLOKit-{generate_random_name()}"
      out_path = os.path.join(os.getcwd(), file_out)
-     with open(out_path, "wb") as f:
-         f.write(content)
+     if not download_blob(datastore.account_name, datastore.credential, storage_container, relative_path, out_path):
+         os.remove(out_path)
+         return
  
      print("")
      print(f"[+] SUCCESS: Dataset written to: {out_path}")
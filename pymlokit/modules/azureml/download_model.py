@@ -1,17 +1,20 @@
 import os
+from functools import partial
 from pathlib import Path
 from urllib.parse import urlparse
  
 from pymlokit.platforms.azureml_api import (
-     creds_valid,
-     download_url_bytes,
+     download_url_to_file,
      get_asset_prefixes,
      get_content_uris,
      get_model,
  )
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
 from pymlokit.utils.table import print_table
+from pymlokit.utils.transfer import TransferJob, download_many
  
  
 def _file_name_from_url(url: str) -> str:
@@ -43,7 +46,10 @@ def run(
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     model_id = inventory.resolve_id("azureml", f"{subscription_id}/{resource_group}/{workspace}", "model", model_id)
+     try:
+         model = get_model(credential, subscription_id, region, resource_group, workspace, model_id)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -51,17 +57,16 @@ def run(
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     model = get_model(credential, subscription_id, region, resource_group, workspace, model_id)
      if not model:
          return
  
      print_table(
          ["Name", "Model ID", "Model Type", "Creation Time", "Update Time"],
-         [[model["name"], model_id, model["model_type"], model["created_time"], model["modified_time"]]],
+         [[model.name, model_id, model.model_type, model.created_time, model.modified_time]],
      )
      print("")
  
-     asset_id = str(model.get("asset_id", "") or "")
+     asset_id = model.asset_id
      prefixes = get_asset_prefixes(credential, subscription_id, region, resource_group, workspace, asset_id) if asset_id else []
      content_uris: list[str] = []
      for p in prefixes:
@@ -70,10 +75,11 @@ def run(
      out_dir = Path(os.getcwd()) / f"MLOKit-{generate_random_name()}"
      out_dir.mkdir(parents=True, exist_ok=True)
  
-     for u in content_uris:
-         file_name = _file_name_from_url(u)
-         data = download_url_bytes(u)
-         (out_dir / file_name).write_bytes(data)
+     jobs = [TransferJob(u, str(out_dir / _file_name_from_url(u)), partial(download_url_to_file, u)) for u in content_uris]
+     for r in download_many(jobs):
+         if r.error:
+             print(f"[-] ERROR: Failed to download {os.path.basename(r.job.destination)}: {r.error}")
+             print("")
  
      print(f"[+] SUCCESS: Model written to: {out_dir}")
      print("")
@@ -1,5 +1,8 @@
-from pymlokit.platforms.azureml_api import creds_valid, list_datasets
+from pymlokit.platforms.azureml_api import iter_datasets
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
  
  
@@ -18,7 +21,9 @@ def run(credential: str, platform: str, subscription_id: str, region: str, resou
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         datasets = started(iter_datasets(credential, subscription_id, region, resource_group, workspace))
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -26,10 +31,10 @@ def run(credential: str, platform: str, subscription_id: str, region: str, resou
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     datasets = list_datasets(credential, subscription_id, region, resource_group, workspace)
+     datasets = inventory.track(datasets, "azureml", f"{subscription_id}/{resource_group}/{workspace}", "dataset")
      print_table(
          ["File Name", "ID", "State", "File Type", "Datastore Name"],
-         [[d["file_name"], d["id"], d["state"], d["data_type"], d["datastore_name"]] for d in datasets],
+         ([d.file_name, d.id, d.state, d.data_type, d.datastore_name] for d in datasets),
      )
      print("")
  
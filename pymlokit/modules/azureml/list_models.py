@@ -1,5 +1,8 @@
-from pymlokit.platforms.azureml_api import creds_valid, list_models
+from pymlokit.platforms.azureml_api import iter_models
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
  
  
@@ -18,7 +21,9 @@ def run(credential: str, platform: str, subscription_id: str, region: str, resou
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         models = started(iter_models(credential, subscription_id, region, resource_group, workspace))
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -26,10 +31,10 @@ def run(credential: str, platform: str, subscription_id: str, region: str, resou
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     models = list_models(credential, subscription_id, region, resource_group, workspace)
+     models = inventory.track(models, "azureml", f"{subscription_id}/{resource_group}/{workspace}", "model", modified="modified_time")
      print_table(
          ["Name", "ID", "Model Type", "Creation Time", "Update Time"],
-         [[m["name"], m["id"], m["model_type"], m["created_time"], m["modified_time"]] for m in models],
+         ([m.name, m.id, m.model_type, m.created_time, m.modified_time] for m in models),
      )
      print("")
  
@@ -1,5 +1,7 @@
-from pymlokit.platforms.azureml_api import creds_valid, list_workspaces
+from pymlokit.platforms.azureml_api import list_workspaces
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
  
  
@@ -18,7 +20,9 @@ def run(credential: str, platform: str, subscription_id: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         workspaces = list_workspaces(credential, subscription_id)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -26,10 +30,12 @@ def run(credential: str, platform: str, subscription_id: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     workspaces = list_workspaces(credential, subscription_id)
+     workspaces = inventory.track(
+         workspaces, "azureml", subscription_id, "workspace", id="workspace_id", modified="creation_time"
+     )
      print_table(
          ["Name", "Workspace ID", "Region", "Resource Group", "Creation Time"],
-         [[w["name"], w["workspace_id"], w["region"], w["resource_group"], w["creation_time"]] for w in workspaces],
+         ([w.name, w.workspace_id, w.region, w.resource_group, w.creation_time] for w in workspaces),
      )
      print("")
  
@@ -1,7 +1,6 @@
 import os
  
 from pymlokit.platforms.azureml_api import (
-     creds_valid,
      get_asset_prefixes,
      get_content_uris,
      get_datastore,
@@ -10,6 +9,7 @@ from pymlokit.platforms.azureml_api import (
      upload_blob,
  )
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
  
  
@@ -64,7 +64,9 @@ def run(
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         model = get_model(credential, subscription_id, region, resource_group, workspace, model_id)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -72,16 +74,15 @@ def run(
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     model = get_model(credential, subscription_id, region, resource_group, workspace, model_id)
      if not model:
          return
  
      print_table(
          ["Name", "ID", "Model Type", "Creation Time", "Update Time"],
-         [[model["name"], model_id, model["model_type"], model["created_time"], model["modified_time"]]],
+         [[model.name, model_id, model.model_type, model.created_time, model.modified_time]],
      )
  
-     asset_id = str(model.get("asset_id", "") or "")
+     asset_id = model.asset_id
      prefixes = get_asset_prefixes(credential, subscription_id, region, resource_group, workspace, asset_id) if asset_id else []
  
      final_datastore_name = ""
@@ -115,14 +116,14 @@ def run(
          matches = [
              ds
              for ds in datastores
-             if str(ds.get("account_name", "")).lower() == account_name.lower()
-             and str(ds.get("container_name", "")).lower() == container_name.lower()
-             and str(ds.get("datastore_type", "")).lower() == datastore_type.lower()
+             if ds.account_name.lower() == account_name.lower()
+             and ds.container_name.lower() == container_name.lower()
+             and ds.datastore_type.lower() == datastore_type.lower()
          ]
  
          for ds in matches:
-             final_datastore_name = str(ds.get("name", "") or "")
-             storage_container = str(ds.get("container_name", "") or "")
+             final_datastore_name = ds.name
+             storage_container = ds.container_name
  
      print("")
      print("[*] INFO: Uploading model artifacts")
@@ -143,8 +144,8 @@ def run(
          print("")
          content = open(file_path, "rb").read()
          upload_blob(
-             datastore["account_name"],
-             datastore["credential"],
+             datastore.account_name,
+             datastore.credential,
              storage_container,
              f"{relative_path}{just_file_name}",
              content,
@@ -1,7 +1,9 @@
 import os
  
-from pymlokit.platforms.bigml_api import creds_valid, download_dataset_bytes
+from pymlokit.platforms.bigml_api import BigMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
  
  
@@ -20,7 +22,12 @@ def run(credential: str, platform: str, dataset_id: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     client = BigMLClient(credential)
+     dataset_id = inventory.resolve_id("bigml", client.creds.username, "dataset", dataset_id)
+     file_name = f"MLOKit-{generate_random_name()}"
+     try:
+         written = client.download_dataset_file(dataset_id, file_name)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -31,14 +38,10 @@ def run(credential: str, platform: str, dataset_id: str) -> None:
      print(f"[*] INFO: Downloading dataset with ID {dataset_id} to the current working directory of {os.getcwd()}")
      print("")
  
-     content = download_dataset_bytes(credential, dataset_id)
-     if not content:
+     if not written:
+         os.remove(file_name)
          return
  
-     file_name = f"MLOKit-{generate_random_name()}"
-     with open(file_name, "wb") as f:
-         f.write(content)
- 
      print(f"[+] SUCCESS: Dataset written to: {os.path.join(os.getcwd(), file_name)}")
      print("")
  
@@ -1,7 +1,9 @@
 import os
  
-from pymlokit.platforms.bigml_api import creds_valid, download_model_pmml
+from pymlokit.platforms.bigml_api import BigMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
  
  
@@ -20,7 +22,11 @@ def run(credential: str, platform: str, model_id: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     client = BigMLClient(credential)
+     model_id = inventory.resolve_id("bigml", client.creds.username, "model", model_id)
+     try:
+         content = client.download_model_pmml(model_id)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -31,7 +37,6 @@ def run(credential: str, platform: str, model_id: str) -> None:
      print(f"[*] INFO: Downloading model in PMML format with ID {model_id} to the current working directory of {os.getcwd()}")
      print("")
  
-     content = download_model_pmml(credential, model_id)
      if not content:
          return
  
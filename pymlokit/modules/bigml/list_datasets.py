@@ -1,5 +1,8 @@
-from pymlokit.platforms.bigml_api import creds_valid, list_datasets
+from pymlokit.platforms.bigml_api import BigMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
  
  
@@ -12,7 +15,10 @@ def run(credential: str, platform: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     client = BigMLClient(credential)
+     try:
+         datasets = started(client.iter_datasets())
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -20,10 +26,10 @@ def run(credential: str, platform: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     datasets = list_datasets(credential)
+     datasets = inventory.track(datasets, "bigml", client.creds.username, "dataset", modified="updated")
      print_table(
          ["Name", "Visibility", "Creation Date", "Dataset ID"],
-         [[d["name"], d["visibility"], d["created"], d["id"]] for d in datasets],
+         ([d.name, d.visibility, d.created, d.id] for d in datasets),
      )
      print("")
  
@@ -1,5 +1,8 @@
-from pymlokit.platforms.bigml_api import creds_valid, list_models
+from pymlokit.platforms.bigml_api import BigMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
  
  
@@ -12,7 +15,10 @@ def run(credential: str, platform: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     client = BigMLClient(credential)
+     try:
+         models = started(client.iter_models())
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -20,10 +26,10 @@ def run(credential: str, platform: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     models = list_models(credential)
+     models = inventory.track(models, "bigml", client.creds.username, "model", modified="updated")
      print_table(
          ["Name", "Visibility", "Created By", "Creation Date", "Model ID"],
-         [[m["name"], m["visibility"], m["creator"], m["created"], m["id"]] for m in models],
+         ([m.name, m.visibility, m.creator, m.created, m.id] for m in models),
      )
      print("")
  
@@ -1,5 +1,8 @@
-from pymlokit.platforms.bigml_api import creds_valid, list_projects
+from pymlokit.platforms.bigml_api import BigMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
  
  
@@ -12,7 +15,10 @@ def run(credential: str, platform: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     client = BigMLClient(credential)
+     try:
+         projects = started(client.iter_projects())
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -20,10 +26,10 @@ def run(credential: str, platform: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     projects = list_projects(credential)
+     projects = inventory.track(projects, "bigml", client.creds.username, "project")
      print_table(
          ["Name", "Visibility", "Created By", "Creation Date", "Project ID"],
-         [[p["name"], p["visibility"], p["creator"], p["created"], p["id"]] for p in projects],
+         ([p.name, p.visibility, p.creator, p.created, p.id] for p in projects),
      )
      print("")
  
@@ -1,4 +1,4 @@
-from pymlokit.platforms.clearml_api import creds_valid
+from pymlokit.platforms.clearml_api import ClearMLClient
 from pymlokit.utils.arg_utils import generate_header
 
 
@@ -17,7 +17,8 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print("[*] INFO: Checking credentials provided")
     print("")
 
-    if not creds_valid(credential, api_url):
+    client = ClearMLClient(credential, api_url)
+    if not client.creds_valid():
         print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
         print("")
         return
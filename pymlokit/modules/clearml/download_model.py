@@ -1,6 +1,7 @@
 import os
 
-from pymlokit.platforms.clearml_api import creds_valid, download_url_bytes, get_model_url
+from pymlokit.platforms.clearml_api import ClearMLClient, download_url_to_file
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
 
 
@@ -19,7 +20,9 @@ def run(credential: str, platform: str, api_url: str, model_id: str) -> None:
     print("[*] INFO: Checking credentials provided")
     print("")
 
-    if not creds_valid(credential, api_url):
+    client = ClearMLClient(credential, api_url)
+    model_id = inventory.resolve_id("clearml", api_url, "model", model_id)
+    if not client.creds_valid():
         print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
         print("")
         return
@@ -28,7 +31,7 @@ def run(credential: str, platform: str, api_url: str, model_id: str) -> None:
     print("")
 
     print(f"[*] INFO: Getting download URL for model {model_id}")
-    url = get_model_url(credential, api_url, model_id)
+    url = client.get_model_url(model_id)
     if not url:
         print(f"[-] ERROR: Could not find download URL for model {model_id} (or model does not exist)")
         print("")
@@ -36,22 +39,19 @@ def run(credential: str, platform: str, api_url: str, model_id: str) -> None:
 
     print(f"[*] INFO: Found URL: {url}")
     
+    # Determine filename
+    filename = url.split("?")[0].split("/")[-1] or f"{model_id}.model"
+    out_path = os.path.join(os.getcwd(), filename)
+
     # Try to download
+    print(f"[*] INFO: Downloading to {out_path}")
     try:
-        content = download_url_bytes(url)
+        download_url_to_file(url, out_path)
     except Exception as e:
         print(f"[-] ERROR: Failed to download from URL: {e}")
         print("    (Note: ClearML may store models on S3/GS/Azure/File. PyMLOKit currently supports direct HTTP download for ClearML models, or requires specific storage credentials for cloud buckets which are not passed here.)")
         print("")
         return
 
-    # Determine filename
-    filename = url.split("?")[0].split("/")[-1] or f"{model_id}.model"
-    out_path = os.path.join(os.getcwd(), filename)
-
-    print(f"[*] INFO: Downloading to {out_path}")
-    with open(out_path, "wb") as f:
-        f.write(content)
-
     print(f"[+] SUCCESS: Downloaded model to {out_path}")
     print("")
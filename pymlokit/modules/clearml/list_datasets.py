@@ -1,5 +1,7 @@
-from pymlokit.platforms.clearml_api import creds_valid, list_datasets
+from pymlokit.platforms.clearml_api import ClearMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
 
 
@@ -18,7 +20,8 @@ def run(credential: str, platform: str, api_url: str, project_id: str = "") -> N
     print("[*] INFO: Checking credentials provided")
     print("")
 
-    if not creds_valid(credential, api_url):
+    client = ClearMLClient(credential, api_url)
+    if not client.creds_valid():
         print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
         print("")
         return
@@ -32,23 +35,11 @@ def run(credential: str, platform: str, api_url: str, project_id: str = "") -> N
         print(f"[*] INFO: Listing all datasets (data_processing tasks)")
     print("")
 
-    datasets = list_datasets(credential, api_url, project_id)
-    if not datasets:
-        print("[-] INFO: No datasets found.")
-        print("")
-        return
+    datasets = started(client.iter_datasets(project_id))
+    datasets = inventory.track(datasets, "clearml", api_url, "dataset", modified="created")
 
-    # We select relevant columns for display
-    display = []
-    for d in datasets:
-        display.append({
-            "Name": d.get("name", ""),
-            "ID": d.get("id", ""),
-            "Project": d.get("project", ""),
-            "Type": d.get("type", ""),
-            "Status": d.get("status", ""),
-            "Created": d.get("created", ""),
-        })
-
-    print_table(display)
+    print_table(
+        ["Name", "ID", "Project", "Type", "Status", "Created"],
+        ([d.name, d.id, d.project, d.type, d.status, d.created] for d in datasets),
+    )
     print("")
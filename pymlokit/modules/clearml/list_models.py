@@ -1,5 +1,7 @@
-from pymlokit.platforms.clearml_api import creds_valid, list_models
+from pymlokit.platforms.clearml_api import ClearMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
 
 
@@ -18,7 +20,8 @@ def run(credential: str, platform: str, api_url: str, project_id: str = "") -> N
     print("[*] INFO: Checking credentials provided")
     print("")
 
-    if not creds_valid(credential, api_url):
+    client = ClearMLClient(credential, api_url)
+    if not client.creds_valid():
         print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
         print("")
         return
@@ -32,22 +35,11 @@ def run(credential: str, platform: str, api_url: str, project_id: str = "") -> N
         print(f"[*] INFO: Listing all models")
     print("")
 
-    models = list_models(credential, api_url, project_id)
-    if not models:
-        print("[-] INFO: No models found.")
-        print("")
-        return
+    models = started(client.iter_models(project_id))
+    models = inventory.track(models, "clearml", api_url, "model", modified="created")
 
-    # We select relevant columns for display
-    display = []
-    for m in models:
-        display.append({
-            "Name": m.get("name", ""),
-            "ID": m.get("id", ""),
-            "Project": m.get("project", ""),
-            "Framework": m.get("framework", ""),
-            "Created": m.get("created", ""),
-        })
-
-    print_table(display)
+    print_table(
+        ["Name", "ID", "Project", "Framework", "Created"],
+        ([m.name, m.id, m.project, m.framework, m.created] for m in models),
+    )
     print("")
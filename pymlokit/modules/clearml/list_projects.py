@@ -1,5 +1,7 @@
-from pymlokit.platforms.clearml_api import creds_valid, list_projects
+from pymlokit.platforms.clearml_api import ClearMLClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
 
 
@@ -18,7 +20,8 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print("[*] INFO: Checking credentials provided")
     print("")
 
-    if not creds_valid(credential, api_url):
+    client = ClearMLClient(credential, api_url)
+    if not client.creds_valid():
         print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
         print("")
         return
@@ -29,21 +32,11 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print(f"[*] INFO: Listing projects in {platform}")
     print("")
 
-    projects = list_projects(credential, api_url)
-    if not projects:
-        print("[-] INFO: No projects found.")
-        print("")
-        return
+    projects = started(client.iter_projects())
+    projects = inventory.track(projects, "clearml", api_url, "project", modified="last_update")
 
-    # We select relevant columns for display
-    display = []
-    for p in projects:
-        display.append({
-            "Name": p.get("name", ""),
-            "ID": p.get("id", ""),
-            "Created": p.get("created", ""),
-            "Last Update": p.get("last_update", ""),
-        })
-
-    print_table(display)
+    print_table(
+        ["Name", "ID", "Created", "Last Update"],
+        ([p.name, p.id, p.created, p.last_update] for p in projects),
+    )
     print("")
@@ -0,0 +1,74 @@
+import os
+import sqlite3
+from datetime import datetime
+
+from pymlokit.utils import inventory
+from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.table import print_table
+
+
+def run(
+    credential: str,
+    platform: str,
+    path: str,
+    kind: str,
+    name: str,
+    resource_id: str,
+    scope: str,
+    since: str,
+    limit: str,
+) -> None:
+    print(generate_header("query-inventory", platform or "inventory"))
+
+    path = path or inventory.default_path()
+    if not os.path.isfile(path):
+        print("")
+        print(f"[-] ERROR: No inventory at {path}. Run list-* modules with /inventory first.")
+        print("")
+        return
+    try:
+        max_rows = int(limit or 0)
+    except ValueError:
+        print("")
+        print("[-] ERROR: /limit must be a number of rows.")
+        print("")
+        return
+
+    print("")
+    print(f"[*] INFO: Querying inventory {path}")
+    print("")
+
+    try:
+        records = inventory.query(
+            path,
+            platform=platform,
+            scope=scope,
+            kind=kind,
+            name=name,
+            resource_id=resource_id,
+            since=since,
+            limit=max_rows,
+        )
+    except sqlite3.Error as ex:
+        print(f"[-] ERROR: Could not read inventory: {ex}")
+        print("")
+        return
+
+    print_table(
+        ["Platform", "Scope", "Kind", "Name", "ID", "Modified", "Last Seen"],
+        (
+            [
+                r.platform,
+                r.scope,
+                r.kind,
+                r.name,
+                r.resource_id,
+                r.modified,
+                datetime.fromtimestamp(r.seen_at).isoformat(sep=" ", timespec="seconds"),
+            ]
+            for r in records
+        ),
+    )
+    print("")
+    print(f"[*] INFO: Found {len(records)} resource(s)")
+    print("")
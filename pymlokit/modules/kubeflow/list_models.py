@@ -1,5 +1,6 @@
-from pymlokit.platforms.kubeflow_api import creds_valid, list_runs
+from pymlokit.platforms.kubeflow_api import list_runs
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
 
 
@@ -18,10 +19,16 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print("[*] INFO: Checking credentials/connectivity")
     print("")
 
-    if not creds_valid(credential, api_url):
+    try:
+        runs = list_runs(credential, api_url)
+    except (InvalidCredentials, OSError):
         print("[-] ERROR: Credentials provided are INVALID or Server unreachable.")
         print("")
         return
+    except Exception as e:
+        print(f"[-] ERROR: Failed to list runs: {e}")
+        print("")
+        return
 
     print("[+] SUCCESS: Service is reachable.")
     print("")
@@ -29,25 +36,20 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print(f"[*] INFO: Listing runs")
     print("")
 
-    try:
-        runs = list_runs(credential, api_url)
-        if not runs:
-            print("[-] INFO: No runs found.")
-            print("")
-            return
-
-        display = []
-        for r in runs:
-            display.append({
-                "Run ID": r.get("id", ""),
-                "Name": r.get("name", ""),
-                "Created": r.get("created_at", ""),
-                "Status": r.get("status", ""),
-                "Pipeline ID": r.get("pipeline_spec", ""),
-            })
-
-        print_table(display)
-        print("")
-    except Exception as e:
-        print(f"[-] ERROR: Failed to list runs: {e}")
+    if not runs:
+        print("[-] INFO: No runs found.")
         print("")
+        return
+
+    display = []
+    for r in runs:
+        display.append({
+            "Run ID": r.get("id", ""),
+            "Name": r.get("name", ""),
+            "Created": r.get("created_at", ""),
+            "Status": r.get("status", ""),
+            "Pipeline ID": r.get("pipeline_spec", ""),
+        })
+
+    print_table(display)
+    print("")
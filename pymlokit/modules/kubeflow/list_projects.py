@@ -1,5 +1,6 @@
-from pymlokit.platforms.kubeflow_api import creds_valid, list_pipelines
+from pymlokit.platforms.kubeflow_api import list_pipelines
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
 
 
@@ -18,10 +19,16 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print("[*] INFO: Checking credentials/connectivity")
     print("")
 
-    if not creds_valid(credential, api_url):
+    try:
+        pipelines = list_pipelines(credential, api_url)
+    except (InvalidCredentials, OSError):
         print("[-] ERROR: Credentials provided are INVALID or Server unreachable.")
         print("")
         return
+    except Exception as e:
+        print(f"[-] ERROR: Failed to list pipelines: {e}")
+        print("")
+        return
 
     print("[+] SUCCESS: Service is reachable.")
     print("")
@@ -29,24 +36,19 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print(f"[*] INFO: Listing pipelines")
     print("")
 
-    try:
-        pipelines = list_pipelines(credential, api_url)
-        if not pipelines:
-            print("[-] INFO: No pipelines found.")
-            print("")
-            return
-
-        display = []
-        for p in pipelines:
-            display.append({
-                "Name": p.get("name", ""),
-                "ID": p.get("id", ""),
-                "Created": p.get("created_at", ""),
-                "Description": p.get("description", ""),
-            })
-
-        print_table(display)
-        print("")
-    except Exception as e:
-        print(f"[-] ERROR: Failed to list pipelines: {e}")
+    if not pipelines:
+        print("[-] INFO: No pipelines found.")
         print("")
+        return
+
+    display = []
+    for p in pipelines:
+        display.append({
+            "Name": p.get("name", ""),
+            "ID": p.get("id", ""),
+            "Created": p.get("created_at", ""),
+            "Description": p.get("description", ""),
+        })
+
+    print_table(display)
+    print("")
@@ -1,4 +1,4 @@
-from pymlokit.platforms.mlflow_api import creds_valid
+from pymlokit.platforms.mlflow_api import MLflowClient
 from pymlokit.utils.arg_utils import generate_header
  
  
@@ -16,7 +16,7 @@ def run(credential: str, platform: str, url: str) -> None:
          print("")
          return
  
-     if creds_valid(credential, url):
+     if MLflowClient(credential, url).creds_valid():
          print("[+] SUCCESS: Credentials provided are VALID.")
          print("")
      else:
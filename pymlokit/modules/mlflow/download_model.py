@@ -1,18 +1,29 @@
 import os
+from functools import partial
 from pathlib import Path
+from typing import Iterator
 
-from pymlokit.platforms.mlflow_api import (
-     creds_valid,
-     download_artifact,
-     get_artifact_root_dir,
-     list_artifacts_recursive,
-     list_models,
- )
+from pymlokit.platforms.mlflow_api import MLflowClient, MLflowModelVersion
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
+from pymlokit.utils.transfer import TransferJob, TransferResult, download_many
  
  
-def run(credential: str, platform: str, url: str, model_id: str) -> None:
+def _parse_model_uri(model_id: str) -> tuple[str, str, str]:
+     """Split ``models:/<name>/<version>`` or ``models:/<name>@<alias>`` into (name, version, alias)."""
+     if not model_id.startswith("models:/"):
+         return model_id, "", ""
+     ref = model_id[len("models:/"):]
+     if "@" in ref:
+         name, alias = ref.rsplit("@", 1)
+         return name, "", alias
+     name, _, version = ref.rpartition("/")
+     return (name, version, "") if name and version.isdigit() else (ref, "", "")
+ 
+ 
+def run(credential: str, platform: str, url: str, model_id: str, version: str = "", alias: str = "") -> None:
      print(generate_header("download-model", platform))
  
      print("")
@@ -26,7 +37,20 @@ def run(credential: str, platform: str, url: str, model_id: str) -> None:
          print("")
          return
  
-     if not creds_valid(credential, url):
+     name, uri_version, uri_alias = _parse_model_uri(model_id)
+     version = version or uri_version
+     alias = alias or uri_alias
+ 
+     client = MLflowClient(credential, url)
+     # Registered model names are case-sensitive; the inventory (when enabled) knows their exact spelling.
+     known = inventory.find(MLflowModelVersion, "mlflow", url, "model", name)
+     try:
+         target = client.get_model_version(known.name if known else name, version, alias)
+         if target is None and known is None:
+             exact = client.find_registered_model(name)
+             target = client.get_model_version(exact, version, alias) if exact and exact != name else None
+         directory = client.get_artifact_root_dir(target.run_id) if target is not None and target.run_id else ""
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -34,46 +58,32 @@ def run(credential: str, platform: str, url: str, model_id: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     models = list_models(credential, url)
-     target = None
-     for m in models:
-         if str(m.get("name", "")).lower() == model_id.lower():
-             target = m
-             break
      if not target:
          return
  
-     run_id = str(target.get("run_id", "") or "")
+     print(f"[*] INFO: Using version {target.version} of model {target.name}")
+     print("")
+ 
+     run_id = target.run_id
      if not run_id:
          return
  
-     directory = get_artifact_root_dir(credential, url, run_id)
-     artifact_list = list_artifacts_recursive(credential, url, run_id, directory) if directory else []
- 
-     if artifact_list:
-         print_table_header = False
-         if not print_table_header:
-             print(f"{'Artifact':>60}")
-             print("-" * 60)
-         for a in artifact_list:
-             print(f"{str(a.get('path','')):>60}")
-         print("")
-         print("")
- 
      out_dir = Path(os.getcwd()) / f"MLOKit-{generate_random_name()}"
      out_dir.mkdir(parents=True, exist_ok=True)
  
-     for a in artifact_list:
-         path = str(a.get("path", "") or "")
-         if not path:
-             continue
-         print("")
-         print(f"[*] INFO: Downloading {path}")
-         print("")
-         content = download_artifact(credential, url, run_id, path)
-         out_path = out_dir / Path(path)
-         out_path.parent.mkdir(parents=True, exist_ok=True)
-         out_path.write_bytes(content)
-         print(f"[+] SUCCESS: {path} written to: {out_dir}")
+     def jobs() -> Iterator[TransferJob]:
+         # Files start downloading as the directory walk finds them.
+         for path in client.iter_artifacts(run_id, directory) if directory else ():
+             print(f"[*] INFO: Downloading {path}")
+             yield TransferJob(url, str(out_dir / Path(path)), partial(client.download_artifact, run_id, path))
+ 
+     def report(r: TransferResult) -> None:
+         rel = os.path.relpath(r.job.destination, out_dir)
+         if r.error:
+             print(f"[-] ERROR: Failed to download {rel}: {r.error}")
+         else:
+             print(f"[+] SUCCESS: {rel} written to: {out_dir}")
          print("")
  
+     download_many(jobs(), on_result=report)
+ 
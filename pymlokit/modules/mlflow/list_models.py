@@ -1,5 +1,8 @@
-from pymlokit.platforms.mlflow_api import creds_valid, list_models
+from pymlokit.platforms.mlflow_api import MLflowClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
+from pymlokit.utils.iterators import started
 from pymlokit.utils.table import print_table
  
  
@@ -17,7 +20,10 @@ def run(credential: str, platform: str, url: str) -> None:
          print("")
          return
  
-     if not creds_valid(credential, url):
+     client = MLflowClient(credential, url)
+     try:
+         models = started(client.iter_models())
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -25,10 +31,10 @@ def run(credential: str, platform: str, url: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     models = list_models(credential, url)
+     models = inventory.track(models, "mlflow", url, "model", id="name")
      print_table(
          ["Name", "Version", "Status", "Description", "Artifact Location"],
-         [[m["name"], m["version"], m["status"], m["description"], m["artifact_location"]] for m in models],
+         ([m.name, m.version, m.status, m.description, m.artifact_location] for m in models),
      )
      print("")
  
@@ -1,4 +1,4 @@
-from pymlokit.platforms.palantir_api import creds_valid
+from pymlokit.platforms.palantir_api import PalantirClient
 from pymlokit.utils.arg_utils import generate_header
  
  
@@ -11,7 +11,7 @@ def run(credential: str, platform: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if creds_valid(credential):
+     if PalantirClient(credential).creds_valid():
          print("[+] SUCCESS: Credentials provided are VALID.")
          print("")
      else:
@@ -3,7 +3,8 @@ import os
 import re
 from pathlib import Path
 
-from pymlokit.platforms.palantir_api import download_dataset_csv, get_dataset_details, parse_creds
+from pymlokit.platforms.palantir_api import PalantirClient
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
 from pymlokit.utils.file_utils import generate_random_name
  
@@ -27,11 +28,13 @@ def run(credential: str, platform: str, dataset_id: str) -> None:
      print(f"[*] INFO: Performing download-dataset module for {platform}")
      print("")
  
+     client = PalantirClient(credential)
+     dataset_id = inventory.resolve_id("palantir", client.creds.tenant, "dataset", dataset_id)
      print(f"[*] INFO: Downloading dataset with RID {dataset_id} to the current working directory of {os.getcwd()}")
      print("")
  
      print("[*] INFO: Retrieving dataset metadata...")
-     metadata_json = get_dataset_details(credential, dataset_id)
+     metadata_json = client.get_dataset_details(dataset_id)
  
      dataset_name = "Unknown"
      if metadata_json:
@@ -42,22 +45,23 @@ def run(credential: str, platform: str, dataset_id: str) -> None:
          except Exception:
              dataset_name = "Unknown"
  
+     out_dir = Path(os.getcwd()) / f"MLOKit-{generate_random_name()}"
+     out_dir.mkdir(parents=True, exist_ok=True)
+ 
      print("[*] INFO: Downloading dataset content as CSV...")
-     content = b""
+     csv_name = f"{_sanitize_name(dataset_name)}.csv" if dataset_name != "Unknown" else "dataset.csv"
+     csv_path = out_dir / csv_name
+     size = 0
      try:
-         content = download_dataset_csv(credential, dataset_id)
+         size = client.download_dataset_csv(dataset_id, str(csv_path))
      except Exception:
-         content = b""
- 
-     out_dir = Path(os.getcwd()) / f"MLOKit-{generate_random_name()}"
-     out_dir.mkdir(parents=True, exist_ok=True)
+         size = 0
+     if not size and csv_path.exists():
+         csv_path.unlink()
  
-     if content:
-         csv_name = f"{_sanitize_name(dataset_name)}.csv" if dataset_name != "Unknown" else "dataset.csv"
-         csv_path = out_dir / csv_name
-         csv_path.write_bytes(content)
+     if size:
          print(f"[+] SUCCESS: Dataset written to: {csv_path}")
-         print(f"[*] INFO: File size: {len(content) / 1024.0:.2f} KB")
+         print(f"[*] INFO: File size: {size / 1024.0:.2f} KB")
          print(f"[*] INFO: Dataset RID: {dataset_id}")
          print("")
  
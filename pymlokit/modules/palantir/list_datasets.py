@@ -1,4 +1,5 @@
-from pymlokit.platforms.palantir_api import list_datasets
+from pymlokit.platforms.palantir_api import PalantirClient
+from pymlokit.utils import async_http, inventory
 from pymlokit.utils.arg_utils import generate_header
 from pymlokit.utils.table import print_table
  
@@ -14,12 +15,20 @@ def run(credential: str, platform: str) -> None:
  
      print(generate_header("list-datasets", platform))
  
-     datasets = list_datasets(credential)
-     rows = []
-     for d in datasets:
-         name = _truncate(str(d.get("dataset_name", "") or ""), 38)
-         date_created = _truncate(str(d.get("date_created", "") or ""), 23)
-         rows.append([name, d.get("type", ""), date_created, d.get("dataset_rid", "")])
+     client = PalantirClient(credential)
+     datasets = async_http.run(client.list_datasets_async())
+     tracked = inventory.track(
+         datasets, "palantir", client.creds.tenant, "dataset", id="dataset_rid", name="dataset_name", modified="date_updated"
+     )
+     rows = (
+         [
+             _truncate(d.dataset_name, 38),
+             d.type,
+             _truncate(d.date_created, 23),
+             d.dataset_rid,
+         ]
+         for d in tracked
+     )
  
      print_table(["Name", "Type", "Creation Date", "Dataset RID"], rows)
      print("")
@@ -1,6 +1,6 @@
 import os
  
-from pymlokit.platforms.palantir_api import parse_creds, upload_dataset
+from pymlokit.platforms.palantir_api import PalantirClient
 from pymlokit.utils.arg_utils import generate_header
  
  
@@ -33,7 +33,8 @@ def run(credential: str, platform: str, dataset_name: str, source_dir: str) -> N
      print(f"[*] INFO: File size: {len(file_content) / 1024.0:.2f} KB")
      print("")
  
-     dataset_rid = upload_dataset(credential, dataset_name, file_content, os.path.basename(source_dir))
+     client = PalantirClient(credential)
+     dataset_rid = client.upload_dataset(dataset_name, file_content, os.path.basename(source_dir))
      if not dataset_rid:
          print("[-] ERROR: Failed to upload dataset. The upload may have been rejected or there may be insufficient permissions.")
          print("")
@@ -42,7 +43,7 @@ def run(credential: str, platform: str, dataset_name: str, source_dir: str) -> N
      print(f"[+] SUCCESS: Dataset uploaded successfully with RID: {dataset_rid}")
      print("")
  
-     tenant = parse_creds(credential).tenant
+     tenant = client.creds.tenant
      print(f"[*] INFO: Dataset available at: https://{tenant}/workspace/dataset/{dataset_rid}")
      print("")
  
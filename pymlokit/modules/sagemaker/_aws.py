@@ -1,4 +1,11 @@
+import os
 from dataclasses import dataclass
+from functools import lru_cache, partial
+
+from pymlokit.utils.transfer import MIN_SEGMENTED_SIZE, ObjectChanged, RemoteObject, download_ranges, write_chunks_at
+
+# Times a ranged download starts over after the object is overwritten mid-transfer.
+S3_RESTARTS = 3
  
  
 @dataclass(frozen=True)
@@ -14,7 +21,9 @@ def parse_creds(credential: str) -> AwsCreds:
      return AwsCreds(access_key=parts[0], secret_key=parts[1])
  
  
+@lru_cache(maxsize=None)
 def boto3_clients(credential: str, region: str):
+     # Cached so a batch run builds one boto3 session per credential and region.
      try:
          import boto3
      except Exception as e:
@@ -28,3 +37,45 @@ def boto3_clients(credential: str, region: str):
      )
      return session.client("sagemaker"), session.client("s3")
  
+ 
+def _precondition_failed(e: Exception) -> bool:
+     # botocore's ClientError; matched by shape so botocore stays an optional import.
+     response = getattr(e, "response", None) or {}
+     status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+     return status == 412 or response.get("Error", {}).get("Code") == "PreconditionFailed"
+ 
+ 
+def _fetch_range(s3, bucket: str, key: str, etag: str, fd: int, start: int, end: int) -> int:
+     try:
+          obj = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag)
+     except Exception as e:
+          if _precondition_failed(e):
+               raise ObjectChanged(f"s3://{bucket}/{key} changed during download") from e
+          raise
+     return write_chunks_at(fd, obj["Body"].iter_chunks(), start)
+ 
+ 
+def download_s3_object(s3, bucket: str, key: str, out_path: str) -> int:
+     url = f"s3://{bucket}/{key}"
+     for _ in range(S3_RESTARTS):
+          head = s3.head_object(Bucket=bucket, Key=key)
+          remote = RemoteObject(
+               status=200,
+               size=int(head.get("ContentLength", 0) or 0),
+               accept_ranges=True,
+               etag=str(head.get("ETag", "") or ""),
+               last_modified=str(head.get("LastModified", "") or ""),
+          )
+          if not hasattr(os, "pwrite"):
+               break
+          if remote.size < MIN_SEGMENTED_SIZE:
+               obj = s3.get_object(Bucket=bucket, Key=key)
+               with open(out_path, "wb") as f:
+                    return sum(f.write(chunk) for chunk in obj["Body"].iter_chunks())
+          try:
+               return download_ranges(url, url, out_path, remote, partial(_fetch_range, s3, bucket, key, remote.etag))
+          except ObjectChanged:
+               # download_ranges dropped the partial state; start over against the new version.
+               continue
+     s3.download_file(bucket, key, out_path)
+     return os.path.getsize(out_path)
@@ -1,10 +1,12 @@
 import os
+from functools import partial
 from pathlib import Path
 
-from pymlokit.modules.sagemaker._aws import boto3_clients
+from pymlokit.modules.sagemaker._aws import boto3_clients, download_s3_object
 from pymlokit.utils.arg_utils import generate_header
 from pymlokit.utils.file_utils import generate_random_name
 from pymlokit.utils.table import print_table
+from pymlokit.utils.transfer import TransferJob, TransferResult, download_many
  
  
 def _parse_s3_url(s3_url: str) -> tuple[str, str]:
@@ -89,15 +91,21 @@ def run(credential: str, platform: str, region: str, model_id: str) -> None:
      out_dir = Path(os.getcwd()) / f"MLOKit-{generate_random_name()}"
      out_dir.mkdir(parents=True, exist_ok=True)
  
+     jobs = []
      for obj in objects:
          k = obj.get("Key")
          if not k or k.endswith("/"):
              continue
          rel = k[len(prefix) :] if k.startswith(prefix) else k
-         out_path = out_dir / Path(rel)
-         out_path.parent.mkdir(parents=True, exist_ok=True)
-         body = s3.get_object(Bucket=bucket, Key=k)["Body"].read()
-         out_path.write_bytes(body)
-         print(f"[+] SUCCESS: {rel} written to: {out_path}")
+         jobs.append(TransferJob(f"s3://{bucket}/{k}", str(out_dir / Path(rel)), partial(download_s3_object, s3, bucket, k)))
+ 
+     def report(r: TransferResult) -> None:
+         rel = os.path.relpath(r.job.destination, out_dir)
+         if r.error:
+             print(f"[-] ERROR: Failed to download {rel}: {r.error}")
+         else:
+             print(f"[+] SUCCESS: {rel} written to: {r.job.destination}")
          print("")
  
+     download_many(jobs, on_result=report)
+ 
@@ -5,6 +5,30 @@ from pymlokit.utils.arg_utils import generate_header
 from pymlokit.utils.table import print_table
  
  
+def _model_rows(sm):
+     # One page at a time, so machine output formats can emit rows as pages arrive.
+     next_token = None
+     first = True
+     while True:
+         kwargs = {"MaxResults": 100}
+         if next_token:
+             kwargs["NextToken"] = next_token
+         resp = sm.list_models(**kwargs)
+         if first:
+             print("[+] SUCCESS: Credentials are valid")
+             print("")
+             first = False
+         for m in resp.get("Models", []):
+             yield [
+                 m.get("ModelName", ""),
+                 (m.get("CreationTime") or "").strftime("%m/%d/%Y") if hasattr(m.get("CreationTime"), "strftime") else "",
+                 m.get("ModelArn", ""),
+             ]
+         next_token = resp.get("NextToken")
+         if not next_token:
+             return
+ 
+ 
 def run(credential: str, platform: str, region: str) -> None:
      print(generate_header("list-models", platform))
  
@@ -22,28 +46,6 @@ def run(credential: str, platform: str, region: str) -> None:
  
      sm, _ = boto3_clients(credential, region)
  
-     models = []
-     next_token = None
-     while True:
-         kwargs = {"MaxResults": 100}
-         if next_token:
-             kwargs["NextToken"] = next_token
-         resp = sm.list_models(**kwargs)
-         if not models:
-             print("[+] SUCCESS: Credentials are valid")
-             print("")
-         for m in resp.get("Models", []):
-             models.append(
-                 [
-                     m.get("ModelName", ""),
-                     (m.get("CreationTime") or "").strftime("%m/%d/%Y") if hasattr(m.get("CreationTime"), "strftime") else "",
-                     m.get("ModelArn", ""),
-                 ]
-             )
-         next_token = resp.get("NextToken")
-         if not next_token:
-             break
- 
-     print_table(["Model Name", "Creation Date", "Model ARN"], models)
+     print_table(["Model Name", "Creation Date", "Model ARN"], _model_rows(sm))
      print("")
  
@@ -3,6 +3,31 @@ from pymlokit.utils.arg_utils import generate_header
 from pymlokit.utils.table import print_table
  
  
+def _notebook_rows(sm):
+     # One page at a time, so machine output formats can emit rows as pages arrive.
+     next_token = None
+     first = True
+     while True:
+         kwargs = {"MaxResults": 100}
+         if next_token:
+             kwargs["NextToken"] = next_token
+         resp = sm.list_notebook_instances(**kwargs)
+         if first:
+             print("[+] SUCCESS: Credentials are valid")
+             print("")
+             first = False
+         for n in resp.get("NotebookInstances", []):
+             yield [
+                 n.get("NotebookInstanceName", ""),
+                 (n.get("CreationTime") or "").strftime("%m/%d/%Y") if hasattr(n.get("CreationTime"), "strftime") else "",
+                 n.get("NotebookInstanceStatus", ""),
+                 n.get("NotebookInstanceLifecycleConfigName", ""),
+             ]
+         next_token = resp.get("NextToken")
+         if not next_token:
+             return
+ 
+ 
 def run(credential: str, platform: str, region: str) -> None:
      print(generate_header("list-notebooks", platform))
  
@@ -20,29 +45,6 @@ def run(credential: str, platform: str, region: str) -> None:
  
      sm, _ = boto3_clients(credential, region)
  
-     rows = []
-     next_token = None
-     while True:
-         kwargs = {"MaxResults": 100}
-         if next_token:
-             kwargs["NextToken"] = next_token
-         resp = sm.list_notebook_instances(**kwargs)
-         if not rows:
-             print("[+] SUCCESS: Credentials are valid")
-             print("")
-         for n in resp.get("NotebookInstances", []):
-             rows.append(
-                 [
-                     n.get("NotebookInstanceName", ""),
-                     (n.get("CreationTime") or "").strftime("%m/%d/%Y") if hasattr(n.get("CreationTime"), "strftime") else "",
-                     n.get("NotebookInstanceStatus", ""),
-                     n.get("NotebookInstanceLifecycleConfigName", ""),
-                 ]
-             )
-         next_token = resp.get("NextToken")
-         if not next_token:
-             break
- 
-     print_table(["Notebook Name", "Creation Date", "Notebook Status", "Notebook Lifecycle Config"], rows)
+     print_table(["Notebook Name", "Creation Date", "Notebook Status", "Notebook Lifecycle Config"], _notebook_rows(sm))
      print("")
  
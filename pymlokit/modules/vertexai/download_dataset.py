@@ -1,14 +1,16 @@
 import os
  
 from pymlokit.platforms.vertexai_api import (
-     creds_valid,
+     VertexDataset,
      download_media_link,
+     find_dataset,
      get_media_link,
-     list_datasets,
      list_regions,
      parse_gs_uri,
  )
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
  
  
@@ -25,7 +27,9 @@ def run(credential: str, platform: str, project: str, dataset_id: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         regions = list_regions(credential, project)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -33,34 +37,26 @@ def run(credential: str, platform: str, project: str, dataset_id: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     print(f"[*] INFO: Getting all regions for the {project} project")
-     print("")
-     regions = list_regions(credential, project)
- 
-     target = None
-     for r in regions:
-         for d in list_datasets(credential, r, project):
-             if str(d.get("id", "")).lower() == dataset_id.lower():
-                 target = d
-                 break
-         if target:
-             break
+     # A dataset recorded by list-datasets (matched by ID or display name) knows its region already.
+     target = inventory.find(VertexDataset, "vertexai", project, "dataset", dataset_id)
+     if target is None:
+         print(f"[*] INFO: Getting all regions for the {project} project")
+         print("")
+         target = find_dataset(credential, regions, project, dataset_id)
  
      if not target:
          return
  
-     bucket, obj = parse_gs_uri(str(target.get("uri", "") or ""))
+     bucket, obj = parse_gs_uri(target.uri)
      print(f"[*] INFO: Getting mediaLink for gs://{bucket}/{obj}")
      print("")
      media_link = get_media_link(credential, bucket, obj)
      if not media_link:
          return
  
-     content = download_media_link(credential, media_link)
      file_name = f"MLOKit-{generate_random_name()}"
      out_path = os.path.join(os.getcwd(), file_name)
-     with open(out_path, "wb") as f:
-         f.write(content)
+     download_media_link(credential, media_link, out_path)
  
      print(f"[+] SUCCESS: Dataset written to: {out_path}")
      print("")
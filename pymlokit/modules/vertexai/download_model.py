@@ -1,20 +1,24 @@
 import os
+from functools import partial
 from pathlib import Path
 
 from pymlokit.platforms.vertexai_api import (
-     creds_valid,
+     VertexModel,
      download_media_link,
      export_model,
+     find_model,
      get_media_link,
      list_buckets,
-     list_models,
      list_objects,
      list_regions,
      parse_gs_uri,
      wait_for_export,
  )
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.file_utils import generate_random_name
+from pymlokit.utils.transfer import TransferJob, download_many
  
  
 def run(credential: str, platform: str, project: str, model_id: str) -> None:
@@ -30,7 +34,9 @@ def run(credential: str, platform: str, project: str, model_id: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         regions = list_regions(credential, project)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -38,39 +44,42 @@ def run(credential: str, platform: str, project: str, model_id: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     print(f"[*] INFO: Getting all regions for the {project} project")
-     print("")
-     regions = list_regions(credential, project)
- 
-     target = None
-     for r in regions:
-         for m in list_models(credential, r, project):
-             if str(m.get("id", "")).lower() == model_id.lower():
-                 target = m
-                 break
-         if target:
-             break
+     # A model recorded by list-models (matched by ID or display name) knows its region already.
+     target = inventory.find(VertexModel, "vertexai", project, "model", model_id)
+     if target is None:
+         print(f"[*] INFO: Getting all regions for the {project} project")
+         print("")
+         target = find_model(credential, regions, project, model_id)
  
      if not target:
          return
  
-     export_fmt = str(target.get("exportable_format", "") or "")
-     region = str(target.get("region", "") or "")
+     export_fmt = target.exportable_format
+     region = target.region
  
      print(f"[*] INFO: Getting all buckets for the {project} project")
      print("")
      buckets = list_buckets(credential, project)
  
-     artifact_uri = ""
+     export = None
      for b in buckets:
-         artifact_uri = export_model(credential, region, project, model_id, b, export_fmt)
-         if artifact_uri:
+         export = export_model(credential, region, project, target.id, b, export_fmt)
+         if export:
              break
  
-     if not artifact_uri:
+     if not export:
          return
  
-     wait_for_export(15.0)
+     print(f"[*] INFO: Waiting for export {export.operation or export.artifact_uri} to finish")
+     print("")
+     try:
+         artifact_uri = wait_for_export(credential, export)
+     except RuntimeError as ex:
+         print(f"[-] ERROR: {ex}")
+         print("")
+         return
+     if not artifact_uri:
+         return
  
      bucket, prefix = parse_gs_uri(artifact_uri)
      prefix = prefix.strip("/")
@@ -82,17 +91,22 @@ def run(credential: str, platform: str, project: str, model_id: str) -> None:
      out_dir = Path(os.getcwd()) / f"MLOKit-{generate_random_name()}"
      out_dir.mkdir(parents=True, exist_ok=True)
  
-     for name in object_names:
-         if not name or name.endswith("/"):
-             continue
+     def fetch_object(name: str, out_path: str) -> int:
          media_link = get_media_link(credential, bucket, name)
          if not media_link:
+             raise RuntimeError(f"No mediaLink returned for gs://{bucket}/{name}")
+         return download_media_link(credential, media_link, out_path)
+ 
+     jobs = []
+     for name in object_names:
+         if not name or name.endswith("/"):
              continue
-         content = download_media_link(credential, media_link)
          rel = name[len(prefix) :] if prefix and name.startswith(prefix) else name
-         out_path = out_dir / Path(rel)
-         out_path.parent.mkdir(parents=True, exist_ok=True)
-         out_path.write_bytes(content)
+         jobs.append(TransferJob(f"gs://{bucket}/{name}", str(out_dir / Path(rel)), partial(fetch_object, name)))
+     for r in download_many(jobs):
+         if r.error:
+             print(f"[-] ERROR: Failed to download {r.job.source}: {r.error}")
+             print("")
  
      print(f"[+] SUCCESS: Model written to: {out_dir}")
      print("")
@@ -1,5 +1,7 @@
-from pymlokit.platforms.vertexai_api import creds_valid, list_datasets, list_regions
+from pymlokit.platforms.vertexai_api import iter_datasets_in, list_regions
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
  
  
@@ -16,7 +18,9 @@ def run(credential: str, platform: str, project: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         regions = list_regions(credential, project)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -26,14 +30,19 @@ def run(credential: str, platform: str, project: str) -> None:
  
      print(f"[*] INFO: Listing regions for the {project} project")
      print("")
-     regions = list_regions(credential, project)
      for r in regions:
          print(r)
  
-     rows = []
-     for r in regions:
-         for d in list_datasets(credential, r, project):
-             rows.append([d["display_name"], d["id"], d["create_time"], d["update_time"], d["region"], d["uri"]])
+     # Regions are listed concurrently; rows still come out region by region as print_table consumes them.
+     datasets = inventory.track(
+         iter_datasets_in(credential, regions, project),
+         "vertexai",
+         project,
+         "dataset",
+         name="display_name",
+         modified="update_time",
+     )
+     rows = ([d.display_name, d.id, d.create_time, d.update_time, d.region, d.uri] for d in datasets)
  
      print_table(["Name", "Dataset ID", "Creation Date", "Update Date", "Region", "File Path"], rows)
      print("")
@@ -1,5 +1,7 @@
-from pymlokit.platforms.vertexai_api import creds_valid, list_models, list_regions
+from pymlokit.platforms.vertexai_api import iter_models_in, list_regions
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
  
  
@@ -16,7 +18,9 @@ def run(credential: str, platform: str, project: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         regions = list_regions(credential, project)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -26,14 +30,19 @@ def run(credential: str, platform: str, project: str) -> None:
  
      print(f"[*] INFO: Listing regions for the {project} project")
      print("")
-     regions = list_regions(credential, project)
      for r in regions:
          print(r)
  
-     rows = []
-     for r in regions:
-         for m in list_models(credential, r, project):
-             rows.append([m["display_name"], m["id"], m["create_time"], m["region"], m["source_type"], m["exportable_format"]])
+     # Regions are listed concurrently; rows still come out region by region as print_table consumes them.
+     models = inventory.track(
+         iter_models_in(credential, regions, project),
+         "vertexai",
+         project,
+         "model",
+         name="display_name",
+         modified="update_time",
+     )
+     rows = ([m.display_name, m.id, m.create_time, m.region, m.source_type, m.exportable_format] for m in models)
  
      print_table(["Name", "Model ID", "Creation Date", "Region", "Model Type", "Export Format"], rows)
      print("")
@@ -1,5 +1,7 @@
-from pymlokit.platforms.vertexai_api import creds_valid, list_projects
+from pymlokit.platforms.vertexai_api import list_projects
+from pymlokit.utils import inventory
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
  
  
@@ -12,7 +14,9 @@ def run(credential: str, platform: str) -> None:
      print("[*] INFO: Checking credentials provided")
      print("")
  
-     if not creds_valid(credential):
+     try:
+         projects = list_projects(credential)
+     except InvalidCredentials:
          print("[-] ERROR: Credentials provided are INVALID. Check the credentials again.")
          print("")
          return
@@ -20,10 +24,10 @@ def run(credential: str, platform: str) -> None:
      print("[+] SUCCESS: Credentials provided are VALID.")
      print("")
  
-     projects = list_projects(credential)
+     projects = inventory.track(projects, "vertexai", "", "project", id="project_id")
      print_table(
          ["Name", "Project ID", "Project Number", "Project State", "Creation Date"],
-         [[p.name, p.project_id, p.project_number, p.lifecycle_state, p.create_time] for p in projects],
+         ([p.name, p.project_id, p.project_number, p.lifecycle_state, p.create_time] for p in projects),
      )
      print("")
  
@@ -1,5 +1,6 @@
-from pymlokit.platforms.zenml_api import creds_valid, list_projects
+from pymlokit.platforms.zenml_api import list_projects
 from pymlokit.utils.arg_utils import generate_header
+from pymlokit.utils.auth import InvalidCredentials
 from pymlokit.utils.table import print_table
 
 
@@ -18,10 +19,16 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print("[*] INFO: Checking credentials/connectivity")
     print("")
 
-    if not creds_valid(credential, api_url):
+    try:
+        projects = list_projects(credential, api_url)
+    except (InvalidCredentials, OSError):
         print("[-] ERROR: Credentials provided are INVALID or Server unreachable.")
         print("")
         return
+    except Exception as e:
+        print(f"[-] ERROR: Failed to list projects: {e}")
+        print("")
+        return
 
     print("[+] SUCCESS: Service is reachable.")
     print("")
@@ -29,23 +36,18 @@ def run(credential: str, platform: str, api_url: str) -> None:
     print(f"[*] INFO: Listing workspaces (projects)")
     print("")
 
-    try:
-        projects = list_projects(credential, api_url)
-        if not projects:
-            print("[-] INFO: No projects found.")
-            print("")
-            return
-
-        display = []
-        for p in projects:
-            display.append({
-                "Name": p.get("name", ""),
-                "ID": p.get("id", ""),
-                "Created": p.get("created", ""),
-            })
-
-        print_table(display)
-        print("")
-    except Exception as e:
-        print(f"[-] ERROR: Failed to list projects: {e}")
+    if not projects:
+        print("[-] INFO: No projects found.")
         print("")
+        return
+
+    display = []
+    for p in projects:
+        display.append({
+            "Name": p.get("name", ""),
+            "ID": p.get("id", ""),
+            "Created": p.get("created", ""),
+        })
+
+    print_table(display)
+    print("")
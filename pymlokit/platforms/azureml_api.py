@@ -3,53 +3,117 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator, NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+from pymlokit.utils.auth import bearer_headers, raise_for_auth, raise_for_status, token_expired
 from pymlokit.utils.azure_storage import shared_key_authorization, storage_headers_common
-from pymlokit.utils.http import get_json, request
+from pymlokit.utils.http import RetryPolicy, get_json, request
+from pymlokit.utils.iterators import prefetch_pages, prefetch_pages_async, unique_by
+from pymlokit.utils.transfer import download_file
+
+
+# ARM throttles per subscription and answers 429 with Retry-After windows that
+# can run to minutes; let large enumerations wait them out.
+RETRY_POLICY = RetryPolicy(max_total_s=300.0)
+
+
+class AzureSubscription(NamedTuple):
+    display_name: str
+    id: str
+    state: str
+
+
+class AzureWorkspace(NamedTuple):
+    name: str
+    workspace_id: str
+    region: str
+    resource_group: str
+    creation_time: str
+    created_by: str
+
+
+class AzureModel(NamedTuple):
+    id: str
+    name: str
+    model_type: str
+    created_time: str
+    modified_time: str
+    asset_id: str
+    provisioning_state: str = ""
+
+
+class AzureDataset(NamedTuple):
+    id: str
+    name: str
+    file_name: str
+    state: str
+    data_type: str
+    datastore_name: str
+    azure_file_path: str
+
+
+class AzureDatastore(NamedTuple):
+    name: str
+    account_name: str
+    container_name: str
+    endpoint: str
+    credential: str
+    datastore_type: str
 
 
 def _auth_headers(token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
+    return bearer_headers(token)
+
+
+_SUBSCRIPTIONS_URL = "https://management.azure.com/subscriptions?api-version=2022-12-01"
 
 
 def creds_valid(token: str) -> bool:
-    status, _ = get_json(
-        "https://management.azure.com/subscriptions?api-version=2022-12-01",
-        headers=_auth_headers(token),
-    )
+    if token_expired(token):
+        return False
+    status, _ = get_json(_SUBSCRIPTIONS_URL, headers=_auth_headers(token), retry=RETRY_POLICY)
     return status == 200
 
 
-def list_subscriptions(token: str) -> list[dict]:
-    status, payload = get_json(
-        "https://management.azure.com/subscriptions?api-version=2022-12-01",
-        headers=_auth_headers(token),
-    )
-    if status != 200:
-        return []
+def _subscriptions_from(payload: Any) -> list[AzureSubscription]:
     out = []
     if isinstance(payload, dict) and isinstance(payload.get("value"), list):
         for s in payload["value"]:
             if not isinstance(s, dict):
                 continue
             out.append(
-                {
-                    "display_name": s.get("displayName", ""),
-                    "id": s.get("subscriptionId", ""),
-                    "state": s.get("state", ""),
-                }
+                AzureSubscription(
+                    display_name=str(s.get("displayName", "") or ""),
+                    id=str(s.get("subscriptionId", "") or ""),
+                    state=str(s.get("state", "") or ""),
+                )
             )
     return out
 
 
-def list_workspaces(token: str, subscription_id: str) -> list[dict]:
-    status, payload = get_json(
-        f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.MachineLearningServices/workspaces?api-version=2023-10-01",
-        headers=_auth_headers(token),
+def list_subscriptions(token: str) -> list[AzureSubscription]:
+    status, payload = get_json(_SUBSCRIPTIONS_URL, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_status("AzureML", status)
+    return _subscriptions_from(payload)
+
+
+async def list_subscriptions_async(token: str) -> list[AzureSubscription]:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(_SUBSCRIPTIONS_URL, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_status("AzureML", status)
+    return _subscriptions_from(payload)
+
+
+def _workspaces_url(subscription_id: str) -> str:
+    return (
+        f"https://management.azure.com/subscriptions/{subscription_id}/providers/"
+        "Microsoft.MachineLearningServices/workspaces?api-version=2023-10-01"
     )
-    if status != 200:
-        return []
+
+
+def _workspaces_from(payload: Any) -> list[AzureWorkspace]:
     out = []
     if isinstance(payload, dict) and isinstance(payload.get("value"), list):
         for w in payload["value"]:
@@ -73,99 +137,176 @@ def list_workspaces(token: str, subscription_id: str) -> list[dict]:
                 name = sp[-1] if sp else ""
             if ws_id and name and region and resource_group:
                 out.append(
-                    {
-                        "name": name,
-                        "workspace_id": ws_id,
-                        "region": region,
-                        "resource_group": resource_group,
-                        "creation_time": creation_time,
-                        "created_by": created_by,
-                    }
+                    AzureWorkspace(
+                        name=name,
+                        workspace_id=ws_id,
+                        region=region,
+                        resource_group=resource_group,
+                        creation_time=creation_time,
+                        created_by=created_by,
+                    )
                 )
     return out
 
 
-def list_models(token: str, subscription_id: str, region: str, resource_group: str, workspace: str) -> list[dict]:
-    base = (
+def list_workspaces(token: str, subscription_id: str) -> list[AzureWorkspace]:
+    status, payload = get_json(_workspaces_url(subscription_id), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status)
+    if status != 200:
+        return []
+    return _workspaces_from(payload)
+
+
+async def list_workspaces_async(token: str, subscription_id: str) -> list[AzureWorkspace]:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(
+        _workspaces_url(subscription_id), headers=_auth_headers(token), retry=RETRY_POLICY
+    )
+    raise_for_auth("AzureML", status)
+    if status != 200:
+        return []
+    return _workspaces_from(payload)
+
+
+def _model_management_url(subscription_id: str, region: str, resource_group: str, workspace: str, path: str) -> str:
+    return (
         f"https://{region}.modelmanagement.azureml.net/modelmanagement/v1.0/subscriptions/{subscription_id}/resourceGroups/"
-        f"{resource_group}/providers/Microsoft.MachineLearningServices/workspaces/{workspace}/models?api-version=2023-10-01"
+        f"{resource_group}/providers/Microsoft.MachineLearningServices/workspaces/{workspace}/{path}?api-version=2023-10-01"
     )
-    next_link = base
-    out: list[dict] = []
-    while next_link:
-        status, payload = get_json(next_link, headers=_auth_headers(token))
+
+
+def _asset_id(model_url: str) -> str:
+    if model_url and "/" in model_url:
+        parts = model_url.split("/")
+        if len(parts) > 3:
+            return parts[3]
+    return ""
+
+
+def _next_page(url: str, payload: dict) -> str:
+    """The URL of the page after ``payload``: its ``nextLink``, else ``url`` carrying its ``continuationToken``."""
+    link = str(payload.get("nextLink", "") or "")
+    if not link:
+        token = str(payload.get("continuationToken", "") or "")
+        if not token:
+            return ""
+        parts = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k != "continuationToken"]
+        link = urlunsplit(parts._replace(query=urlencode([*query, ("continuationToken", token)])))
+    # A service that hands back the page just read would otherwise be polled forever.
+    return "" if link == url else link
+
+
+def _page_fetcher(token: str) -> Callable[[str], tuple[Any, str]]:
+    headers = _auth_headers(token)
+
+    def fetch(url: str) -> tuple[Any, str]:
+        status, payload = get_json(url, headers=headers, retry=RETRY_POLICY)
+        raise_for_auth("AzureML", status, (401,))
+        if status != 200 or not isinstance(payload, dict):
+            return None, ""
+        return payload, _next_page(url, payload)
+
+    return fetch
+
+
+def _page_fetcher_async(token: str) -> Callable[[str], Awaitable[tuple[Any, str]]]:
+    from pymlokit.utils import async_http
+
+    headers = _auth_headers(token)
+
+    async def fetch(url: str) -> tuple[Any, str]:
+        status, payload = await async_http.get_json(url, headers=headers, retry=RETRY_POLICY)
+        raise_for_auth("AzureML", status, (401,))
         if status != 200 or not isinstance(payload, dict):
-            break
-        vals = payload.get("value")
-        if isinstance(vals, list):
-            for m in vals:
-                if not isinstance(m, dict):
-                    continue
-                mid = str(m.get("id", "") or "")
-                name = str(m.get("name", "") or "")
-                model_type = str(m.get("modelType", "") or "")
-                created = str(m.get("createdTime", "") or "")
-                modified = str(m.get("modifiedTime", "") or "")
-                asset_id = ""
-                url = str(m.get("url", "") or "")
-                if url and "/" in url:
-                    parts = url.split("/")
-                    if len(parts) > 3:
-                        asset_id = parts[3]
-                if mid:
-                    out.append(
-                        {
-                            "id": mid,
-                            "name": name,
-                            "model_type": model_type,
-                            "created_time": created,
-                            "modified_time": modified,
-                            "asset_id": asset_id,
-                        }
+            return None, ""
+        return payload, _next_page(url, payload)
+
+    return fetch
+
+
+def _model_page(payload: Any) -> list[AzureModel]:
+    out = []
+    vals = payload.get("value") if isinstance(payload, dict) else None
+    if isinstance(vals, list):
+        for m in vals:
+            if not isinstance(m, dict):
+                continue
+            mid = str(m.get("id", "") or "")
+            if mid:
+                out.append(
+                    AzureModel(
+                        id=mid,
+                        name=str(m.get("name", "") or ""),
+                        model_type=str(m.get("modelType", "") or ""),
+                        created_time=str(m.get("createdTime", "") or ""),
+                        modified_time=str(m.get("modifiedTime", "") or ""),
+                        asset_id=_asset_id(str(m.get("url", "") or "")),
                     )
-        next_link = str(payload.get("nextLink", "") or "")
-    seen = set()
-    deduped = []
-    for m in out:
-        mid = m.get("id", "")
-        if not mid or mid in seen:
-            continue
-        seen.add(mid)
-        deduped.append(m)
-    return deduped
-
-
-def get_model(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, model_id: str) -> dict | None:
-    url = (
-        f"https://{region}.modelmanagement.azureml.net/modelmanagement/v1.0/subscriptions/{subscription_id}/resourceGroups/"
-        f"{resource_group}/providers/Microsoft.MachineLearningServices/workspaces/{workspace}/models/{model_id}?api-version=2023-10-01"
-    )
-    status, payload = get_json(url, headers=_auth_headers(token))
-    if status != 200 or not isinstance(payload, dict):
+                )
+    return out
+
+
+def iter_models(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> Iterator[AzureModel]:
+    """Yield the workspace's models page by page (following ``nextLink``), first occurrence of each ID only.
+
+    Each next page is requested while the current one is consumed; stopping
+    early skips every request after that one.
+    """
+    url = _model_management_url(subscription_id, region, resource_group, workspace, "models")
+    return unique_by(prefetch_pages(_page_fetcher(token), _model_page, url), "id")
+
+
+def list_models(token: str, subscription_id: str, region: str, resource_group: str, workspace: str) -> list[AzureModel]:
+    return list(iter_models(token, subscription_id, region, resource_group, workspace))
+
+
+async def list_models_async(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> list[AzureModel]:
+    url = _model_management_url(subscription_id, region, resource_group, workspace, "models")
+    return list(unique_by(await prefetch_pages_async(_page_fetcher_async(token), _model_page, url), "id"))
+
+
+def _model_from(payload: Any) -> AzureModel | None:
+    if not isinstance(payload, dict):
         return None
-    asset_id = ""
-    urlv = str(payload.get("url", "") or "")
-    if urlv and "/" in urlv:
-        parts = urlv.split("/")
-        if len(parts) > 3:
-            asset_id = parts[3]
-    return {
-        "id": payload.get("id", ""),
-        "name": payload.get("name", ""),
-        "model_type": payload.get("modelType", ""),
-        "created_time": payload.get("createdTime", ""),
-        "modified_time": payload.get("modifiedTime", ""),
-        "provisioning_state": payload.get("provisioningState", ""),
-        "asset_id": asset_id,
-    }
+    return AzureModel(
+        id=str(payload.get("id", "") or ""),
+        name=str(payload.get("name", "") or ""),
+        model_type=str(payload.get("modelType", "") or ""),
+        created_time=str(payload.get("createdTime", "") or ""),
+        modified_time=str(payload.get("modifiedTime", "") or ""),
+        asset_id=_asset_id(str(payload.get("url", "") or "")),
+        provisioning_state=str(payload.get("provisioningState", "") or ""),
+    )
+
+
+def get_model(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, model_id: str) -> AzureModel | None:
+    url = _model_management_url(subscription_id, region, resource_group, workspace, f"models/{model_id}")
+    status, payload = get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
+    return _model_from(payload) if status == 200 else None
+
+
+async def get_model_async(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str, model_id: str
+) -> AzureModel | None:
+    from pymlokit.utils import async_http
+
+    url = _model_management_url(subscription_id, region, resource_group, workspace, f"models/{model_id}")
+    status, payload = await async_http.get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
+    return _model_from(payload) if status == 200 else None
 
 
 def get_asset_prefixes(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, asset_id: str) -> list[str]:
-    url = (
-        f"https://{region}.modelmanagement.azureml.net/modelmanagement/v1.0/subscriptions/{subscription_id}/resourceGroups/"
-        f"{resource_group}/providers/Microsoft.MachineLearningServices/workspaces/{workspace}/assets/{asset_id}?api-version=2023-10-01"
-    )
-    status, payload = get_json(url, headers=_auth_headers(token))
+    url = _model_management_url(subscription_id, region, resource_group, workspace, f"assets/{asset_id}")
+    status, payload = get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
     if status != 200 or not isinstance(payload, dict):
         return []
     prefixes = []
@@ -187,7 +328,8 @@ def get_content_uris(
         f"providers/Microsoft.MachineLearningServices/workspaces/{workspace}/artifacts/prefix/contentinfo/{artifact_prefix}"
         f"?api-version=2023-10-01"
     )
-    status, payload = get_json(url, headers=_auth_headers(token))
+    status, payload = get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
     if status != 200 or not isinstance(payload, dict):
         return []
     out = []
@@ -199,21 +341,34 @@ def get_content_uris(
     return out
 
 
-def download_url_bytes(url: str) -> bytes:
-    resp = request("GET", url, headers={"Content-Type": "application/json"})
-    if resp.status != 200:
-        raise RuntimeError(f"Download returned HTTP {resp.status}")
-    return resp.body
+def download_url_to_file(url: str, out_path: str) -> int:
+    # Content URIs carry a fresh SAS token per listing; resume by blob path only.
+    status, written = download_file(
+        url,
+        out_path,
+        headers={"Content-Type": "application/json"},
+        resume_key=url.split("?", 1)[0],
+        retry=RETRY_POLICY,
+    )
+    if status != 200:
+        raise RuntimeError(f"Download returned HTTP {status}")
+    return written
 
 
-def list_datasets(token: str, subscription_id: str, region: str, resource_group: str, workspace: str) -> list[dict]:
-    url = (
-        f"https://{region}.experiments.azureml.net/dataset/v1.0/subscriptions/{subscription_id}/resourceGroups/{resource_group}/"
-        f"providers/Microsoft.MachineLearningServices/workspaces/{workspace}/datasets?includeInvisible=false&pageSize=100"
-        "&includeLatestDefinition=true"
+def _workspace_url(service: str, subscription_id: str, region: str, resource_group: str, workspace: str, path: str) -> str:
+    return (
+        f"https://{region}.experiments.azureml.net/{service}/v1.0/subscriptions/{subscription_id}/resourceGroups/{resource_group}/"
+        f"providers/Microsoft.MachineLearningServices/workspaces/{workspace}/{path}"
     )
-    status, payload = get_json(url, headers=_auth_headers(token))
-    if status != 200 or not isinstance(payload, dict):
+
+
+def _datasets_url(subscription_id: str, region: str, resource_group: str, workspace: str, path: str = "datasets") -> str:
+    url = _workspace_url("dataset", subscription_id, region, resource_group, workspace, path)
+    return f"{url}?includeInvisible=false&pageSize=100&includeLatestDefinition=true"
+
+
+def _datasets_from(payload: Any) -> list[AzureDataset]:
+    if not isinstance(payload, dict):
         return []
     out = []
     v = payload.get("value")
@@ -230,102 +385,168 @@ def list_datasets(token: str, subscription_id: str, region: str, resource_group:
             file_name = file_path.rsplit("/", 1)[-1] if file_path else ""
             if did:
                 out.append(
-                    {
-                        "file_name": file_name,
-                        "id": did,
-                        "state": state,
-                        "data_type": data_type,
-                        "datastore_name": ds_name,
-                        "azure_file_path": file_path,
-                    }
+                    AzureDataset(
+                        id=did,
+                        name=name,
+                        file_name=file_name,
+                        state=state,
+                        data_type=data_type,
+                        datastore_name=ds_name,
+                        azure_file_path=file_path,
+                    )
                 )
     return out
 
 
-def get_dataset(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, dataset_id: str) -> dict | None:
-    url = (
-        f"https://{region}.experiments.azureml.net/dataset/v1.0/subscriptions/{subscription_id}/resourceGroups/{resource_group}/"
-        f"providers/Microsoft.MachineLearningServices/workspaces/{workspace}/datasets/{dataset_id}?includeInvisible=false&pageSize=100"
-        "&includeLatestDefinition=true"
-    )
-    status, payload = get_json(url, headers=_auth_headers(token))
-    if status != 200 or not isinstance(payload, dict):
+def iter_datasets(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> Iterator[AzureDataset]:
+    """Yield the workspace's datasets 100 per page, following ``continuationToken``; first occurrence of each ID only."""
+    url = _datasets_url(subscription_id, region, resource_group, workspace)
+    return unique_by(prefetch_pages(_page_fetcher(token), _datasets_from, url), "id")
+
+
+def list_datasets(token: str, subscription_id: str, region: str, resource_group: str, workspace: str) -> list[AzureDataset]:
+    return list(iter_datasets(token, subscription_id, region, resource_group, workspace))
+
+
+async def list_datasets_async(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> list[AzureDataset]:
+    url = _datasets_url(subscription_id, region, resource_group, workspace)
+    return list(unique_by(await prefetch_pages_async(_page_fetcher_async(token), _datasets_from, url), "id"))
+
+
+def _dataset_from(payload: Any) -> AzureDataset | None:
+    if not isinstance(payload, dict):
         return None
-    return {
-        "id": payload.get("id", ""),
-        "name": payload.get("name", ""),
-        "state": payload.get("state", ""),
-        "data_type": payload.get("dataType", ""),
-        "datastore_name": payload.get("datastoreName", ""),
-        "azure_file_path": payload.get("azureFilePath", ""),
-    }
+    file_path = str(payload.get("azureFilePath", "") or "")
+    return AzureDataset(
+        id=str(payload.get("id", "") or ""),
+        name=str(payload.get("name", "") or ""),
+        file_name=file_path.rsplit("/", 1)[-1] if file_path else "",
+        state=str(payload.get("state", "") or ""),
+        data_type=str(payload.get("dataType", "") or ""),
+        datastore_name=str(payload.get("datastoreName", "") or ""),
+        azure_file_path=file_path,
+    )
 
 
-def get_datastore(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, name: str) -> dict | None:
-    url = (
-        f"https://{region}.experiments.azureml.net/datastore/v1.0/subscriptions/{subscription_id}/resourceGroups/{resource_group}/"
-        f"providers/Microsoft.MachineLearningServices/workspaces/{workspace}/datastores/{name}"
+def get_dataset(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, dataset_id: str) -> AzureDataset | None:
+    url = _datasets_url(subscription_id, region, resource_group, workspace, f"datasets/{dataset_id}")
+    status, payload = get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
+    return _dataset_from(payload) if status == 200 else None
+
+
+async def get_dataset_async(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str, dataset_id: str
+) -> AzureDataset | None:
+    from pymlokit.utils import async_http
+
+    url = _datasets_url(subscription_id, region, resource_group, workspace, f"datasets/{dataset_id}")
+    status, payload = await async_http.get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
+    return _dataset_from(payload) if status == 200 else None
+
+
+def _datastore_from(props: dict) -> AzureDatastore:
+    return AzureDatastore(
+        name=str(props.get("name", "") or ""),
+        account_name=str(props.get("accountName", "") or ""),
+        container_name=str(props.get("containerName", "") or ""),
+        endpoint=str(props.get("endpoint", "") or ""),
+        credential=str(props.get("credential", "") or ""),
+        datastore_type=str(props.get("datastoreType", "") or ""),
     )
-    status, payload = get_json(url, headers=_auth_headers(token))
+
+
+def _datastore_props(ds: dict) -> dict:
+    return ds.get("properties") if isinstance(ds.get("properties"), dict) else ds
+
+
+def get_datastore(token: str, subscription_id: str, region: str, resource_group: str, workspace: str, name: str) -> AzureDatastore | None:
+    url = _workspace_url("datastore", subscription_id, region, resource_group, workspace, f"datastores/{name}")
+    status, payload = get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
     if status != 200 or not isinstance(payload, dict):
         return None
-    props = payload.get("properties") if isinstance(payload.get("properties"), dict) else payload
-    return {
-        "account_name": str(props.get("accountName", "") or ""),
-        "container_name": str(props.get("containerName", "") or ""),
-        "endpoint": str(props.get("endpoint", "") or ""),
-        "credential": str(props.get("credential", "") or ""),
-        "datastore_type": str(props.get("datastoreType", "") or ""),
-        "name": str(props.get("name", "") or ""),
-    }
-
-
-def list_datastores(token: str, subscription_id: str, region: str, resource_group: str, workspace: str) -> list[dict]:
-    url = (
-        f"https://{region}.experiments.azureml.net/datastore/v1.0/subscriptions/{subscription_id}/resourceGroups/{resource_group}/"
-        f"providers/Microsoft.MachineLearningServices/workspaces/{workspace}/datastores?count=1000"
-    )
-    status, payload = get_json(url, headers=_auth_headers(token))
+    return _datastore_from(_datastore_props(payload))
+
+
+async def get_datastore_async(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str, name: str
+) -> AzureDatastore | None:
+    from pymlokit.utils import async_http
+
+    url = _workspace_url("datastore", subscription_id, region, resource_group, workspace, f"datastores/{name}")
+    status, payload = await async_http.get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("AzureML", status, (401,))
     if status != 200 or not isinstance(payload, dict):
+        return None
+    return _datastore_from(_datastore_props(payload))
+
+
+def _datastores_from(payload: Any) -> list[AzureDatastore]:
+    if not isinstance(payload, dict):
         return []
-    out = []
     v = payload.get("value")
-    if isinstance(v, list):
-        for ds in v:
-            if not isinstance(ds, dict):
-                continue
-            props = ds.get("properties") if isinstance(ds.get("properties"), dict) else ds
-            out.append(
-                {
-                    "account_name": str(props.get("accountName", "") or ""),
-                    "container_name": str(props.get("containerName", "") or ""),
-                    "endpoint": str(props.get("endpoint", "") or ""),
-                    "credential": str(props.get("credential", "") or ""),
-                    "datastore_type": str(props.get("datastoreType", "") or ""),
-                    "name": str(props.get("name", "") or ""),
-                }
-            )
-    return out
+    if not isinstance(v, list):
+        return []
+    return [_datastore_from(_datastore_props(ds)) for ds in v if isinstance(ds, dict)]
+
+
+def iter_datastores(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> Iterator[AzureDatastore]:
+    """Yield the workspace's datastores 1000 per page, following ``continuationToken``; first occurrence of each name."""
+    url = _workspace_url("datastore", subscription_id, region, resource_group, workspace, "datastores?count=1000")
+    return unique_by(prefetch_pages(_page_fetcher(token), _datastores_from, url), "name")
+
+
+def list_datastores(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> list[AzureDatastore]:
+    return list(iter_datastores(token, subscription_id, region, resource_group, workspace))
 
 
-def download_blob(storage_account: str, storage_key_b64: str, container: str, relative_path: str) -> bytes:
+async def list_datastores_async(
+    token: str, subscription_id: str, region: str, resource_group: str, workspace: str
+) -> list[AzureDatastore]:
+    url = _workspace_url("datastore", subscription_id, region, resource_group, workspace, "datastores?count=1000")
+    return list(unique_by(await prefetch_pages_async(_page_fetcher_async(token), _datastores_from, url), "name"))
+
+
+def download_blob(storage_account: str, storage_key_b64: str, container: str, relative_path: str, out_path: str) -> int:
     rel = relative_path.lstrip("/")
     url = f"https://{storage_account}.blob.core.windows.net/{container}/{rel}"
-    now = datetime.now(timezone.utc)
-    headers = {"Content-Type": "application/json", **storage_headers_common(now)}
-    headers["Authorization"] = shared_key_authorization(
-        storage_account_name=storage_account,
-        storage_account_key_b64=storage_key_b64,
-        now_utc=now,
-        method="GET",
-        url=url,
-        headers=headers,
-        content_length=None,
+
+    def sign(method: str, headers: dict[str, str]) -> dict[str, str]:
+        now = datetime.now(timezone.utc)
+        signed = {**headers, **storage_headers_common(now)}
+        signed["Authorization"] = shared_key_authorization(
+            storage_account_name=storage_account,
+            storage_account_key_b64=storage_key_b64,
+            now_utc=now,
+            method=method,
+            url=url,
+            headers=signed,
+            content_length=None,
+        )
+        return signed
+
+    # Range requests go in x-ms-range so they are covered by the SharedKey signature.
+    status, written = download_file(
+        url,
+        out_path,
+        headers={"Content-Type": "application/json"},
+        sign=sign,
+        range_header="x-ms-range",
+        retry=RETRY_POLICY,
     )
-    resp = request("GET", url, headers=headers)
-    if resp.status != 200:
-        raise RuntimeError(f"Azure Blob returned HTTP {resp.status}")
-    return resp.body
+    if status != 200:
+        raise RuntimeError(f"Azure Blob returned HTTP {status}")
+    return written
 
 
 def upload_blob(
@@ -348,7 +569,7 @@ def upload_blob(
         headers=headers,
         content_length=len(content),
     )
-    resp = request("PUT", url, headers=headers, body=content)
+    resp = request("PUT", url, headers=headers, body=content, retry=RETRY_POLICY)
     if resp.status not in (200, 201):
         raise RuntimeError(f"Azure Blob returned HTTP {resp.status}")
  
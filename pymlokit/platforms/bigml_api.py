@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterator, NamedTuple
 
+from pymlokit.utils.auth import raise_for_status
 from pymlokit.utils.http import get_json, request
+from pymlokit.utils.iterators import unique_by
+from pymlokit.utils.transfer import download_file
+
+# BigML's maximum ``limit``; the default page is 20 objects.
+PAGE_SIZE = 200
 
 
 @dataclass(frozen=True)
@@ -11,6 +18,31 @@ class BigMLCreds:
     api_key: str
 
 
+class BigMLProject(NamedTuple):
+    id: str
+    name: str
+    creator: str
+    visibility: str
+    created: str
+
+
+class BigMLModel(NamedTuple):
+    id: str
+    name: str
+    creator: str
+    visibility: str
+    created: str
+    updated: str
+
+
+class BigMLDataset(NamedTuple):
+    id: str
+    name: str
+    visibility: str
+    created: str
+    updated: str
+
+
 def _parse_creds(credential: str) -> BigMLCreds:
     parts = credential.split(";")
     if len(parts) < 2:
@@ -18,13 +50,6 @@ def _parse_creds(credential: str) -> BigMLCreds:
     return BigMLCreds(username=parts[0], api_key=parts[1])
 
 
-def creds_valid(credential: str, base_url: str = "https://bigml.io") -> bool:
-    c = _parse_creds(credential)
-    url = f"{base_url}/source?username={c.username}&api_key={c.api_key}"
-    resp = request("GET", url, headers={"Content-Type": "application/json"})
-    return resp.status == 200
-
-
 def _objects(payload: object) -> list[dict]:
     if isinstance(payload, dict):
         objs = payload.get("objects")
@@ -35,114 +60,103 @@ def _objects(payload: object) -> list[dict]:
     return []
 
 
-def list_projects(credential: str, base_url: str = "https://bigml.io") -> list[dict]:
-    c = _parse_creds(credential)
-    status, payload = get_json(f"{base_url}/project?username={c.username}&api_key={c.api_key}")
-    if status != 200:
-        raise RuntimeError(f"BigML returned HTTP {status}")
-    out = []
-    for o in _objects(payload):
-        rid = str(o.get("resource", "") or "")
-        project_id = rid.split("/", 1)[1] if "/" in rid else rid
-        visibility = "Private" if bool(o.get("private", False)) else "Public"
-        out.append(
-            {
-                "name": o.get("name", ""),
-                "creator": o.get("creator", ""),
-                "visibility": visibility,
-                "created": o.get("created", ""),
-                "id": project_id,
-            }
-        )
-    seen = set()
-    deduped = []
-    for p in out:
-        pid = p.get("id", "")
-        if not pid or pid in seen:
-            continue
-        seen.add(pid)
-        deduped.append(p)
-    return deduped
-
-
-def list_models(credential: str, base_url: str = "https://bigml.io") -> list[dict]:
-    c = _parse_creds(credential)
-    status, payload = get_json(f"{base_url}/model?username={c.username}&api_key={c.api_key}")
-    if status != 200:
-        raise RuntimeError(f"BigML returned HTTP {status}")
-    out = []
-    for o in _objects(payload):
-        rid = str(o.get("resource", "") or "")
-        model_id = rid.split("/", 1)[1] if "/" in rid else rid
-        visibility = "Private" if bool(o.get("private", False)) else "Public"
-        out.append(
-            {
-                "name": o.get("name", ""),
-                "creator": o.get("creator", ""),
-                "visibility": visibility,
-                "created": o.get("created", ""),
-                "updated": o.get("updated", ""),
-                "id": model_id,
-            }
-        )
-    seen = set()
-    deduped = []
-    for m in out:
-        mid = m.get("id", "")
-        if not mid or mid in seen:
-            continue
-        seen.add(mid)
-        deduped.append(m)
-    return deduped
-
-
-def list_datasets(credential: str, base_url: str = "https://bigml.io") -> list[dict]:
-    c = _parse_creds(credential)
-    status, payload = get_json(f"{base_url}/dataset?username={c.username}&api_key={c.api_key}")
-    if status != 200:
-        raise RuntimeError(f"BigML returned HTTP {status}")
-    out = []
-    for o in _objects(payload):
-        rid = str(o.get("resource", "") or "")
-        dataset_id = rid.split("/", 1)[1] if "/" in rid else rid
-        visibility = "Private" if bool(o.get("private", False)) else "Public"
-        out.append(
-            {
-                "name": o.get("name", ""),
-                "visibility": visibility,
-                "created": o.get("created", ""),
-                "updated": o.get("updated", ""),
-                "id": dataset_id,
-            }
-        )
-    seen = set()
-    deduped = []
-    for d in out:
-        did = d.get("id", "")
-        if not did or did in seen:
-            continue
-        seen.add(did)
-        deduped.append(d)
-    return deduped
-
-
-def download_model_pmml(credential: str, model_id: str) -> str:
-    c = _parse_creds(credential)
-    url = f"https://bigml.io/model/{model_id}?username={c.username}&api_key={c.api_key}&pmml=yes"
-    status, payload = get_json(url)
-    if status != 200:
-        raise RuntimeError(f"BigML returned HTTP {status}")
-    if isinstance(payload, dict):
-        pmml = payload.get("pmml")
-        return "" if pmml is None else str(pmml)
-    return ""
-
-
-def download_dataset_bytes(credential: str, dataset_id: str) -> bytes:
-    c = _parse_creds(credential)
-    url = f"https://bigml.io/dataset/{dataset_id}/download?username={c.username}&api_key={c.api_key}"
-    resp = request("GET", url, headers={"Content-Type": "application/json"})
-    if resp.status != 200:
-        raise RuntimeError(f"BigML returned HTTP {resp.status}")
-    return resp.body
- 
+def _resource_id(o: dict) -> str:
+    rid = str(o.get("resource", "") or "")
+    return rid.split("/", 1)[1] if "/" in rid else rid
+
+
+def _visibility(o: dict) -> str:
+    return "Private" if bool(o.get("private", False)) else "Public"
+
+
+def _project_from(o: dict) -> BigMLProject:
+    return BigMLProject(
+        id=_resource_id(o),
+        name=str(o.get("name", "") or ""),
+        creator=str(o.get("creator", "") or ""),
+        visibility=_visibility(o),
+        created=str(o.get("created", "") or ""),
+    )
+
+
+def _model_from(o: dict) -> BigMLModel:
+    return BigMLModel(
+        id=_resource_id(o),
+        name=str(o.get("name", "") or ""),
+        creator=str(o.get("creator", "") or ""),
+        visibility=_visibility(o),
+        created=str(o.get("created", "") or ""),
+        updated=str(o.get("updated", "") or ""),
+    )
+
+
+def _dataset_from(o: dict) -> BigMLDataset:
+    return BigMLDataset(
+        id=_resource_id(o),
+        name=str(o.get("name", "") or ""),
+        visibility=_visibility(o),
+        created=str(o.get("created", "") or ""),
+        updated=str(o.get("updated", "") or ""),
+    )
+
+
+class BigMLClient:
+    """A session against the BigML API; the credential is parsed and its query string built once."""
+
+    def __init__(self, credential: str, base_url: str = "https://bigml.io") -> None:
+        self.creds = _parse_creds(credential)
+        self.base_url = base_url
+        self._auth_query = f"username={self.creds.username}&api_key={self.creds.api_key}"
+
+    def creds_valid(self) -> bool:
+        resp = request("GET", f"{self.base_url}/source?{self._auth_query}", headers={"Content-Type": "application/json"})
+        return resp.status == 200
+
+    def _iter_objects(self, resource: str) -> Iterator[dict]:
+        """Yield every ``resource`` object, one page per request, following ``meta.next`` until the last page."""
+        offset = 0
+        while True:
+            status, payload = get_json(
+                f"{self.base_url}/{resource}?{self._auth_query}&limit={PAGE_SIZE}&offset={offset}"
+            )
+            raise_for_status("BigML", status)
+            objs = _objects(payload)
+            yield from objs
+            meta = payload.get("meta") if isinstance(payload, dict) else None
+            if not objs or not isinstance(meta, dict) or not meta.get("next"):
+                return
+            offset += len(objs)
+
+    def iter_projects(self) -> Iterator[BigMLProject]:
+        return unique_by(map(_project_from, self._iter_objects("project")), "id")
+
+    def list_projects(self) -> list[BigMLProject]:
+        return list(self.iter_projects())
+
+    def iter_models(self) -> Iterator[BigMLModel]:
+        return unique_by(map(_model_from, self._iter_objects("model")), "id")
+
+    def list_models(self) -> list[BigMLModel]:
+        return list(self.iter_models())
+
+    def iter_datasets(self) -> Iterator[BigMLDataset]:
+        return unique_by(map(_dataset_from, self._iter_objects("dataset")), "id")
+
+    def list_datasets(self) -> list[BigMLDataset]:
+        return list(self.iter_datasets())
+
+    def download_model_pmml(self, model_id: str) -> str:
+        url = f"{self.base_url}/model/{model_id}?{self._auth_query}&pmml=yes"
+        status, payload = get_json(url)
+        raise_for_status("BigML", status, auth_statuses=(401,))
+        if isinstance(payload, dict):
+            pmml = payload.get("pmml")
+            return "" if pmml is None else str(pmml)
+        return ""
+
+    def download_dataset_file(self, dataset_id: str, out_path: str) -> int:
+        url = f"{self.base_url}/dataset/{dataset_id}/download?{self._auth_query}"
+        status, written = download_file(url, out_path, headers={"Content-Type": "application/json"})
+        raise_for_status("BigML", status, auth_statuses=(401,))
+        return written
+     
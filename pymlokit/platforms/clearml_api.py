@@ -3,17 +3,51 @@ from __future__ import annotations
 import base64
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator, NamedTuple
 
-from pymlokit.utils.http import get_json, post_json, request
+from pymlokit.utils import token_cache
+from pymlokit.utils.http import DEFAULT_RETRY, RetryPolicy, download_to_file, get_json, post_json
 
 
+# Every ClearML API call, reads included, is a POST RPC, so POST counts as safe to re-send.
+RETRY_POLICY = RetryPolicy(idempotent_methods=DEFAULT_RETRY.idempotent_methods | {"POST"})
+
+# Rows per ``*.get_all`` request; listings page through until a short page.
+PAGE_SIZE = 500
+
 @dataclass(frozen=True)
 class ClearMLCreds:
     access_key: str
     secret_key: str
 
 
+class ClearMLProject(NamedTuple):
+    id: str
+    name: str
+    created: str
+    last_update: str
+    stats: dict
+
+
+class ClearMLModel(NamedTuple):
+    id: str
+    name: str
+    uri: str
+    created: str
+    project: str
+    framework: str
+    labels: dict
+
+
+class ClearMLTask(NamedTuple):
+    id: str
+    name: str
+    created: str
+    status: str
+    project: str
+    type: str
+
+
 def _parse_creds(credential: str) -> ClearMLCreds:
     parts = credential.split(";")
     if len(parts) < 2:
@@ -21,172 +55,160 @@ def _parse_creds(credential: str) -> ClearMLCreds:
     return ClearMLCreds(access_key=parts[0], secret_key=parts[1])
 
 
-def _get_token(credential: str, api_url: str) -> str:
-    c = _parse_creds(credential)
-    raw = f"{c.access_key}:{c.secret_key}".encode("utf-8")
-    auth = base64.b64encode(raw).decode("utf-8")
-    
-    url = f"{api_url}/auth.login"
-    status, payload = post_json(
-        url,
-        {},
-        headers={"Authorization": f"Basic {auth}"},
-    )
-    
-    if status != 200 or not isinstance(payload, dict):
-        raise RuntimeError(f"ClearML Login Failed. Status: {status}")
-        
-    data = payload.get("data")
-    if isinstance(data, dict):
-        return str(data.get("token", "") or "")
-    return ""
-
+class ClearMLClient:
+    """A session against one ClearML API server.
 
-def creds_valid(credential: str, api_url: str) -> bool:
-    try:
-        token = _get_token(credential, api_url)
-        return bool(token)
-    except Exception:
-        return False
+    The ``auth.login`` token is shared through ``token_cache`` by every client for
+    the same access key, secret and API URL, and is only fetched again when it
+    is about to expire or the server rejects it with a 401.
+    """
 
+    def __init__(self, credential: str, api_url: str) -> None:
+        self.creds = _parse_creds(credential)
+        self.api_url = api_url
+        self._cache_key = token_cache.cache_key("clearml", self.creds.access_key, self.creds.secret_key, api_url)
 
-def list_projects(credential: str, api_url: str) -> list[dict]:
-    token = _get_token(credential, api_url)
-    if not token:
-        raise RuntimeError("Failed to authenticate with ClearML")
-        
-    status, payload = post_json(
-        f"{api_url}/projects.get_all",
-        {"order_by": ["last_update"]},
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    
-    if status != 200:
-        raise RuntimeError(f"ClearML returned HTTP {status}")
+    def _login(self) -> str:
+        raw = f"{self.creds.access_key}:{self.creds.secret_key}".encode("utf-8")
+        auth = base64.b64encode(raw).decode("utf-8")
         
-    out = []
-    data = payload.get("data") if isinstance(payload, dict) else {}
-    projects = data.get("projects") if isinstance(data, dict) else []
-    
-    if isinstance(projects, list):
-        for p in projects:
-            if not isinstance(p, dict):
-                continue
-            out.append({
-                "id": str(p.get("id", "")),
-                "name": str(p.get("name", "")),
-                "created": str(p.get("created", "")),
-                "last_update": str(p.get("last_update", "")),
-                "stats": p.get("stats", {}),
-            })
-    return out
-
-
-def list_models(credential: str, api_url: str, project_id: str = "") -> list[dict]:
-    token = _get_token(credential, api_url)
-    if not token:
-        raise RuntimeError("Failed to authenticate with ClearML")
+        url = f"{self.api_url}/auth.login"
+        status, payload = post_json(
+            url,
+            {},
+            headers={"Authorization": f"Basic {auth}"},
+            retry=RETRY_POLICY,
+        )
         
-    body = {"order_by": ["-last_update"], "page_size": 100}
-    if project_id:
-        body["project"] = [project_id]
+        if status != 200 or not isinstance(payload, dict):
+            raise RuntimeError(f"ClearML Login Failed. Status: {status}")
+            
+        data = payload.get("data")
+        if isinstance(data, dict):
+            return str(data.get("token", "") or "")
+        return ""
+
+    def token(self) -> str:
+        token = token_cache.get(self._cache_key)
+        if not token:
+            token = self._login()
+            if token:
+                token_cache.put(self._cache_key, token)
+        return token
+
+    def _post_once(self, endpoint: str, body: dict) -> tuple[int, Any]:
+        token = self.token()
+        if not token:
+            raise RuntimeError("Failed to authenticate with ClearML")
+        return post_json(
+            f"{self.api_url}/{endpoint}",
+            body,
+            headers={"Authorization": f"Bearer {token}"},
+            retry=RETRY_POLICY,
+        )
+
+    def _post(self, endpoint: str, body: dict) -> tuple[int, Any]:
+        status, payload = self._post_once(endpoint, body)
+        if status == 401:
+            # A cached token may have been revoked server-side; log in again once.
+            token_cache.invalidate(self._cache_key)
+            status, payload = self._post_once(endpoint, body)
+        return status, payload
+
+    def creds_valid(self) -> bool:
+        try:
+            return bool(self.token())
+        except Exception:
+            return False
+
+    def _iter_all(self, endpoint: str, body: dict, key: str) -> Iterator[dict]:
+        """Yield ``data[key]`` from a ``*.get_all`` call, one ``page`` per request until a short page."""
+        page = 0
+        while True:
+            status, payload = self._post(endpoint, {**body, "page": page, "page_size": PAGE_SIZE})
+
+            if status != 200:
+                raise RuntimeError(f"ClearML returned HTTP {status}")
+
+            data = payload.get("data") if isinstance(payload, dict) else {}
+            items = data.get(key) if isinstance(data, dict) else []
+            if not isinstance(items, list):
+                return
+            for item in items:
+                if isinstance(item, dict):
+                    yield item
+            if len(items) < PAGE_SIZE:
+                return
+            page += 1
+
+    def iter_projects(self) -> Iterator[ClearMLProject]:
+        for p in self._iter_all("projects.get_all", {"order_by": ["last_update"]}, "projects"):
+            yield ClearMLProject(
+                id=str(p.get("id", "") or ""),
+                name=str(p.get("name", "") or ""),
+                created=str(p.get("created", "") or ""),
+                last_update=str(p.get("last_update", "") or ""),
+                stats=p.get("stats", {}),
+            )
+
+    def list_projects(self) -> list[ClearMLProject]:
+        return list(self.iter_projects())
+
+    def iter_models(self, project_id: str = "") -> Iterator[ClearMLModel]:
+        body: dict[str, Any] = {"order_by": ["-last_update"]}
+        if project_id:
+            body["project"] = [project_id]
+
+        for m in self._iter_all("models.get_all", body, "models"):
+            yield ClearMLModel(
+                id=str(m.get("id", "") or ""),
+                name=str(m.get("name", "") or ""),
+                uri=str(m.get("uri", "") or ""),
+                created=str(m.get("created", "") or ""),
+                project=str(m.get("project", "") or ""),
+                framework=str(m.get("framework", "") or ""),
+                labels=m.get("labels", {}),
+            )
+
+    def list_models(self, project_id: str = "") -> list[ClearMLModel]:
+        return list(self.iter_models(project_id))
+
+    def iter_datasets(self, project_id: str = "") -> Iterator[ClearMLTask]:
+        # ClearML Datasets are typically Tasks with type "data_processing" or created via clearml-data
+        # We will search for tasks with type "data_processing" or specific tags.
+        body: dict[str, Any] = {"type": ["data_processing"], "order_by": ["-last_update"]}
+        if project_id:
+            body["project"] = [project_id]
+
+        for t in self._iter_all("tasks.get_all", body, "tasks"):
+            yield ClearMLTask(
+                id=str(t.get("id", "") or ""),
+                name=str(t.get("name", "") or ""),
+                created=str(t.get("created", "") or ""),
+                status=str(t.get("status", "") or ""),
+                project=str(t.get("project", "") or ""),
+                type=str(t.get("type", "") or ""),
+            )
+
+    def list_datasets(self, project_id: str = "") -> list[ClearMLTask]:
+        return list(self.iter_datasets(project_id))
+
+    def get_model_url(self, model_id: str) -> str:
+        status, payload = self._post("models.get_by_id", {"models": [model_id]})
         
-    status, payload = post_json(
-        f"{api_url}/models.get_all",
-        body,
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    
-    if status != 200:
-        raise RuntimeError(f"ClearML returned HTTP {status}")
-        
-    out = []
-    data = payload.get("data") if isinstance(payload, dict) else {}
-    models = data.get("models") if isinstance(data, dict) else []
-    
-    if isinstance(models, list):
-        for m in models:
-            if not isinstance(m, dict):
-                continue
-            out.append({
-                "id": str(m.get("id", "")),
-                "name": str(m.get("name", "")),
-                "uri": str(m.get("uri", "")),
-                "created": str(m.get("created", "")),
-                "project": str(m.get("project", "")),
-                "framework": str(m.get("framework", "")),
-                "labels": m.get("labels", {}),
-            })
-    return out
-
-
-def list_datasets(credential: str, api_url: str, project_id: str = "") -> list[dict]:
-    # ClearML Datasets are typically Tasks with type "data_processing" or created via clearml-data
-    # We will search for tasks with type "data_processing" or specific tags.
-    token = _get_token(credential, api_url)
-    if not token:
-        raise RuntimeError("Failed to authenticate with ClearML")
-        
-    body = {
-        "type": ["data_processing"], 
-        "order_by": ["-last_update"], 
-        "page_size": 100
-    }
-    if project_id:
-        body["project"] = [project_id]
-        
-    status, payload = post_json(
-        f"{api_url}/tasks.get_all",
-        body,
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    
-    if status != 200:
-        raise RuntimeError(f"ClearML returned HTTP {status}")
-        
-    out = []
-    data = payload.get("data") if isinstance(payload, dict) else {}
-    tasks = data.get("tasks") if isinstance(data, dict) else []
-    
-    if isinstance(tasks, list):
-        for t in tasks:
-            if not isinstance(t, dict):
-                continue
-            out.append({
-                "id": str(t.get("id", "")),
-                "name": str(t.get("name", "")),
-                "created": str(t.get("created", "")),
-                "status": str(t.get("status", "")),
-                "project": str(t.get("project", "")),
-                "type": str(t.get("type", "")),
-            })
-    return out
-
-
-def get_model_url(credential: str, api_url: str, model_id: str) -> str:
-    token = _get_token(credential, api_url)
-    if not token:
-        raise RuntimeError("Failed to authenticate with ClearML")
-        
-    status, payload = post_json(
-        f"{api_url}/models.get_by_id",
-        {"models": [model_id]},
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    
-    if status != 200:
-        raise RuntimeError(f"ClearML returned HTTP {status}")
-        
-    data = payload.get("data") if isinstance(payload, dict) else {}
-    models = data.get("models") if isinstance(data, dict) else []
-    if isinstance(models, list) and len(models) > 0:
-        m = models[0]
-        if isinstance(m, dict):
-            return str(m.get("uri", "") or "")
-    return ""
-
-
-def download_url_bytes(url: str) -> bytes:
+        if status != 200:
+            raise RuntimeError(f"ClearML returned HTTP {status}")
+            
+        data = payload.get("data") if isinstance(payload, dict) else {}
+        models = data.get("models") if isinstance(data, dict) else []
+        if isinstance(models, list) and len(models) > 0:
+            m = models[0]
+            if isinstance(m, dict):
+                return str(m.get("uri", "") or "")
+        return ""
+
+
+def download_url_to_file(url: str, out_path: str) -> int:
     # If it's a local file path (file://), we can't download it over HTTP
     # If it's s3:// or gs://, we need specialized handling, but for now we assume HTTP(S)
     if url.startswith("file://") or url.startswith("/"):
@@ -194,7 +216,7 @@ def download_url_bytes(url: str) -> bytes:
     if url.startswith("s3://") or url.startswith("gs://") or url.startswith("azure://"):
         raise ValueError(f"Cloud storage URL not supported directly via HTTP download: {url}")
         
-    resp = request("GET", url)
-    if resp.status != 200:
-        raise RuntimeError(f"Download returned HTTP {resp.status}")
-    return resp.body
+    status, written = download_to_file(url, out_path, retry=RETRY_POLICY)
+    if status != 200:
+        raise RuntimeError(f"Download returned HTTP {status}")
+    return written
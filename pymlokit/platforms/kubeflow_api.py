@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pymlokit.utils.auth import bearer_headers, raise_for_auth, token_expired
 from pymlokit.utils.http import get_json
 
 
@@ -8,11 +9,13 @@ def _get_headers(credential: str) -> dict[str, str]:
     if not credential:
         return {}
     if credential.lower().startswith("bearer "):
-        return {"Authorization": credential}
-    return {"Authorization": f"Bearer {credential}"}
+        credential = credential[7:]
+    return bearer_headers(credential)
 
 
 def creds_valid(credential: str, api_url: str) -> bool:
+    if token_expired(credential):
+        return False
     headers = _get_headers(credential)
     try:
         # Check /apis/v1beta1/pipelines or similar
@@ -33,6 +36,7 @@ def list_pipelines(credential: str, api_url: str) -> list[dict]:
     # Try v1beta1
     url = f"{api_url}/apis/v1beta1/pipelines"
     status, payload = get_json(url, headers=headers)
+    raise_for_auth("Kubeflow", status)
     
     if status != 200:
         # Try v2beta1
@@ -63,6 +67,7 @@ def list_runs(credential: str, api_url: str) -> list[dict]:
     # Try v1beta1
     url = f"{api_url}/apis/v1beta1/runs"
     status, payload = get_json(url, headers=headers)
+    raise_for_auth("Kubeflow", status)
     
     if status != 200:
         # Try v2beta1
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import base64
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
-from typing import Any
-from urllib.parse import quote
+from typing import Any, Iterator, NamedTuple
+from urllib.parse import quote, urlencode
 
-from pymlokit.utils.http import get_json, request
+from pymlokit.utils.auth import raise_for_status
+from pymlokit.utils.http import get_json
+from pymlokit.utils.iterators import ContextThreadPool, prefetch_pages, prefetch_pages_async, unique_by
+from pymlokit.utils.transfer import download_file
+
+# Directory listings in flight at once while walking an artifact tree.
+ARTIFACT_LIST_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -14,6 +22,15 @@ class MLflowCreds:
     password: str
 
 
+class MLflowModelVersion(NamedTuple):
+    name: str
+    version: str
+    status: str
+    description: str
+    artifact_location: str
+    run_id: str
+
+
 def _parse_creds(credential: str) -> MLflowCreds:
     parts = credential.split(";")
     if len(parts) < 2:
@@ -21,97 +38,250 @@ def _parse_creds(credential: str) -> MLflowCreds:
     return MLflowCreds(username=parts[0], password=parts[1])
 
 
-def _auth_header(credential: str) -> str:
-    c = _parse_creds(credential)
+def _auth_header(c: MLflowCreds) -> str:
     raw = f"{c.username}:{c.password}".encode("utf-8")
     token = base64.b64encode(raw).decode("utf-8")
     return f"Basic {token}"
 
 
-def creds_valid(credential: str, url: str) -> bool:
-    status, _ = get_json(
-        f"{url}/api/2.0/mlflow/model-versions/search",
-        headers={"Authorization": _auth_header(credential)},
+def _model_version_from(mv: dict) -> MLflowModelVersion:
+    return MLflowModelVersion(
+        name=str(mv.get("name", "") or ""),
+        version=str(mv.get("version", "") or ""),
+        status=str(mv.get("status", "") or ""),
+        description=str(mv.get("description", "") or ""),
+        artifact_location=str(mv.get("source", "") or ""),
+        run_id=str(mv.get("run_id", "") or ""),
     )
-    return status == 200
 
 
-def list_models(credential: str, url: str) -> list[dict]:
-    status, payload = get_json(
-        f"{url}/api/2.0/mlflow/model-versions/search",
-        headers={"Authorization": _auth_header(credential)},
-    )
-    if status != 200:
-        raise RuntimeError(f"MLflow returned HTTP {status}")
+def _models_from(payload: Any) -> list[MLflowModelVersion]:
     models = []
     if isinstance(payload, dict) and isinstance(payload.get("model_versions"), list):
         for mv in payload["model_versions"]:
-            if not isinstance(mv, dict):
-                continue
-            models.append(
-                {
-                    "name": mv.get("name", ""),
-                    "version": mv.get("version", ""),
-                    "status": mv.get("status", ""),
-                    "description": mv.get("description", ""),
-                    "artifact_location": mv.get("source", ""),
-                    "run_id": mv.get("run_id", ""),
-                }
-            )
-    seen = set()
-    deduped = []
-    for m in models:
-        name = str(m.get("name", "") or "")
-        if not name or name in seen:
-            continue
-        seen.add(name)
-        deduped.append(m)
-    return deduped
-
-
-def get_artifact_root_dir(credential: str, url: str, run_id: str) -> str:
-    status, payload = get_json(
-        f"{url}/api/2.0/mlflow/artifacts/list?run_id={quote(run_id)}",
-        headers={"Authorization": _auth_header(credential)},
-    )
-    if status != 200:
-        raise RuntimeError(f"MLflow returned HTTP {status}")
+            if isinstance(mv, dict):
+                models.append(_model_version_from(mv))
+    return models
+
+
+def _version_number(mv: MLflowModelVersion) -> int:
+    return int(mv.version) if mv.version.isdigit() else -1
+
+
+def _filter_string(value: str) -> str:
+    """``value`` as a quoted string literal for an MLflow search filter."""
+    quote_char = '"' if "'" in value else "'"
+    return f"{quote_char}{value}{quote_char}"
+
+
+def _artifacts_url(url: str, run_id: str, path: str | None = None, page_token: str = "") -> str:
+    q = f"{url}/api/2.0/mlflow/artifacts/list?run_id={quote(run_id)}"
+    if path is not None:
+        q = f"{q}&path={quote(path)}"
+    return f"{q}&page_token={quote(page_token)}" if page_token else q
+
+
+def _artifact_entries(payload: Any) -> list[tuple[str, bool]]:
+    out = []
     if isinstance(payload, dict) and isinstance(payload.get("files"), list):
         for f in payload["files"]:
             if isinstance(f, dict) and f.get("path"):
-                return str(f["path"])
-    return ""
-
-
-def list_artifacts_recursive(credential: str, url: str, run_id: str, path: str) -> list[dict]:
-    out: list[dict] = []
-    queue = [path]
-    while queue:
-        p = queue.pop(0)
-        q = f"{url}/api/2.0/mlflow/artifacts/list?run_id={quote(run_id)}&path={quote(p)}"
-        status, payload = get_json(q, headers={"Authorization": _auth_header(credential)})
-        if status != 200:
-            raise RuntimeError(f"MLflow returned HTTP {status}")
-        if not (isinstance(payload, dict) and isinstance(payload.get("files"), list)):
-            continue
-        for f in payload["files"]:
-            if not isinstance(f, dict):
-                continue
-            fp = str(f.get("path", "") or "")
-            is_dir = bool(f.get("is_dir", False))
-            if not fp:
-                continue
-            if is_dir:
-                queue.append(fp)
-            else:
-                out.append({"path": fp})
+                out.append((str(f["path"]), bool(f.get("is_dir", False))))
     return out
 
 
-def download_artifact(credential: str, url: str, run_id: str, path: str) -> bytes:
-    q = f"{url}/get-artifact?path={quote(path)}&run_id={quote(run_id)}"
-    resp = request("GET", q, headers={"Authorization": _auth_header(credential)})
-    if resp.status != 200:
-        raise RuntimeError(f"MLflow returned HTTP {resp.status}")
-    return resp.body
- 
+def _next_page_token(payload: Any) -> str:
+    return str(payload.get("next_page_token", "") or "") if isinstance(payload, dict) else ""
+
+
+class MLflowClient:
+    """A session against one MLflow tracking server.
+
+    The credential is parsed once and the auth header reused for every call. The
+    first page of the model-version search behind the credential check is kept,
+    so a following ``list_models`` does not repeat it.
+    """
+
+    def __init__(self, credential: str, url: str) -> None:
+        self.creds = _parse_creds(credential)
+        self.url = url
+        self.headers = {"Authorization": _auth_header(self.creds)}
+        self._search_url = f"{url}/api/2.0/mlflow/model-versions/search"
+        self._model_versions: tuple[int, Any] | None = None
+
+    def _search_model_versions(self) -> tuple[int, Any]:
+        if self._model_versions is None:
+            self._model_versions = get_json(self._search_url, headers=self.headers)
+        return self._model_versions
+
+    async def _search_model_versions_async(self) -> tuple[int, Any]:
+        from pymlokit.utils import async_http
+
+        if self._model_versions is None:
+            self._model_versions = await async_http.get_json(self._search_url, headers=self.headers)
+        return self._model_versions
+
+    def _next_search_page(self, payload: Any) -> str:
+        token = _next_page_token(payload)
+        return f"{self._search_url}?page_token={quote(token)}" if token else ""
+
+    def _search_page(self, url: str) -> tuple[Any, str]:
+        if url == self._search_url:
+            status, payload = self._search_model_versions()
+        else:
+            status, payload = get_json(url, headers=self.headers)
+        raise_for_status("MLflow", status)
+        return payload, self._next_search_page(payload)
+
+    async def _search_page_async(self, url: str) -> tuple[Any, str]:
+        from pymlokit.utils import async_http
+
+        if url == self._search_url:
+            status, payload = await self._search_model_versions_async()
+        else:
+            status, payload = await async_http.get_json(url, headers=self.headers)
+        raise_for_status("MLflow", status)
+        return payload, self._next_search_page(payload)
+
+    def creds_valid(self) -> bool:
+        status, _ = self._search_model_versions()
+        return status == 200
+
+    def iter_models(self) -> Iterator[MLflowModelVersion]:
+        """Yield one model version per registered model name (the first the search returns).
+
+        Further pages of the search are followed through ``page_token``.
+        """
+        return unique_by(prefetch_pages(self._search_page, _models_from, self._search_url), "name")
+
+    def list_models(self) -> list[MLflowModelVersion]:
+        return list(self.iter_models())
+
+    async def list_models_async(self) -> list[MLflowModelVersion]:
+        versions = await prefetch_pages_async(self._search_page_async, _models_from, self._search_url)
+        return list(unique_by(versions, "name"))
+
+    def _get(self, endpoint: str, **params: str) -> Any:
+        """GET an MLflow REST endpoint; None when the named resource does not exist."""
+        status, payload = get_json(f"{self.url}/api/2.0/mlflow/{endpoint}?{urlencode(params)}", headers=self.headers)
+        # Unknown models, versions and aliases come back as RESOURCE_DOES_NOT_EXIST (404) or, on
+        # older servers, INVALID_PARAMETER_VALUE (400).
+        if status in (400, 404):
+            return None
+        raise_for_status("MLflow", status)
+        return payload if isinstance(payload, dict) else None
+
+    def get_model_version(self, name: str, version: str = "", alias: str = "") -> MLflowModelVersion | None:
+        """One version of the registered model ``name`` (exact, case-sensitive), looked up directly.
+
+        ``alias`` selects the version it points at, else ``version`` that
+        version number, else the highest-numbered of the model's latest
+        versions. None when the model, version or alias does not exist.
+        """
+        if alias:
+            payload = self._get("registered-models/alias", name=name, alias=alias)
+        elif version:
+            payload = self._get("model-versions/get", name=name, version=version)
+        else:
+            payload = self._get("registered-models/get", name=name)
+            model = payload.get("registered_model") if payload else None
+            latest = model.get("latest_versions") if isinstance(model, dict) else None
+            versions = [_model_version_from(mv) for mv in latest or [] if isinstance(mv, dict)]
+            return max(versions, key=_version_number) if versions else None
+        mv = payload.get("model_version") if payload else None
+        return _model_version_from(mv) if isinstance(mv, dict) else None
+
+    def find_registered_model(self, name: str) -> str:
+        """The registered model named ``name`` ignoring case, found with a server-side ILIKE filter; "" if none."""
+        payload = self._get("registered-models/search", filter=f"name ILIKE {_filter_string(name)}", max_results="100")
+        models = payload.get("registered_models") if payload else None
+        for m in models if isinstance(models, list) else []:
+            # ILIKE also treats % and _ in the name as wildcards.
+            if isinstance(m, dict) and str(m.get("name", "")).lower() == name.lower():
+                return str(m["name"])
+        return ""
+
+    def get_artifact_root_dir(self, run_id: str) -> str:
+        status, payload = get_json(_artifacts_url(self.url, run_id), headers=self.headers)
+        raise_for_status("MLflow", status, auth_statuses=(401,))
+        entries = _artifact_entries(payload)
+        return entries[0][0] if entries else ""
+
+    async def get_artifact_root_dir_async(self, run_id: str) -> str:
+        from pymlokit.utils import async_http
+
+        status, payload = await async_http.get_json(_artifacts_url(self.url, run_id), headers=self.headers)
+        raise_for_status("MLflow", status, auth_statuses=(401,))
+        entries = _artifact_entries(payload)
+        return entries[0][0] if entries else ""
+
+    def _list_artifact_page(self, run_id: str, path: str, page_token: str) -> tuple[list[tuple[str, bool]], str]:
+        status, payload = get_json(_artifacts_url(self.url, run_id, path, page_token), headers=self.headers)
+        raise_for_status("MLflow", status, auth_statuses=(401,))
+        return _artifact_entries(payload), _next_page_token(payload)
+
+    def iter_artifacts(self, run_id: str, path: str, workers: int = ARTIFACT_LIST_WORKERS) -> Iterator[str]:
+        """Yield the path of every file under ``path``, listing up to ``workers`` directories at once.
+
+        Sibling directories (and the further pages of a directory, followed by
+        ``next_page_token``) are listed concurrently, and each file is yielded
+        as soon as its listing arrives, so the walk is in completion order
+        rather than tree order. A failed listing raises here; stopping early
+        drops the listings not yet started.
+        """
+        pending: deque[tuple[str, str]] = deque([(path, "")])
+        # Listing in flight -> the directory it lists.
+        running: dict[Future[tuple[list[tuple[str, bool]], str]], str] = {}
+        pool = ContextThreadPool(max_workers=max(1, workers), thread_name_prefix="pymlokit-artifacts")
+        try:
+            while pending or running:
+                while pending and len(running) < workers:
+                    p, token = pending.popleft()
+                    running[pool.submit(self._list_artifact_page, run_id, p, token)] = p
+                for future in wait(running, return_when=FIRST_COMPLETED).done:
+                    p = running.pop(future)
+                    entries, token = future.result()
+                    if token:
+                        pending.append((p, token))
+                    for fp, is_dir in entries:
+                        if is_dir:
+                            pending.append((fp, ""))
+                        else:
+                            yield fp
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def list_artifacts_recursive(self, run_id: str, path: str) -> list[dict]:
+        """Every file under ``path`` as ``{"path": ...}``, sorted by path."""
+        return [{"path": fp} for fp in sorted(self.iter_artifacts(run_id, path))]
+
+    async def list_artifacts_recursive_async(self, run_id: str, path: str) -> list[dict]:
+        """Like ``list_artifacts_recursive`` but lists each tree level concurrently; same output."""
+        from pymlokit.utils import async_http
+
+        files: list[str] = []
+        level: list[tuple[str, str]] = [(path, "")]
+        while level:
+            results = await async_http.gather_limited(
+                async_http.get_json(_artifacts_url(self.url, run_id, p, token), headers=self.headers)
+                for p, token in level
+            )
+            next_level: list[tuple[str, str]] = []
+            for (p, _), (status, payload) in zip(level, results):
+                raise_for_status("MLflow", status, auth_statuses=(401,))
+                token = _next_page_token(payload)
+                if token:
+                    next_level.append((p, token))
+                for fp, is_dir in _artifact_entries(payload):
+                    if is_dir:
+                        next_level.append((fp, ""))
+                    else:
+                        files.append(fp)
+            level = next_level
+        return [{"path": fp} for fp in sorted(files)]
+
+    def download_artifact(self, run_id: str, path: str, out_path: str) -> int:
+        q = f"{self.url}/get-artifact?path={quote(path)}&run_id={quote(run_id)}"
+        status, written = download_file(q, out_path, headers=self.headers)
+        raise_for_status("MLflow", status, auth_statuses=(401,))
+        return written
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
 
-from pymlokit.utils.http import get_json, request
+from pymlokit.utils.http import download_to_file, get_json, request
+from pymlokit.utils.iterators import unique_by
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 @dataclass(frozen=True)
@@ -14,6 +18,16 @@ class PalantirCreds:
     apprid: str
 
 
+class PalantirDataset(NamedTuple):
+    dataset_rid: str
+    dataset_name: str
+    type: str
+    date_created: str
+    date_updated: str
+    path: str
+    parent_folder_rid: str
+
+
 def parse_creds(credential: str) -> PalantirCreds:
     parts = credential.split(";")
     if len(parts) < 2:
@@ -24,40 +38,20 @@ def parse_creds(credential: str) -> PalantirCreds:
     return PalantirCreds(token=token, tenant=tenant, apprid=apprid)
 
 
-def _auth_headers(creds: PalantirCreds) -> dict[str, str]:
-    return {"Authorization": f"Bearer {creds.token}"}
-
-
-def creds_valid(credential: str) -> bool:
-    c = parse_creds(credential)
-    status, _ = get_json(f"https://{c.tenant}/api/v1/ontologies", headers=_auth_headers(c))
-    return status == 200
-
-
 def _get_data_list(payload: Any) -> list[dict]:
     if isinstance(payload, dict) and isinstance(payload.get("data"), list):
         return [x for x in payload["data"] if isinstance(x, dict)]
     return []
 
 
-def list_spaces(credential: str) -> list[dict]:
-    c = parse_creds(credential)
-    status, payload = get_json(f"https://{c.tenant}/api/v2/filesystem/spaces?preview=true", headers=_auth_headers(c))
-    if status != 200:
-        return []
+def _spaces_from(payload: Any) -> list[dict]:
     spaces = []
     for s in _get_data_list(payload):
         spaces.append({"displayName": s.get("displayName", ""), "rid": s.get("rid", "")})
     return spaces
 
 
-def folder_children(credential: str, folder_rid: str) -> list[dict]:
-    c = parse_creds(credential)
-    status, payload = get_json(
-        f"https://{c.tenant}/api/v2/filesystem/folders/{folder_rid}/children?preview=true", headers=_auth_headers(c)
-    )
-    if status != 200:
-        return []
+def _children_from(payload: Any) -> list[dict]:
     items = []
     for it in _get_data_list(payload):
         items.append(
@@ -73,12 +67,8 @@ def folder_children(credential: str, folder_rid: str) -> list[dict]:
     return items
 
 
-def folder_info(credential: str, folder_rid: str) -> dict | None:
-    c = parse_creds(credential)
-    status, payload = get_json(
-        f"https://{c.tenant}/api/v2/filesystem/folders/{folder_rid}?preview=true", headers=_auth_headers(c)
-    )
-    if status != 200 or not isinstance(payload, dict):
+def _folder_info_from(payload: Any) -> dict | None:
+    if not isinstance(payload, dict):
         return None
     return {"displayName": payload.get("displayName", ""), "path": payload.get("path", ""), "type": payload.get("type", "")}
 
@@ -87,11 +77,14 @@ def _is_example_content(item_name: str, item_path: str) -> bool:
     return ("AIP Now Ontology" in item_name) or ("[Example]" in item_name) or ("[Example]" in item_path)
 
 
-def find_datasets_recursively(credential: str, folder_rid: str, path: str, max_depth: int, current_depth: int) -> list[dict]:
-    if current_depth >= max_depth:
-        return []
-    datasets: list[dict] = []
-    items = folder_children(credential, folder_rid)
+_FOLDER_TYPES = {"FOLDER", "PROJECT", "SPACE", "COMPASS_FOLDER"}
+
+
+def _classify_children(
+    items: list[dict], folder_rid: str, path: str
+) -> list[tuple[PalantirDataset | None, str, str]]:
+    """Return ``(dataset, subfolder_rid, subfolder_path)`` per relevant child, in listing order."""
+    out: list[tuple[PalantirDataset | None, str, str]] = []
     for it in items:
         display = str(it.get("displayName", "") or "")
         rid = str(it.get("rid", "") or "")
@@ -102,102 +95,215 @@ def find_datasets_recursively(credential: str, folder_rid: str, path: str, max_d
         if _is_example_content(display, item_path):
             continue
         if typ == "FOUNDRY_DATASET":
-            datasets.append(
-                {
-                    "dataset_name": display,
-                    "type": typ,
-                    "date_created": str(it.get("createdTime", "") or "Unknown"),
-                    "date_updated": str(it.get("updatedTime", "") or "Unknown"),
-                    "dataset_rid": rid,
-                    "path": item_path,
-                    "parent_folder_rid": str(it.get("parentFolderRid", "") or folder_rid),
-                }
+            dataset = PalantirDataset(
+                dataset_rid=rid,
+                dataset_name=display,
+                type=typ,
+                date_created=str(it.get("createdTime", "") or "Unknown"),
+                date_updated=str(it.get("updatedTime", "") or "Unknown"),
+                path=item_path,
+                parent_folder_rid=str(it.get("parentFolderRid", "") or folder_rid),
             )
-        elif typ in {"FOLDER", "PROJECT", "SPACE", "COMPASS_FOLDER"}:
-            datasets.extend(find_datasets_recursively(credential, rid, item_path, max_depth, current_depth + 1))
-    return datasets
-
-
-def list_datasets(credential: str) -> list[dict]:
-    c = parse_creds(credential)
-    datasets: list[dict] = []
-
-    if c.apprid:
-        info = folder_info(credential, c.apprid)
-        folder_name = str((info or {}).get("displayName", "") or "")
-        datasets = find_datasets_recursively(credential, c.apprid, folder_name, 3, 0)
-
-    if not datasets:
-        spaces = list_spaces(credential)
-        for s in spaces:
-            rid = str(s.get("rid", "") or "")
-            name = str(s.get("displayName", "") or "")
-            if not rid:
-                continue
-            datasets.extend(find_datasets_recursively(credential, rid, name, 4, 0))
-
-    seen = set()
-    out = []
-    for d in datasets:
-        rid = str(d.get("dataset_rid", "") or "")
-        if not rid or rid in seen:
-            continue
-        seen.add(rid)
-        out.append(d)
+            out.append((dataset, "", ""))
+        elif typ in _FOLDER_TYPES:
+            out.append((None, rid, item_path))
     return out
 
 
-def download_dataset_csv(credential: str, dataset_rid: str) -> bytes:
-    c = parse_creds(credential)
-    url = f"https://{c.tenant}/api/v2/datasets/{dataset_rid}/readTable?format=csv"
-    resp = request("GET", url, headers=_auth_headers(c))
-    if resp.status != 200:
-        raise RuntimeError(f"Palantir returned HTTP {resp.status}")
-    return resp.body
-
-
-def get_dataset_details(credential: str, dataset_rid: str) -> str:
-    c = parse_creds(credential)
-    status, payload = get_json(f"https://{c.tenant}/api/v2/datasets/{dataset_rid}", headers=_auth_headers(c))
-    if status != 200:
-        return ""
-    return json.dumps(payload) if payload is not None else ""
-
-
-def upload_dataset(credential: str, dataset_name: str, file_bytes: bytes, original_file_name: str) -> str:
-    c = parse_creds(credential)
-    create_url = f"https://{c.tenant}/api/v2/datasets"
-    payload = {"name": dataset_name, "parentFolderRid": (c.apprid if c.apprid else "")}
-    resp = request(
-        "POST",
-        create_url,
-        headers={"Content-Type": "application/json", **_auth_headers(c)},
-        body=json.dumps(payload).encode("utf-8"),
-    )
-    if resp.status not in (200, 201):
-        raise RuntimeError(f"Palantir returned HTTP {resp.status}")
-    created = json.loads(resp.body.decode("utf-8", errors="replace")) if resp.body else {}
-    dataset_rid = str(created.get("rid", "") or "")
-    if not dataset_rid:
-        raise RuntimeError("Failed to create dataset or parse dataset RID")
-
-    boundary = f"----WebKitFormBoundary{int(__import__('time').time() * 1000):x}"
-    header = (
-        f"--{boundary}\r\n"
-        f'Content-Disposition: form-data; name="file"; filename="{original_file_name}"\r\n'
-        "Content-Type: application/octet-stream\r\n\r\n"
-    ).encode("utf-8")
-    footer = f"\r\n--{boundary}--\r\n".encode("utf-8")
-    body = header + file_bytes + footer
-
-    upload_url = f"https://{c.tenant}/api/v2/datasets/{dataset_rid}/files"
-    up_resp = request(
-        "POST",
-        upload_url,
-        headers={"Content-Type": f"multipart/form-data; boundary={boundary}", **_auth_headers(c)},
-        body=body,
-    )
-    if up_resp.status not in (200, 201):
-        raise RuntimeError(f"Palantir returned HTTP {up_resp.status}")
-    return dataset_rid
- 
+class PalantirClient:
+    """A session against one Foundry tenant; the credential is parsed and the auth header built once."""
+
+    def __init__(self, credential: str) -> None:
+        self.creds = parse_creds(credential)
+        self.base_url = f"https://{self.creds.tenant}"
+        self.headers = {"Authorization": f"Bearer {self.creds.token}"}
+
+    def creds_valid(self) -> bool:
+        status, _ = get_json(f"{self.base_url}/api/v1/ontologies", headers=self.headers)
+        return status == 200
+
+    def _spaces_url(self) -> str:
+        return f"{self.base_url}/api/v2/filesystem/spaces?preview=true"
+
+    def list_spaces(self) -> list[dict]:
+        status, payload = get_json(self._spaces_url(), headers=self.headers)
+        return _spaces_from(payload) if status == 200 else []
+
+    async def list_spaces_async(self) -> list[dict]:
+        from pymlokit.utils import async_http
+
+        status, payload = await async_http.get_json(self._spaces_url(), headers=self.headers)
+        return _spaces_from(payload) if status == 200 else []
+
+    def _children_url(self, folder_rid: str) -> str:
+        return f"{self.base_url}/api/v2/filesystem/folders/{folder_rid}/children?preview=true"
+
+    def folder_children(self, folder_rid: str) -> list[dict]:
+        status, payload = get_json(self._children_url(folder_rid), headers=self.headers)
+        return _children_from(payload) if status == 200 else []
+
+    async def folder_children_async(self, folder_rid: str) -> list[dict]:
+        from pymlokit.utils import async_http
+
+        status, payload = await async_http.get_json(self._children_url(folder_rid), headers=self.headers)
+        return _children_from(payload) if status == 200 else []
+
+    def _folder_url(self, folder_rid: str) -> str:
+        return f"{self.base_url}/api/v2/filesystem/folders/{folder_rid}?preview=true"
+
+    def folder_info(self, folder_rid: str) -> dict | None:
+        status, payload = get_json(self._folder_url(folder_rid), headers=self.headers)
+        return _folder_info_from(payload) if status == 200 else None
+
+    async def folder_info_async(self, folder_rid: str) -> dict | None:
+        from pymlokit.utils import async_http
+
+        status, payload = await async_http.get_json(self._folder_url(folder_rid), headers=self.headers)
+        return _folder_info_from(payload) if status == 200 else None
+
+    def _iter_tree(
+        self, folder_rid: str, path: str, max_depth: int, current_depth: int
+    ) -> Iterator[PalantirDataset]:
+        if current_depth >= max_depth:
+            return
+        for dataset, sub_rid, sub_path in _classify_children(self.folder_children(folder_rid), folder_rid, path):
+            if dataset is not None:
+                yield dataset
+            else:
+                yield from self._iter_tree(sub_rid, sub_path, max_depth, current_depth + 1)
+
+    def find_datasets_recursively(
+        self, folder_rid: str, path: str, max_depth: int, current_depth: int
+    ) -> list[PalantirDataset]:
+        return list(self._iter_tree(folder_rid, path, max_depth, current_depth))
+
+    async def _walk_async(
+        self, folder_rid: str, path: str, max_depth: int, current_depth: int, sem: asyncio.Semaphore
+    ) -> list[PalantirDataset]:
+        import asyncio
+
+        if current_depth >= max_depth:
+            return []
+        async with sem:
+            items = await self.folder_children_async(folder_rid)
+        children = _classify_children(items, folder_rid, path)
+        subtrees = await asyncio.gather(
+            *(
+                self._walk_async(sub_rid, sub_path, max_depth, current_depth + 1, sem)
+                for dataset, sub_rid, sub_path in children
+                if dataset is None
+            )
+        )
+        datasets: list[PalantirDataset] = []
+        it = iter(subtrees)
+        for dataset, _, _ in children:
+            datasets.extend([dataset] if dataset is not None else next(it))
+        return datasets
+
+    async def find_datasets_recursively_async(
+        self, folder_rid: str, path: str, max_depth: int, current_depth: int
+    ) -> list[PalantirDataset]:
+        """Walk sibling folders concurrently; results come back in the same order as the sync walk."""
+        import asyncio
+
+        from pymlokit.utils import async_http
+
+        sem = asyncio.Semaphore(async_http.ASYNC_CONCURRENCY)
+        return await self._walk_async(folder_rid, path, max_depth, current_depth, sem)
+
+    def _iter_all_datasets(self) -> Iterator[PalantirDataset]:
+        found = False
+        if self.creds.apprid:
+            info = self.folder_info(self.creds.apprid)
+            folder_name = str((info or {}).get("displayName", "") or "")
+            for dataset in self._iter_tree(self.creds.apprid, folder_name, 3, 0):
+                found = True
+                yield dataset
+
+        if not found:
+            spaces = self.list_spaces()
+            for s in spaces:
+                rid = str(s.get("rid", "") or "")
+                name = str(s.get("displayName", "") or "")
+                if not rid:
+                    continue
+                yield from self._iter_tree(rid, name, 4, 0)
+
+    def iter_datasets(self) -> Iterator[PalantirDataset]:
+        """Yield datasets folder by folder as the walk finds them, first occurrence of each RID only."""
+        return unique_by(self._iter_all_datasets(), "dataset_rid")
+
+    def list_datasets(self) -> list[PalantirDataset]:
+        return list(self.iter_datasets())
+
+    async def list_datasets_async(self) -> list[PalantirDataset]:
+        import asyncio
+
+        from pymlokit.utils import async_http
+
+        sem = asyncio.Semaphore(async_http.ASYNC_CONCURRENCY)
+        datasets: list[PalantirDataset] = []
+
+        if self.creds.apprid:
+            info = await self.folder_info_async(self.creds.apprid)
+            folder_name = str((info or {}).get("displayName", "") or "")
+            datasets = await self._walk_async(self.creds.apprid, folder_name, 3, 0, sem)
+
+        if not datasets:
+            spaces = [s for s in await self.list_spaces_async() if s.get("rid")]
+            trees = await asyncio.gather(
+                *(self._walk_async(str(s["rid"]), str(s.get("displayName", "") or ""), 4, 0, sem) for s in spaces)
+            )
+            for tree in trees:
+                datasets.extend(tree)
+
+        return list(unique_by(datasets, "dataset_rid"))
+
+    def download_dataset_csv(self, dataset_rid: str, out_path: str) -> int:
+        url = f"{self.base_url}/api/v2/datasets/{dataset_rid}/readTable?format=csv"
+        status, written = download_to_file(url, out_path, headers=self.headers)
+        if status != 200:
+            raise RuntimeError(f"Palantir returned HTTP {status}")
+        return written
+
+    def get_dataset_details(self, dataset_rid: str) -> str:
+        status, payload = get_json(f"{self.base_url}/api/v2/datasets/{dataset_rid}", headers=self.headers)
+        if status != 200:
+            return ""
+        return json.dumps(payload) if payload is not None else ""
+
+    def upload_dataset(self, dataset_name: str, file_bytes: bytes, original_file_name: str) -> str:
+        create_url = f"{self.base_url}/api/v2/datasets"
+        payload = {"name": dataset_name, "parentFolderRid": (self.creds.apprid if self.creds.apprid else "")}
+        resp = request(
+            "POST",
+            create_url,
+            headers={"Content-Type": "application/json", **self.headers},
+            body=json.dumps(payload).encode("utf-8"),
+        )
+        if resp.status not in (200, 201):
+            raise RuntimeError(f"Palantir returned HTTP {resp.status}")
+        created = json.loads(resp.body.decode("utf-8", errors="replace")) if resp.body else {}
+        dataset_rid = str(created.get("rid", "") or "")
+        if not dataset_rid:
+            raise RuntimeError("Failed to create dataset or parse dataset RID")
+
+        boundary = f"----WebKitFormBoundary{int(__import__('time').time() * 1000):x}"
+        header = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{original_file_name}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        footer = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        body = header + file_bytes + footer
+
+        upload_url = f"{self.base_url}/api/v2/datasets/{dataset_rid}/files"
+        up_resp = request(
+            "POST",
+            upload_url,
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}", **self.headers},
+            body=body,
+        )
+        if up_resp.status not in (200, 201):
+            raise RuntimeError(f"Palantir returned HTTP {up_resp.status}")
+        return dataset_rid
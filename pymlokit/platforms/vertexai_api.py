@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from typing import Any
+from itertools import chain
+from typing import Any, Iterator, NamedTuple
 from urllib.parse import quote
 
-from pymlokit.utils.http import get_json, post_json, request
+from pymlokit.utils.auth import bearer_headers, raise_for_auth, raise_for_status, token_expired
+from pymlokit.utils.http import RETRYABLE_ERRORS, RetryPolicy, get_json, post_json
+from pymlokit.utils.iterators import fan_out, first_match, unique_by
+from pymlokit.utils.transfer import download_file
 
 
-@dataclass(frozen=True)
-class VertexProject:
+class VertexProject(NamedTuple):
     name: str
     project_id: str
     project_number: str
@@ -17,25 +19,64 @@ class VertexProject:
     create_time: str
 
 
+class VertexModel(NamedTuple):
+    id: str
+    display_name: str
+    create_time: str
+    update_time: str
+    source_type: str
+    exportable_format: str
+    region: str
+
+
+class VertexDataset(NamedTuple):
+    id: str
+    display_name: str
+    create_time: str
+    update_time: str
+    uri: str
+    region: str
+
+
+class VertexExport(NamedTuple):
+    """A started model export: its long-running operation (if the service named one) and output location."""
+
+    region: str
+    operation: str
+    artifact_uri: str
+
+
+# Google Cloud recommends truncated exponential backoff capped at 32 seconds.
+RETRY_POLICY = RetryPolicy(max_delay_s=32.0)
+
+# Regions listed at once when a project's models or datasets are gathered from every location.
+REGION_WORKERS = 8
+
+# Export operations are polled every EXPORT_POLL_MIN_S at first, backing off by EXPORT_POLL_FACTOR up to
+# EXPORT_POLL_MAX_S, and given up on after EXPORT_TIMEOUT_S.
+EXPORT_POLL_MIN_S = 1.0
+EXPORT_POLL_MAX_S = 15.0
+EXPORT_POLL_FACTOR = 1.5
+EXPORT_TIMEOUT_S = 900.0
+
+
 def _auth_headers(token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
+    return bearer_headers(token)
+
+
+_PROJECTS_URL = (
+    "https://cloudresourcemanager.googleapis.com/v1/projects?alt=json&filter=lifecycleState%3AACTIVE&pageSize=500"
+)
 
 
 def creds_valid(token: str) -> bool:
-    status, _ = get_json(
-        "https://cloudresourcemanager.googleapis.com/v1/projects?alt=json&filter=lifecycleState%3AACTIVE&pageSize=500",
-        headers=_auth_headers(token),
-    )
+    if token_expired(token):
+        return False
+    status, _ = get_json(_PROJECTS_URL, headers=_auth_headers(token), retry=RETRY_POLICY)
     return status == 200
 
 
-def list_projects(token: str) -> list[VertexProject]:
-    status, payload = get_json(
-        "https://cloudresourcemanager.googleapis.com/v1/projects?alt=json&filter=lifecycleState%3AACTIVE&pageSize=500",
-        headers=_auth_headers(token),
-    )
-    if status != 200:
-        raise RuntimeError(f"VertexAI returned HTTP {status}")
+def _projects_from(payload: Any) -> list[VertexProject]:
     out: list[VertexProject] = []
     if isinstance(payload, dict) and isinstance(payload.get("projects"), list):
         for p in payload["projects"]:
@@ -53,13 +94,25 @@ def list_projects(token: str) -> list[VertexProject]:
     return out
 
 
-def list_regions(token: str, project: str) -> list[str]:
-    status, payload = get_json(
-        f"https://apigateway.googleapis.com/v1/projects/{quote(project)}/locations",
-        headers=_auth_headers(token),
-    )
-    if status != 200:
-        raise RuntimeError(f"VertexAI returned HTTP {status}")
+def list_projects(token: str) -> list[VertexProject]:
+    status, payload = get_json(_PROJECTS_URL, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_status("VertexAI", status)
+    return _projects_from(payload)
+
+
+async def list_projects_async(token: str) -> list[VertexProject]:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(_PROJECTS_URL, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_status("VertexAI", status)
+    return _projects_from(payload)
+
+
+def _regions_url(project: str) -> str:
+    return f"https://apigateway.googleapis.com/v1/projects/{quote(project)}/locations"
+
+
+def _regions_from(payload: Any) -> list[str]:
     regions: list[str] = []
     if isinstance(payload, dict) and isinstance(payload.get("locations"), list):
         for loc in payload["locations"]:
@@ -68,24 +121,37 @@ def list_regions(token: str, project: str) -> list[str]:
             name = str(loc.get("name", "") or "")
             if name and "/" in name:
                 regions.append(name.split("/")[-1])
-    seen = set()
-    out = []
-    for r in regions:
-        if r and r not in seen:
-            seen.add(r)
-            out.append(r)
-    return out
+    return list(dict.fromkeys(r for r in regions if r))
 
 
-def list_models(token: str, region: str, project: str) -> list[dict]:
-    status, payload = get_json(
-        f"https://{region}-aiplatform.googleapis.com/v1/projects/{quote(project)}/locations/{quote(region)}/models",
-        headers=_auth_headers(token),
-    )
+def list_regions(token: str, project: str) -> list[str]:
+    status, payload = get_json(_regions_url(project), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
     if status != 200:
-        return []
+        raise RuntimeError(f"VertexAI returned HTTP {status}")
+    return _regions_from(payload)
+
+
+async def list_regions_async(token: str, project: str) -> list[str]:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(_regions_url(project), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
+    if status != 200:
+        raise RuntimeError(f"VertexAI returned HTTP {status}")
+    return _regions_from(payload)
+
+
+def _location_url(region: str, project: str, collection: str) -> str:
+    return (
+        f"https://{region}-aiplatform.googleapis.com/v1/projects/{quote(project)}/locations/{quote(region)}/"
+        f"{collection}"
+    )
+
+
+def _models_from(payload: Any, region: str) -> list[VertexModel]:
     export_allow = {"tflite", "edgetpu-tflite", "tf-saved-model", "tf-js", "core-ml", "custom-trained"}
-    out: list[dict] = []
+    out: list[VertexModel] = []
     if isinstance(payload, dict) and isinstance(payload.get("models"), list):
         for m in payload["models"]:
             if not isinstance(m, dict):
@@ -109,35 +175,114 @@ def list_models(token: str, region: str, project: str) -> list[dict]:
                             break
             if model_id and display and create_time and update_time and source_type and export_fmt:
                 out.append(
-                    {
-                        "id": model_id,
-                        "display_name": display,
-                        "create_time": create_time,
-                        "update_time": update_time,
-                        "source_type": source_type,
-                        "exportable_format": export_fmt,
-                        "region": region,
-                    }
+                    VertexModel(
+                        id=model_id,
+                        display_name=display,
+                        create_time=create_time,
+                        update_time=update_time,
+                        source_type=source_type,
+                        exportable_format=export_fmt,
+                        region=region,
+                    )
                 )
-    seen = set()
-    deduped = []
-    for m in out:
-        mid = m.get("id", "")
-        if not mid or mid in seen:
-            continue
-        seen.add(mid)
-        deduped.append(m)
-    return deduped
-
-
-def list_datasets(token: str, region: str, project: str) -> list[dict]:
-    status, payload = get_json(
-        f"https://{region}-aiplatform.googleapis.com/v1/projects/{quote(project)}/locations/{quote(region)}/datasets",
-        headers=_auth_headers(token),
-    )
-    if status != 200:
-        return []
-    out: list[dict] = []
+    return out
+
+
+def _page_url(url: str, page_token: str) -> str:
+    return f"{url}?pageToken={quote(page_token)}" if page_token else url
+
+
+def _next_page_token(payload: Any) -> str:
+    return str(payload.get("nextPageToken", "") or "") if isinstance(payload, dict) else ""
+
+
+def _skip_region(region: str, collection: str, reason: object) -> None:
+    print(f"[*] INFO: Skipping {collection} in region {region}: {reason}")
+
+
+def _location_pages(token: str, region: str, project: str, collection: str) -> Iterator[Any]:
+    """Yield each page of a regional collection, requesting the next one only when asked.
+
+    A region that fails (an HTTP error, or a connection error that outlasts the
+    retries) is reported and ends early, so listing or searching every region
+    carries on with the others; only invalid credentials raise.
+    """
+    url = _location_url(region, project, collection)
+    page_token = ""
+    while True:
+        try:
+            status, payload = get_json(_page_url(url, page_token), headers=_auth_headers(token), retry=RETRY_POLICY)
+        except RETRYABLE_ERRORS as ex:
+            _skip_region(region, collection, ex)
+            return
+        raise_for_auth("VertexAI", status, (401,))
+        if status != 200:
+            _skip_region(region, collection, f"VertexAI returned HTTP {status}")
+            return
+        yield payload
+        page_token = _next_page_token(payload)
+        if not page_token:
+            return
+
+
+async def _location_pages_async(token: str, region: str, project: str, collection: str) -> list[Any]:
+    import asyncio
+
+    from pymlokit.utils import async_http
+
+    url = _location_url(region, project, collection)
+    pages: list[Any] = []
+    page_token = ""
+    while True:
+        try:
+            status, payload = await async_http.get_json(
+                _page_url(url, page_token), headers=_auth_headers(token), retry=RETRY_POLICY
+            )
+        except (*RETRYABLE_ERRORS, asyncio.TimeoutError, asyncio.IncompleteReadError) as ex:
+            _skip_region(region, collection, ex)
+            return pages
+        raise_for_auth("VertexAI", status, (401,))
+        if status != 200:
+            _skip_region(region, collection, f"VertexAI returned HTTP {status}")
+            return pages
+        pages.append(payload)
+        page_token = _next_page_token(payload)
+        if not page_token:
+            return pages
+
+
+def iter_models(token: str, region: str, project: str) -> Iterator[VertexModel]:
+    """Yield the exportable models in ``region`` page by page, first occurrence of each ID only."""
+    pages = _location_pages(token, region, project, "models")
+    return unique_by(chain.from_iterable(_models_from(p, region) for p in pages), "id")
+
+
+def list_models(token: str, region: str, project: str) -> list[VertexModel]:
+    return list(iter_models(token, region, project))
+
+
+async def list_models_async(token: str, region: str, project: str) -> list[VertexModel]:
+    pages = await _location_pages_async(token, region, project, "models")
+    return list(unique_by(chain.from_iterable(_models_from(p, region) for p in pages), "id"))
+
+
+def iter_models_in(
+    token: str, regions: list[str], project: str, workers: int = REGION_WORKERS
+) -> Iterator[VertexModel]:
+    """Yield the models of every region in ``regions``, listing ``workers`` regions at once; region order is kept."""
+    return fan_out(regions, lambda r: iter_models(token, r, project), workers)
+
+
+def find_model(
+    token: str, regions: list[str], project: str, model_id: str, workers: int = REGION_WORKERS
+) -> VertexModel | None:
+    """The model whose ID is ``model_id`` (ignoring case) in any of ``regions``; other regions stop once it is found."""
+    key = model_id.lower()
+    return first_match(regions, lambda r: iter_models(token, r, project), lambda m: m.id.lower() == key, workers)
+
+
+def _datasets_from(payload: Any, region: str) -> list[VertexDataset]:
+    out: list[VertexDataset] = []
     if isinstance(payload, dict) and isinstance(payload.get("datasets"), list):
         for d in payload["datasets"]:
             if not isinstance(d, dict):
@@ -147,48 +292,103 @@ def list_datasets(token: str, region: str, project: str) -> list[dict]:
             display = str(d.get("displayName", "") or "")
             create_time = str(d.get("createTime", "") or "")
             update_time = str(d.get("updateTime", "") or "")
-            uri = str(d.get("metadata"), "" or "")
+            uri = str(d.get("metadata", "") or "")
             if isinstance(d.get("metadata"), dict):
                 uri = str(d["metadata"].get("inputConfig", {}).get("gcsSource", {}).get("uri", "") or "")
             if dataset_id and display and create_time and update_time and uri:
                 out.append(
-                    {
-                        "id": dataset_id,
-                        "display_name": display,
-                        "create_time": create_time,
-                        "update_time": update_time,
-                        "uri": uri,
-                        "region": region,
-                    }
+                    VertexDataset(
+                        id=dataset_id,
+                        display_name=display,
+                        create_time=create_time,
+                        update_time=update_time,
+                        uri=uri,
+                        region=region,
+                    )
                 )
-    seen = set()
-    deduped = []
-    for d in out:
-        did = d.get("id", "")
-        if not did or did in seen:
-            continue
-        seen.add(did)
-        deduped.append(d)
-    return deduped
+    return out
 
 
-def list_buckets(token: str, project: str) -> list[str]:
-    url = (
+def iter_datasets(token: str, region: str, project: str) -> Iterator[VertexDataset]:
+    """Yield the datasets in ``region`` page by page, first occurrence of each ID only."""
+    pages = _location_pages(token, region, project, "datasets")
+    return unique_by(chain.from_iterable(_datasets_from(p, region) for p in pages), "id")
+
+
+def list_datasets(token: str, region: str, project: str) -> list[VertexDataset]:
+    return list(iter_datasets(token, region, project))
+
+
+def iter_datasets_in(
+    token: str, regions: list[str], project: str, workers: int = REGION_WORKERS
+) -> Iterator[VertexDataset]:
+    """Yield the datasets of every region in ``regions``, listing ``workers`` regions at once; region order is kept."""
+    return fan_out(regions, lambda r: iter_datasets(token, r, project), workers)
+
+
+def find_dataset(
+    token: str, regions: list[str], project: str, dataset_id: str, workers: int = REGION_WORKERS
+) -> VertexDataset | None:
+    """The dataset whose ID is ``dataset_id`` (ignoring case) in any of ``regions``; other regions stop once found."""
+    key = dataset_id.lower()
+    return first_match(regions, lambda r: iter_datasets(token, r, project), lambda d: d.id.lower() == key, workers)
+
+
+async def list_datasets_async(token: str, region: str, project: str) -> list[VertexDataset]:
+    pages = await _location_pages_async(token, region, project, "datasets")
+    return list(unique_by(chain.from_iterable(_datasets_from(p, region) for p in pages), "id"))
+
+
+def _buckets_url(project: str) -> str:
+    return (
         "https://storage.googleapis.com/storage/v1/b?alt=json&fields=items%2Fname%2CnextPageToken"
         f"&maxResults=1000&project={quote(project)}&projection=noAcl"
     )
-    status, payload = get_json(url, headers=_auth_headers(token))
-    if status != 200:
-        return []
-    buckets = []
+
+
+def _item_names(payload: Any) -> list[str]:
+    names = []
     if isinstance(payload, dict) and isinstance(payload.get("items"), list):
         for it in payload["items"]:
             if isinstance(it, dict) and it.get("name"):
-                buckets.append(str(it["name"]))
-    return buckets
+                names.append(str(it["name"]))
+    return names
+
+
+def list_buckets(token: str, project: str) -> list[str]:
+    status, payload = get_json(_buckets_url(project), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
+    if status != 200:
+        return []
+    return _item_names(payload)
 
 
-def export_model(token: str, region: str, project: str, model_id: str, bucket: str, export_format: str) -> str:
+async def list_buckets_async(token: str, project: str) -> list[str]:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(_buckets_url(project), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
+    if status != 200:
+        return []
+    return _item_names(payload)
+
+
+def _artifact_output_uri(payload: Any) -> str:
+    """The export destination from an ``:export`` response or operation (``metadata.outputInfo``), else ""."""
+    if not isinstance(payload, dict):
+        return ""
+    out_uri = payload.get("artifactOutputUri")
+    if out_uri is None:
+        metadata = payload.get("metadata")
+        info = metadata.get("outputInfo") if isinstance(metadata, dict) else None
+        out_uri = info.get("artifactOutputUri") if isinstance(info, dict) else None
+    return "" if out_uri is None else str(out_uri)
+
+
+def export_model(
+    token: str, region: str, project: str, model_id: str, bucket: str, export_format: str
+) -> VertexExport | None:
+    """Start exporting ``model_id`` to ``gs://bucket``; None if the service refused."""
     url = (
         f"https://{region}-aiplatform.googleapis.com/v1/projects/{quote(project)}/locations/{quote(region)}/models/"
         f"{quote(model_id)}:export"
@@ -199,46 +399,77 @@ def export_model(token: str, region: str, project: str, model_id: str, bucket: s
             "artifactDestination": {"outputUriPrefix": f"gs://{bucket}"},
         }
     }
-    status, resp = post_json(url, payload, headers=_auth_headers(token))
-    if status != 200:
-        return ""
-    if isinstance(resp, dict):
-        out_uri = resp.get("artifactOutputUri")
-        return "" if out_uri is None else str(out_uri)
-    return ""
+    status, resp = post_json(url, payload, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
+    if status != 200 or not isinstance(resp, dict):
+        return None
+    operation = str(resp.get("name", "") or "")
+    export = VertexExport(region=region, operation=operation, artifact_uri=_artifact_output_uri(resp))
+    return export if export.operation or export.artifact_uri else None
 
 
-def list_objects(token: str, bucket: str, prefix: str) -> list[str]:
-    url = (
+def _objects_url(bucket: str, prefix: str) -> str:
+    return (
         f"https://storage.googleapis.com/storage/v1/b/{quote(bucket)}/o?alt=json&prefix={quote(prefix)}"
         "&fields=items%2Fname%2CnextPageToken&maxResults=1000&projection=noAcl"
     )
-    status, payload = get_json(url, headers=_auth_headers(token))
+
+
+def list_objects(token: str, bucket: str, prefix: str) -> list[str]:
+    status, payload = get_json(_objects_url(bucket, prefix), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
     if status != 200:
         return []
-    names = []
-    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
-        for it in payload["items"]:
-            if isinstance(it, dict) and it.get("name"):
-                names.append(str(it["name"]))
-    return names
+    return _item_names(payload)
 
 
-def get_media_link(token: str, bucket: str, object_name: str) -> str:
-    url = f"https://storage.googleapis.com/storage/v1/b/{quote(bucket)}/o/{quote(object_name, safe='')}"
-    status, payload = get_json(url, headers=_auth_headers(token))
+async def list_objects_async(token: str, bucket: str, prefix: str) -> list[str]:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(
+        _objects_url(bucket, prefix), headers=_auth_headers(token), retry=RETRY_POLICY
+    )
+    raise_for_auth("VertexAI", status, (401,))
     if status != 200:
-        return ""
+        return []
+    return _item_names(payload)
+
+
+def _object_url(bucket: str, object_name: str) -> str:
+    return f"https://storage.googleapis.com/storage/v1/b/{quote(bucket)}/o/{quote(object_name, safe='')}"
+
+
+def _media_link_from(payload: Any) -> str:
     if isinstance(payload, dict) and payload.get("mediaLink"):
         return str(payload["mediaLink"])
     return ""
 
 
-def download_media_link(token: str, media_link: str) -> bytes:
-    resp = request("GET", media_link, headers=_auth_headers(token))
-    if resp.status != 200:
-        raise RuntimeError(f"GCS returned HTTP {resp.status}")
-    return resp.body
+def get_media_link(token: str, bucket: str, object_name: str) -> str:
+    status, payload = get_json(_object_url(bucket, object_name), headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_auth("VertexAI", status, (401,))
+    if status != 200:
+        return ""
+    return _media_link_from(payload)
+
+
+async def get_media_link_async(token: str, bucket: str, object_name: str) -> str:
+    from pymlokit.utils import async_http
+
+    status, payload = await async_http.get_json(
+        _object_url(bucket, object_name), headers=_auth_headers(token), retry=RETRY_POLICY
+    )
+    raise_for_auth("VertexAI", status, (401,))
+    if status != 200:
+        return ""
+    return _media_link_from(payload)
+
+
+def download_media_link(token: str, media_link: str, out_path: str) -> int:
+    status, written = download_file(media_link, out_path, headers=_auth_headers(token), retry=RETRY_POLICY)
+    if status != 200:
+        raise RuntimeError(f"GCS returned HTTP {status}")
+    return written
 
 
 def parse_gs_uri(gs_uri: str) -> tuple[str, str]:
@@ -250,6 +481,37 @@ def parse_gs_uri(gs_uri: str) -> tuple[str, str]:
     return bucket, path
 
 
-def wait_for_export(seconds: float = 15.0) -> None:
-    time.sleep(seconds)
+def get_operation(token: str, region: str, operation: str) -> dict:
+    url = f"https://{region}-aiplatform.googleapis.com/v1/{operation}"
+    status, payload = get_json(url, headers=_auth_headers(token), retry=RETRY_POLICY)
+    raise_for_status("VertexAI", status, auth_statuses=(401,))
+    return payload if isinstance(payload, dict) else {}
+
+
+def wait_for_export(token: str, export: VertexExport, timeout_s: float = EXPORT_TIMEOUT_S) -> str:
+    """Poll the export's operation until it is done and return where the model was written.
+
+    Polls start EXPORT_POLL_MIN_S apart and back off to EXPORT_POLL_MAX_S, so a
+    quick export is picked up within about a second and a long one costs a
+    request every few seconds. Raises RuntimeError if the operation fails or is
+    still running after ``timeout_s``. An export without an operation name
+    cannot be tracked; it gets a fixed 15 second grace period instead.
+    """
+    if not export.operation:
+        time.sleep(min(15.0, timeout_s))
+        return export.artifact_uri
+    deadline = time.monotonic() + timeout_s
+    delay = EXPORT_POLL_MIN_S
+    while True:
+        op = get_operation(token, export.region, export.operation)
+        if op.get("done"):
+            error = op.get("error")
+            if isinstance(error, dict):
+                raise RuntimeError(f"VertexAI export failed: {error.get('message') or error.get('code')}")
+            return _artifact_output_uri(op) or export.artifact_uri
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(f"VertexAI export did not finish within {timeout_s:.0f}s (operation {export.operation})")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * EXPORT_POLL_FACTOR, EXPORT_POLL_MAX_S)
  
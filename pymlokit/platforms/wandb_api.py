@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=None)
 def _get_api(credential: str) -> Any:
+    # One wandb.Api per key for the life of the process (batch runs reuse it).
     try:
         import wandb
     except ImportError:
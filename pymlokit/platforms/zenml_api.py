@@ -4,6 +4,7 @@ import base64
 import json
 from dataclasses import dataclass
 
+from pymlokit.utils.auth import raise_for_status
 from pymlokit.utils.http import get_json, post_json
 
 
@@ -51,8 +52,7 @@ def list_projects(credential: str, api_url: str) -> list[dict]:
     
     # ZenML uses "workspaces" as projects
     status, payload = get_json(f"{api_url}/workspaces", headers=headers)
-    if status != 200:
-        raise RuntimeError(f"ZenML returned HTTP {status}")
+    raise_for_status("ZenML", status)
         
     out = []
     # Payload usually: {"items": [...], "total": ...}
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import importlib
+from typing import Callable, NamedTuple
+
+
+class ModuleEntry(NamedTuple):
+    """Where a (platform, module) pair lives and which /options its ``run`` takes.
+
+    ``options`` are passed to ``run(credential, platform, *options)`` in order;
+    ``required`` must be present and non-empty before the module is imported.
+    """
+
+    target: str
+    options: tuple[str, ...] = ()
+    required: tuple[str, ...] = ()
+
+    def load(self) -> Callable[..., None]:
+        return importlib.import_module(f"pymlokit.modules.{self.target}").run
+
+
+_AZURE_WORKSPACE = ("subscription-id", "region", "resource-group", "workspace")
+
+MODULES: dict[tuple[str, str], ModuleEntry] = {
+    ("azureml", "check"): ModuleEntry("azureml.check"),
+    ("azureml", "list-projects"): ModuleEntry("azureml.list_projects", ("subscription-id",), ("subscription-id",)),
+    ("azureml", "list-models"): ModuleEntry("azureml.list_models", _AZURE_WORKSPACE, _AZURE_WORKSPACE),
+    ("azureml", "list-datasets"): ModuleEntry("azureml.list_datasets", _AZURE_WORKSPACE, _AZURE_WORKSPACE),
+    ("azureml", "download-model"): ModuleEntry(
+        "azureml.download_model", (*_AZURE_WORKSPACE, "model-id"), (*_AZURE_WORKSPACE, "model-id")
+    ),
+    ("azureml", "download-dataset"): ModuleEntry(
+        "azureml.download_dataset", (*_AZURE_WORKSPACE, "dataset-id"), (*_AZURE_WORKSPACE, "dataset-id")
+    ),
+    ("azureml", "poison-model"): ModuleEntry(
+        "azureml.poison_model", (*_AZURE_WORKSPACE, "model-id", "source-dir"), (*_AZURE_WORKSPACE, "model-id")
+    ),
+    ("bigml", "check"): ModuleEntry("bigml.check"),
+    ("bigml", "list-projects"): ModuleEntry("bigml.list_projects"),
+    ("bigml", "list-models"): ModuleEntry("bigml.list_models"),
+    ("bigml", "list-datasets"): ModuleEntry("bigml.list_datasets"),
+    ("bigml", "download-model"): ModuleEntry("bigml.download_model", ("model-id",), ("model-id",)),
+    ("bigml", "download-dataset"): ModuleEntry("bigml.download_dataset", ("dataset-id",), ("dataset-id",)),
+    ("vertexai", "check"): ModuleEntry("vertexai.check"),
+    ("vertexai", "list-projects"): ModuleEntry("vertexai.list_projects"),
+    ("vertexai", "list-models"): ModuleEntry("vertexai.list_models", ("project",), ("project",)),
+    ("vertexai", "list-datasets"): ModuleEntry("vertexai.list_datasets", ("project",), ("project",)),
+    ("vertexai", "download-model"): ModuleEntry(
+        "vertexai.download_model", ("project", "model-id"), ("project", "model-id")
+    ),
+    ("vertexai", "download-dataset"): ModuleEntry(
+        "vertexai.download_dataset", ("project", "dataset-id"), ("project", "dataset-id")
+    ),
+    ("mlflow", "check"): ModuleEntry("mlflow.check", ("url",), ("url",)),
+    ("mlflow", "list-models"): ModuleEntry("mlflow.list_models", ("url",), ("url",)),
+    ("mlflow", "download-model"): ModuleEntry(
+        "mlflow.download_model", ("url", "model-id", "version", "alias"), ("url", "model-id")
+    ),
+    ("sagemaker", "check"): ModuleEntry("sagemaker.check", ("region",), ("region",)),
+    ("sagemaker", "list-models"): ModuleEntry("sagemaker.list_models", ("region",), ("region",)),
+    ("sagemaker", "list-notebooks"): ModuleEntry("sagemaker.list_notebooks", ("region",), ("region",)),
+    ("sagemaker", "download-model"): ModuleEntry(
+        "sagemaker.download_model", ("region", "model-id"), ("region", "model-id")
+    ),
+    ("sagemaker", "poison-model"): ModuleEntry(
+        "sagemaker.poison_model", ("region", "model-id", "source-dir"), ("region", "model-id", "source-dir")
+    ),
+    ("sagemaker", "add-notebook-trigger"): ModuleEntry(
+        "sagemaker.add_notebook_trigger", ("region", "notebook-name", "script"), ("region", "notebook-name", "script")
+    ),
+    ("palantir", "check"): ModuleEntry("palantir.check"),
+    ("palantir", "list-datasets"): ModuleEntry("palantir.list_datasets"),
+    ("palantir", "download-dataset"): ModuleEntry("palantir.download_dataset", ("dataset-id",), ("dataset-id",)),
+    ("palantir", "upload-dataset"): ModuleEntry(
+        "palantir.upload_dataset", ("dataset-name", "source-dir"), ("dataset-name", "source-dir")
+    ),
+    ("clearml", "check"): ModuleEntry("clearml.check", ("api-url",), ("api-url",)),
+    ("clearml", "list-projects"): ModuleEntry("clearml.list_projects", ("api-url",), ("api-url",)),
+    ("clearml", "list-models"): ModuleEntry("clearml.list_models", ("api-url", "project-id"), ("api-url",)),
+    ("clearml", "list-datasets"): ModuleEntry("clearml.list_datasets", ("api-url", "project-id"), ("api-url",)),
+    ("clearml", "download-model"): ModuleEntry(
+        "clearml.download_model", ("api-url", "model-id"), ("api-url", "model-id")
+    ),
+    ("wandb", "check"): ModuleEntry("wandb.check"),
+    ("wandb", "list-projects"): ModuleEntry("wandb.list_projects"),
+    ("wandb", "list-models"): ModuleEntry("wandb.list_models", ("project",), ("project",)),
+    ("wandb", "list-datasets"): ModuleEntry("wandb.list_datasets", ("project",), ("project",)),
+    ("wandb", "download-model"): ModuleEntry("wandb.download_model", ("project", "model-id"), ("project", "model-id")),
+    ("wandb", "download-dataset"): ModuleEntry(
+        "wandb.download_dataset", ("project", "dataset-id"), ("project", "dataset-id")
+    ),
+    ("metaflow", "check"): ModuleEntry("metaflow.check", ("service-url",), ("service-url",)),
+    ("metaflow", "list-projects"): ModuleEntry("metaflow.list_projects", ("service-url",), ("service-url",)),
+    ("metaflow", "list-models"): ModuleEntry(
+        "metaflow.list_models", ("service-url", "project"), ("service-url", "project")
+    ),
+    ("zenml", "check"): ModuleEntry("zenml.check", ("api-url",), ("api-url",)),
+    ("zenml", "list-projects"): ModuleEntry("zenml.list_projects", ("api-url",), ("api-url",)),
+    ("kubeflow", "check"): ModuleEntry("kubeflow.check", ("api-url",), ("api-url",)),
+    ("kubeflow", "list-projects"): ModuleEntry("kubeflow.list_projects", ("api-url",), ("api-url",)),
+    ("kubeflow", "list-models"): ModuleEntry("kubeflow.list_models", ("api-url",), ("api-url",)),
+}
+
+# Modules that only read local state: no credential, and /platform is an optional filter.
+LOCAL_MODULES: dict[str, ModuleEntry] = {
+    "query-inventory": ModuleEntry(
+        "inventory.query_inventory", ("inventory", "kind", "name", "id", "scope", "since", "limit")
+    ),
+}
+
+
+def lookup(platform: str, module: str) -> ModuleEntry | None:
+    return LOCAL_MODULES.get(module.lower()) or MODULES.get((platform.lower(), module.lower()))
+
+
+def missing_options(entry: ModuleEntry, options: dict[str, str]) -> list[str]:
+    return [name for name in entry.required if not options.get(name)]
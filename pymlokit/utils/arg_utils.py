@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable
 
+from pymlokit.registry import LOCAL_MODULES, MODULES
+
 
 def parse_arguments(args: Iterable[str]) -> dict[str, str]:
     result: dict[str, str] = {}
@@ -30,18 +32,7 @@ def generate_header(module: str, platform: str) -> str:
     )
 
 
-APPROVED_MODULES = {
-    "check",
-    "list-projects",
-    "list-models",
-    "list-datasets",
-    "download-model",
-    "download-dataset",
-    "upload-dataset",
-    "poison-model",
-    "list-notebooks",
-    "add-notebook-trigger",
-}
+APPROVED_MODULES = {module for _, module in MODULES} | set(LOCAL_MODULES)
 
 
 def help_me() -> None:
@@ -68,7 +59,7 @@ def help_me() -> None:
     print("  azureml:   /subscription-id /region /resource-group /workspace /model-id /dataset-id /source-dir")
     print("  bigml:     /model-id /dataset-id")
     print("  vertexai:  /project /model-id /dataset-id")
-    print("  mlflow:    /url /model-id")
+    print("  mlflow:    /url /model-id /version /alias (download-model: default is the latest version)")
     print("  sagemaker: /region /model-id /source-dir /notebook-name /script")
     print("  palantir:  /dataset-id /dataset-name /source-dir")
     print("  clearml:   /api-url /project-id /model-id")
@@ -77,6 +68,41 @@ def help_me() -> None:
     print("  zenml:     /api-url")
     print("  kubeflow:  /api-url")
     print("")
+    print("Diagnostics (any module):")
+    print("  /timing                 Print per-host HTTP timings (count, p50/p95/p99, bytes, throughput) and the")
+    print("                          retry and cache counters at the end")
+    print("  /timing-log:<file>      Also append one JSON record per request (phases, status, redacted URL) to <file>")
+    print("")
+    print("Output:")
+    print("  /output:table|ndjson|csv  Format of listed records (default: table). ndjson and csv write each record")
+    print("                            to stdout as soon as it arrives; all other messages go to stderr")
+    print("")
+    print("Response cache (list-* modules):")
+    print("  Listing responses are cached under ~/.cache/pymlokit/http (or $PYMLOKIT_CACHE_DIR/http) per credential")
+    print("  and revalidated with ETag/Last-Modified, so unchanged pages come back as 304 Not Modified.")
+    print("  /cache-max-age:<seconds>  Serve entries validated within <seconds> without any request (offline re-reads)")
+    print("  /no-cache                 Neither read nor write the cache")
+    print("")
+    print("Token cache:")
+    print("  /token-cache[:<file>]     Keep login tokens (ClearML) in <file> (default: tokens.json in")
+    print("                            ~/.cache/pymlokit, mode 0600) and reuse them in later runs until they near expiry")
+    print("")
+    print("Inventory:")
+    print("  /inventory[:<file>]       Record what list-* modules enumerate in a SQLite file (default:")
+    print("                            inventory.sqlite3 in ~/.cache/pymlokit) and let download-* modules take")
+    print("                            names from it")
+    print("  pymlokit query-inventory [/inventory:<file>] [/platform:<p>] [/kind:model|dataset|project|...]")
+    print("                           [/name:<pattern>] [/id:<pattern>] [/scope:<s>] [/since:<ISO date>] [/limit:<n>]")
+    print("                            Search the inventory offline; patterns may use * wildcards")
+    print("")
+    print("Batch mode:")
+    print("  pymlokit /batch:<file> [/parallel:<n>] [diagnostic and cache options]")
+    print("                            Run one invocation per line of <file> (or a JSON list of argv lists or")
+    print("                            {\"module\": ..., \"platform\": ...} objects) in one process, sharing")
+    print("                            connections, tokens and sessions; prints a per-job summary at the end")
+    print("                            /timing, /token-cache, /inventory, /output and /cache-max-age go on the")
+    print("                            /batch command line; only list-* jobs use the response cache")
+    print("")
     print("Notes:")
     print("  - Argument format follows the original tool: /key:value (or -key:value).")
     print("  - For full details and platform credential formats, see README_PYTHON.md.")
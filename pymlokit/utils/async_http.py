@@ -0,0 +1,612 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+import weakref
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Iterable, Mapping, TypeVar
+from urllib.parse import urlsplit
+
+from pymlokit.utils import http_cache, metrics, timing
+from pymlokit.utils.http import (
+    DEFAULT_RETRY,
+    MAX_REDIRECTS,
+    POOL_IDLE_TIMEOUT_S,
+    RETRYABLE_ERRORS,
+    STREAM_CHUNK_SIZE,
+    HttpResponse,
+    PoolKey,
+    RetryPolicy,
+    StreamingResponse,
+    _count_retry,
+    _decoder_for,
+    _header,
+    _next_hop,
+    _pool_key,
+    _prepare_headers,
+    _ssl_context,
+    _trace_failed,
+    _uses_proxy,
+    stream_request as _sync_stream_request,
+)
+
+ASYNC_CONCURRENCY = 32
+
+T = TypeVar("T")
+
+
+class _Body:
+    """Raw HTTP/1.1 message body framed by Content-Length, chunked encoding or connection close."""
+
+    def __init__(self, reader: asyncio.StreamReader, length: int | None, chunked: bool) -> None:
+        self._reader = reader
+        self._remaining = length
+        self._chunked = chunked
+        self._chunk_left = 0
+        self.done = length == 0 and not chunked
+        # Without a length or chunking the body ends when the server closes the connection.
+        self.delimited = chunked or length is not None
+
+    async def _next_chunk_size(self) -> int:
+        line = await self._reader.readline()
+        try:
+            return int(line.split(b";", 1)[0].strip(), 16)
+        except ValueError:
+            raise ConnectionError(f"Malformed chunk size line: {line[:40]!r}") from None
+
+    async def read(self, n: int) -> bytes:
+        if self.done:
+            return b""
+        if self._chunked:
+            if self._chunk_left == 0:
+                size = await self._next_chunk_size()
+                if size == 0:
+                    while (await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    self.done = True
+                    return b""
+                self._chunk_left = size
+            data = await self._reader.read(min(n, self._chunk_left))
+            if not data:
+                raise ConnectionError("Connection closed in the middle of a chunk")
+            self._chunk_left -= len(data)
+            if self._chunk_left == 0:
+                await self._reader.readline()
+            return data
+        if self._remaining is None:
+            data = await self._reader.read(n)
+            self.done = not data
+            return data
+        data = await self._reader.read(min(n, self._remaining))
+        if not data:
+            raise ConnectionError(f"Connection closed with {self._remaining} body bytes left")
+        self._remaining -= len(data)
+        self.done = self._remaining == 0
+        return data
+
+
+class _ThreadedBody:
+    """Body of a response opened through the synchronous (proxy-aware) client."""
+
+    delimited = False
+
+    def __init__(self, resp: StreamingResponse) -> None:
+        self._resp = resp
+        self.done = False
+
+    async def read(self, n: int) -> bytes:
+        buf = bytearray(n)
+        got = await asyncio.to_thread(self._resp.readinto, buf)
+        self.done = not got
+        return bytes(buf[:got])
+
+
+class AsyncStreamingResponse:
+    """An open response whose body is read with ``await``.
+
+    Mirrors ``StreamingResponse``: the connection goes back to the event loop's
+    pool on ``aclose()`` once the body has been fully read.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        body: _Body | _ThreadedBody,
+        timeout_s: float,
+        reader: asyncio.StreamReader | None = None,
+        writer: asyncio.StreamWriter | None = None,
+        pool_key: PoolKey | None = None,
+        will_close: bool = True,
+        decode: bool = False,
+        sync_resp: StreamingResponse | None = None,
+        trace: timing.RequestTiming | None = None,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self._body = body
+        self._timeout_s = timeout_s
+        self._reader = reader
+        self._writer = writer
+        self._pool_key = pool_key
+        self._will_close = will_close
+        self._sync_resp = sync_resp
+        self._closed = False
+        self._decoder = _decoder_for(self.header("Content-Encoding")) if decode else None
+        self._pending = b""
+        self._eof = False
+        self._trace = trace
+        self._head_at = time.perf_counter()
+        self.bytes_received = 0
+
+    def header(self, name: str, default: str = "") -> str:
+        return _header(self.headers, name, default)
+
+    async def _raw_read(self, n: int) -> bytes:
+        data = await asyncio.wait_for(self._body.read(n), self._timeout_s)
+        self.bytes_received += len(data)
+        return data
+
+    async def _read(self, n: int) -> bytes:
+        if self._decoder is None:
+            return await self._raw_read(n)
+        while not self._pending and not self._eof:
+            data = await self._raw_read(n)
+            if data:
+                self._pending = self._decoder.decompress(data)
+            else:
+                self._pending = self._decoder.flush()
+                self._eof = True
+        out, self._pending = self._pending[:n], self._pending[n:]
+        return out
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.iter_chunks()])
+
+    async def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self._read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    async def copy_to(self, fileobj: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+        written = 0
+        async for chunk in self.iter_chunks(chunk_size):
+            fileobj.write(chunk)
+            written += len(chunk)
+        return written
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._trace is not None:
+            self._trace.transfer_s = time.perf_counter() - self._head_at
+            self._trace.bytes_received = self.bytes_received
+            timing.finish(self._trace)
+        if self._sync_resp is not None:
+            await asyncio.to_thread(self._sync_resp.close)
+            return
+        if self._reader is None or self._writer is None or self._pool_key is None:
+            return
+        reusable = self._body.done and self._body.delimited and not self._will_close
+        _pool().release(self._pool_key, self._reader, self._writer, reusable=reusable)
+
+    async def __aenter__(self) -> AsyncStreamingResponse:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+
+class AsyncConnectionPool:
+    """Keep-alive connections of one event loop, grouped like ``ConnectionPool``.
+
+    The loop is single-threaded, so no locking is needed; a connection is
+    owned by one response at a time and returned LIFO. Up to
+    ``max_idle_per_host`` idle connections are kept per host so a fan-out
+    bounded by ``gather_limited`` (or a semaphore of ``ASYNC_CONCURRENCY``) does
+    not churn connections; the pool itself does not limit open connections.
+    """
+
+    def __init__(
+        self, max_idle_per_host: int = ASYNC_CONCURRENCY, idle_timeout_s: float = POOL_IDLE_TIMEOUT_S
+    ) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout_s = idle_timeout_s
+        self._idle: dict[PoolKey, list[tuple[float, asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+
+    async def _connect_socket(self, host: str, port: int, timeout_s: float) -> tuple[socket.socket, dict[str, float]]:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        infos = await asyncio.wait_for(loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout_s)
+        resolved = time.perf_counter()
+        err: OSError | None = None
+        for family, type_, proto, _, sockaddr in infos:
+            sock = socket.socket(family, type_, proto)
+            sock.setblocking(False)
+            try:
+                await asyncio.wait_for(loop.sock_connect(sock, sockaddr), timeout_s)
+            except OSError as e:
+                sock.close()
+                err = e
+                continue
+            return sock, {"dns": resolved - started, "connect": time.perf_counter() - resolved}
+        raise err or OSError(f"getaddrinfo returned no addresses for {host}")
+
+    async def acquire(
+        self, key: PoolKey, timeout_s: float
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, dict[str, float] | None]:
+        """Return a connection for ``key`` and its setup phases, or None for the phases when it was reused."""
+        now = time.monotonic()
+        idle = self._idle.get(key, [])
+        while idle:
+            last_used, reader, writer = idle.pop()
+            if now - last_used > self.idle_timeout_s or reader.at_eof() or writer.is_closing():
+                writer.close()
+                continue
+            return reader, writer, None
+        scheme, host, port, verify_ssl = key
+        sock, phases = await self._connect_socket(host, port, timeout_s)
+        ctx = _ssl_context(verify_ssl) if scheme == "https" else None
+        started = time.perf_counter()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(sock=sock, ssl=ctx, server_hostname=host if ctx else None), timeout_s
+            )
+        except BaseException:
+            sock.close()
+            raise
+        if ctx is not None:
+            phases["tls"] = time.perf_counter() - started
+        return reader, writer, phases
+
+    def release(
+        self, key: PoolKey, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, reusable: bool = True
+    ) -> None:
+        if reusable and not writer.is_closing():
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((time.monotonic(), reader, writer))
+                return
+        writer.close()
+
+    async def close(self) -> None:
+        writers = [writer for idle in self._idle.values() for _, _, writer in idle]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+
+
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncConnectionPool] = weakref.WeakKeyDictionary()
+
+
+def _pool() -> AsyncConnectionPool:
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = _POOLS[loop] = AsyncConnectionPool()
+    return pool
+
+
+async def close_connections() -> None:
+    pool = _POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+def run(main: Awaitable[T]) -> T:
+    """Run ``main`` on a fresh event loop and close its pooled connections afterwards."""
+
+    async def runner() -> T:
+        try:
+            return await main
+        finally:
+            await close_connections()
+
+    return asyncio.run(runner())
+
+
+async def gather_limited(aws: Iterable[Awaitable[T]], limit: int = ASYNC_CONCURRENCY) -> list[T]:
+    """Await ``aws`` with at most ``limit`` in flight; results keep the input order."""
+    sem = asyncio.Semaphore(limit)
+
+    async def bounded(aw: Awaitable[T]) -> T:
+        async with sem:
+            return await aw
+
+    return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+
+def _encode_request(
+    method: str, target: str, host: str, headers: Mapping[str, str], body: bytes | None
+) -> bytes:
+    lines = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+    names = {k.lower() for k in headers}
+    if "accept-encoding" not in names:
+        lines.append("Accept-Encoding: identity")
+    if body is not None or method in ("POST", "PUT", "PATCH"):
+        lines.append(f"Content-Length: {len(body or b'')}")
+    for k, v in headers.items():
+        if k.lower() in ("host", "content-length"):
+            continue
+        if any(c in f"{k}{v}" for c in "\r\n"):
+            raise ValueError(f"Invalid header: {k!r}")
+        lines.append(f"{k}: {v}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[int, dict[str, str], bool]:
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection without sending a response")
+        version, _, rest = line.decode("latin-1").strip().partition(" ")
+        if not version.startswith("HTTP/"):
+            raise ConnectionError(f"Malformed status line: {line[:40]!r}")
+        status = int(rest.split(" ", 1)[0])
+        headers: dict[str, str] = {}
+        while True:
+            h = await reader.readline()
+            if h in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = h.decode("latin-1").partition(":")
+            headers[k.strip()] = v.strip()
+        if not 100 <= status < 200:
+            break
+    connection = _header(headers, "Connection", "").lower()
+    will_close = "close" in connection or (version == "HTTP/1.0" and "keep-alive" not in connection)
+    return status, headers, will_close
+
+
+async def _pooled_open(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    body: bytes | None,
+    timeout_s: float,
+    verify_ssl: bool,
+    decode: bool,
+) -> AsyncStreamingResponse:
+    parts = urlsplit(url)
+    key = _pool_key(parts, verify_ssl)
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+    message = _encode_request(method, target, parts.netloc.rpartition("@")[2], headers, body)
+    pool = _pool()
+    while True:
+        trace = timing.start(method, url)
+        try:
+            reader, writer, phases = await pool.acquire(key, timeout_s)
+        except BaseException as e:
+            _trace_failed(trace, e)
+            raise
+        try:
+            writer.write(message)
+            await asyncio.wait_for(writer.drain(), timeout_s)
+            sent = time.perf_counter()
+            status, resp_headers, will_close = await asyncio.wait_for(_read_head(reader), timeout_s)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            writer.close()
+            _trace_failed(trace, e)
+            # The server may drop a keep-alive connection while it sits idle in the pool.
+            if phases is None:
+                continue
+            raise
+        except BaseException as e:
+            writer.close()
+            _trace_failed(trace, e)
+            raise
+        if trace is not None:
+            trace.status, trace.reused, trace.bytes_sent = status, phases is None, len(body or b"")
+            trace.ttfb_s = time.perf_counter() - sent
+            if phases is not None:
+                trace.set_phases(phases)
+        chunked = "chunked" in _header(resp_headers, "Transfer-Encoding", "").lower()
+        length: int | None = None
+        if method == "HEAD" or status in (204, 304):
+            length = 0
+        elif not chunked:
+            try:
+                length = int(_header(resp_headers, "Content-Length", ""))
+            except ValueError:
+                length = None
+        return AsyncStreamingResponse(
+            status,
+            resp_headers,
+            _Body(reader, length, chunked),
+            timeout_s,
+            reader=reader,
+            writer=writer,
+            pool_key=key,
+            will_close=will_close,
+            decode=decode,
+            trace=trace,
+        )
+
+
+async def _threaded_open(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None,
+    body: bytes | None,
+    timeout_s: float,
+    verify_ssl: bool,
+    compressed: bool,
+    retry: RetryPolicy,
+) -> AsyncStreamingResponse:
+    resp = await asyncio.to_thread(
+        _sync_stream_request, method, url, headers, body, timeout_s, verify_ssl, compressed, retry
+    )
+    return AsyncStreamingResponse(resp.status, resp.headers, _ThreadedBody(resp), timeout_s, sync_resp=resp)
+
+
+async def _open(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    body: bytes | None,
+    timeout_s: float,
+    verify_ssl: bool,
+    decode: bool,
+    retry: RetryPolicy,
+) -> AsyncStreamingResponse:
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            resp = await _pooled_open(method, url, headers, body, timeout_s, verify_ssl, decode)
+        except (*RETRYABLE_ERRORS, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            wait = retry.delay(method, attempt, time.monotonic() - started)
+            if wait is None:
+                if attempt > 1:
+                    metrics.incr("http.retries_exhausted")
+                raise
+            _count_retry(0, wait)
+            await asyncio.sleep(wait)
+            continue
+        if resp.status not in retry.statuses:
+            return resp
+        wait = retry.delay(method, attempt, time.monotonic() - started, resp.status, resp.header("Retry-After"))
+        if wait is None:
+            if attempt > 1:
+                metrics.incr("http.retries_exhausted")
+            return resp
+        await resp.read()
+        await resp.aclose()
+        _count_retry(resp.status, wait)
+        await asyncio.sleep(wait)
+
+
+async def stream_request(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    body: bytes | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    compressed: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> AsyncStreamingResponse:
+    """Async counterpart of ``http.stream_request``, built on ``asyncio.open_connection``.
+
+    Requests that go through an environment proxy run on the synchronous client
+    in a worker thread.
+    """
+    method = method.upper()
+    if _uses_proxy(urlsplit(url)):
+        return await _threaded_open(method, url, headers, body, timeout_s, verify_ssl, compressed, retry)
+    h, decode = _prepare_headers(headers, compressed)
+    for _ in range(MAX_REDIRECTS):
+        resp = await _open(method, url, h, body, timeout_s, verify_ssl, decode, retry)
+        hop = _next_hop(method, url, h, body, resp.status, resp.header("Location"))
+        if hop is None:
+            return resp
+        await resp.read()
+        await resp.aclose()
+        method, url, h, body = hop
+    return await _open(method, url, h, body, timeout_s, verify_ssl, decode, retry)
+
+
+async def request(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    body: bytes | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    compressed: bool = True,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> HttpResponse:
+    async with await stream_request(
+        method,
+        url,
+        headers=headers,
+        body=body,
+        timeout_s=timeout_s,
+        verify_ssl=verify_ssl,
+        compressed=compressed,
+        retry=retry,
+    ) as resp:
+        return HttpResponse(status=resp.status, headers=resp.headers, body=await resp.read())
+
+
+async def download_to_file(
+    url: str,
+    out_path: str | os.PathLike[str],
+    headers: Mapping[str, str] | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> tuple[int, int]:
+    """GET ``url`` straight into ``out_path``; returns ``(status, bytes_written)``.
+
+    The file is only created when the server answers 200.
+    """
+    async with await stream_request(
+        "GET", url, headers=headers, timeout_s=timeout_s, verify_ssl=verify_ssl, retry=retry
+    ) as resp:
+        if resp.status != 200:
+            await resp.read()
+            return resp.status, 0
+        with open(out_path, "wb") as f:
+            return resp.status, await resp.copy_to(f)
+
+
+async def get_json(
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> tuple[int, Any]:
+    h = {"Content-Type": "application/json", **(dict(headers or {}))}
+    cached = http_cache.lookup("GET", url, h)
+    if cached is not None and cached.fresh():
+        return cached.status, http_cache.hit(cached, revalidated=False)
+    resp = await request(
+        method="GET",
+        url=url,
+        headers={**h, **cached.validators()} if cached is not None else h,
+        timeout_s=timeout_s,
+        verify_ssl=verify_ssl,
+        retry=retry,
+    )
+    if resp.status == 304 and cached is not None:
+        return cached.status, http_cache.hit(cached, revalidated=True)
+    payload = json.loads(resp.body.decode("utf-8", errors="replace")) if resp.body else None
+    http_cache.store("GET", url, h, resp.status, resp.headers, payload)
+    return resp.status, payload
+
+
+async def post_json(
+    url: str,
+    payload: Any,
+    headers: Mapping[str, str] | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> tuple[int, Any]:
+    body = json.dumps(payload).encode("utf-8")
+    resp = await request(
+        method="POST",
+        url=url,
+        headers={"Content-Type": "application/json", **(dict(headers or {}))},
+        body=body,
+        timeout_s=timeout_s,
+        verify_ssl=verify_ssl,
+        retry=retry,
+    )
+    if not resp.body:
+        return resp.status, None
+    return resp.status, json.loads(resp.body.decode("utf-8", errors="replace"))
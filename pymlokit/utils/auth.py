@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+
+from pymlokit.utils.token_cache import jwt_expiry
+
+AUTH_FAILURE_STATUSES = (401, 403)
+
+
+class InvalidCredentials(RuntimeError):
+    """The platform rejected the credential, or a bearer token is already past its expiry."""
+
+
+def raise_for_auth(platform: str, status: int, statuses: tuple[int, ...] = AUTH_FAILURE_STATUSES) -> None:
+    """Raise InvalidCredentials when ``status`` is one of ``statuses`` (401/403 by default).
+
+    Lets a module treat its first real request as the credential check instead of
+    spending a separate round trip on ``creds_valid``. Calls scoped to a single
+    resource pass ``(401,)``: there a 403 only means that resource is off limits.
+    """
+    if status in statuses:
+        raise InvalidCredentials(f"{platform} returned HTTP {status}")
+
+
+def raise_for_status(
+    platform: str,
+    status: int,
+    expected: tuple[int, ...] = (200,),
+    auth_statuses: tuple[int, ...] = AUTH_FAILURE_STATUSES,
+) -> None:
+    """Like ``raise_for_auth``, and also raise RuntimeError for any other status not in ``expected``."""
+    if status in expected:
+        return
+    raise_for_auth(platform, status, auth_statuses)
+    raise RuntimeError(f"{platform} returned HTTP {status}")
+
+
+def token_expired(token: str) -> bool:
+    """True when ``token`` is a JWT whose ``exp`` has passed; opaque tokens are never reported expired."""
+    if token.lower().startswith("bearer "):
+        token = token[7:]
+    exp = jwt_expiry(token.strip())
+    return exp is not None and exp <= time.time()
+
+
+def bearer_headers(token: str) -> dict[str, str]:
+    """Authorization header for ``token``, refusing locally (no request) if it has expired."""
+    if token_expired(token):
+        raise InvalidCredentials("Bearer token has expired")
+    return {"Authorization": f"Bearer {token}"}
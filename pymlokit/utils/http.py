@@ -1,13 +1,49 @@
 from __future__ import annotations
 
+import functools
+import http.client
 import json
+import os
+import random
+import socket
 import ssl
+import threading
+import time
 import urllib.error
 import urllib.request
+import zlib
 from dataclasses import dataclass
-from typing import Any, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any, BinaryIO, Iterator, Mapping
+from urllib.parse import SplitResult, urljoin, urlsplit
 
 from pymlokit.constants import USER_AGENT
+from pymlokit.utils import http_cache, metrics, timing
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+POOL_MAX_IDLE_PER_HOST = 8
+POOL_IDLE_TIMEOUT_S = 30.0
+MAX_REDIRECTS = 10
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_CONTENT_HEADERS = ("content-length", "content-type")
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+PoolKey = tuple[str, str, int, bool]
+
+
+def _header(headers: Mapping[str, str], name: str, default: str) -> str:
+    name_l = name.lower()
+    for k, v in headers.items():
+        if k.lower() == name_l:
+            return v
+    return default
 
 
 @dataclass(frozen=True)
@@ -16,16 +52,563 @@ class HttpResponse:
     headers: Mapping[str, str]
     body: bytes
 
+    def header(self, name: str, default: str = "") -> str:
+        return _header(self.headers, name, default)
+
 
-def _ssl_context(verify_ssl: bool) -> ssl.SSLContext | None:
-    if verify_ssl:
+def parse_retry_after(value: str, now: float | None = None) -> float | None:
+    """Seconds to wait according to a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    value = value.strip()
+    if not value:
         return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None or when.tzinfo is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a request.
+
+    Retryable statuses and connection errors are retried with exponential
+    backoff and full jitter, or after the server's ``Retry-After``. Methods
+    outside ``idempotent_methods`` are only retried on 429, which means the
+    request was not processed. Retrying stops after ``max_attempts`` sends
+    or once waiting would exceed ``max_total_s``.
+    """
+
+    max_attempts: int = 5
+    base_delay_s: float = 0.5
+    max_delay_s: float = 30.0
+    max_total_s: float = 120.0
+    statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def delay(self, method: str, attempt: int, elapsed_s: float, status: int = 0, retry_after: str = "") -> float | None:
+        """Seconds to sleep before re-sending after ``attempt`` failed sends, or None to give up.
+
+        ``status`` is 0 when the attempt failed with a connection error.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status and status not in self.statuses:
+            return None
+        if method not in self.idempotent_methods and status != 429:
+            return None
+        wait = parse_retry_after(retry_after)
+        if wait is None:
+            wait = random.uniform(0, min(self.max_delay_s, self.base_delay_s * 2 ** (attempt - 1)))
+        if elapsed_s + wait > self.max_total_s:
+            return None
+        return wait
+
+
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+# Errors after which a request may be re-sent. http.client.HTTPException covers
+# malformed or truncated responses; OSError covers resets, refusals and timeouts.
+RETRYABLE_ERRORS = (http.client.HTTPException, OSError)
+
+
+def _count_retry(status: int, wait: float) -> None:
+    metrics.incr("http.retries")
+    metrics.incr(f"http.retries.{status}" if status else "http.retries.connection_error")
+    metrics.incr("http.retry_wait_s", wait)
+
+
+class _Decoder:
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._obj = brotli.Decompressor()
+        elif encoding == "gzip":
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            self._obj = zlib.decompressobj()
+        self._started = False
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._obj.process(data)
+        if self.encoding == "deflate" and not self._started:
+            self._started = True
+            try:
+                return self._obj.decompress(data)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib wrapper.
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            return b""
+        return self._obj.flush()
+
+
+def _decoder_for(content_encoding: str) -> _Decoder | None:
+    encoding = content_encoding.strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return _Decoder("gzip")
+    if encoding == "deflate":
+        return _Decoder("deflate")
+    if encoding == "br" and brotli is not None:
+        return _Decoder("br")
+    return None
+
+
+class StreamingResponse:
+    """Response whose body is read incrementally from the open connection.
+
+    The connection goes back to the pool on ``close()`` once the body has been
+    fully read; a partially read response closes its connection instead. With
+    ``decode`` set, a gzip/deflate/br body is decompressed incrementally as it
+    is read.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        raw: Any,
+        conn: http.client.HTTPConnection | None = None,
+        pool_key: PoolKey | None = None,
+        decode: bool = False,
+        trace: timing.RequestTiming | None = None,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self._raw = raw
+        self._conn = conn
+        self._pool_key = pool_key
+        self._closed = False
+        self._decoder = _decoder_for(self.header("Content-Encoding")) if decode else None
+        self._pending = b""
+        self._eof = False
+        self._trace = trace
+        self._head_at = time.perf_counter()
+        self.bytes_received = 0
+
+    def header(self, name: str, default: str = "") -> str:
+        return _header(self.headers, name, default)
+
+    def _raw_read(self, n: int | None = None) -> bytes:
+        data = self._raw.read(n)
+        self.bytes_received += len(data)
+        return data
+
+    def _read(self, n: int) -> bytes:
+        if self._decoder is None:
+            return self._raw_read(n)
+        while not self._pending and not self._eof:
+            data = self._raw_read(n)
+            if data:
+                self._pending = self._decoder.decompress(data)
+            else:
+                self._pending = self._decoder.flush()
+                self._eof = True
+        out, self._pending = self._pending[:n], self._pending[n:]
+        return out
+
+    def read(self) -> bytes:
+        if self._decoder is None:
+            return self._raw_read()
+        return b"".join(self.iter_chunks())
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        while True:
+            chunk = self._read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def readinto(self, buf: memoryview | bytearray) -> int:
+        if self._decoder is None:
+            n = self._raw.readinto(buf)
+            self.bytes_received += n
+            return n
+        data = self._read(len(buf))
+        buf[: len(data)] = data
+        return len(data)
+
+    def copy_to(self, fileobj: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+        buf = memoryview(bytearray(chunk_size))
+        total = 0
+        while True:
+            n = self.readinto(buf)
+            if not n:
+                return total
+            fileobj.write(buf[:n])
+            total += n
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._trace is not None:
+            self._trace.transfer_s = time.perf_counter() - self._head_at
+            self._trace.bytes_received = self.bytes_received
+            timing.finish(self._trace)
+        if self._conn is None or self._pool_key is None:
+            self._raw.close()
+            return
+        _POOL.release(self._pool_key, self._conn, reusable=self._raw.isclosed() and not self._raw.will_close)
+
+    def __enter__(self) -> StreamingResponse:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    # Loading the CA store is the expensive part of context setup, so both variants are built once.
     ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
+    if not verify_ssl:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
     return ctx
 
 
+class _PhaseTimingMixin:
+    """Resolves and connects in separate steps so both can be timed; results land in ``phases``."""
+
+    phases: dict[str, float]
+
+    def _timed_create_connection(
+        self, address: tuple[str, int], timeout: float | None = None, source_address: tuple[str, int] | None = None
+    ) -> socket.socket:
+        host, port = address
+        started = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        resolved = time.perf_counter()
+        err: OSError | None = None
+        for *_, sockaddr in infos:
+            try:
+                sock = socket.create_connection(sockaddr[:2], timeout, source_address)
+            except OSError as e:
+                err = e
+                continue
+            self.phases = {"dns": resolved - started, "connect": time.perf_counter() - resolved}
+            return sock
+        raise err or OSError(f"getaddrinfo returned no addresses for {host}")
+
+
+class _HTTPConnection(_PhaseTimingMixin, http.client.HTTPConnection):
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        super().__init__(host, port, timeout=timeout)
+        self.phases = {}
+        self._create_connection = self._timed_create_connection
+
+
+class _ResumingHTTPSConnection(_PhaseTimingMixin, http.client.HTTPSConnection):
+    """HTTPS connection that offers the last TLS session seen for its host."""
+
+    def __init__(self, host: str, port: int, timeout: float, context: ssl.SSLContext, session: ssl.SSLSession | None) -> None:
+        super().__init__(host, port, timeout=timeout, context=context)
+        self.tls_session = session
+        self.phases = {}
+        self._create_connection = self._timed_create_connection
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        started = time.perf_counter()
+        self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname, session=self.tls_session)
+        self.phases["tls"] = time.perf_counter() - started
+
+    def getresponse(self) -> http.client.HTTPResponse:
+        # TLS 1.3 tickets arrive after the handshake, and the socket is dropped here on
+        # "Connection: close", so the session is captured once the response head is read.
+        sock = self.sock
+        resp = super().getresponse()
+        if sock is not None and sock.session is not None:
+            self.tls_session = sock.session
+        return resp
+
+
+class ConnectionPool:
+    """Keep-alive connections grouped per (scheme, host, port, verify_ssl).
+
+    A connection is handed to one caller at a time; idle connections older than
+    ``idle_timeout_s`` are closed and at most ``max_idle_per_host`` are kept per
+    host. The pool does not limit how many connections are open to a host at
+    once: a caller that needs a new one always gets it, and connections
+    returned beyond the idle limit are closed. Callers that fan out to one host
+    keep their own concurrency at or below ``POOL_MAX_IDLE_PER_HOST`` (see
+    transfer.HOST_CONNECTIONS) so every connection they open is reused.
+    """
+
+    def __init__(
+        self, max_idle_per_host: int = POOL_MAX_IDLE_PER_HOST, idle_timeout_s: float = POOL_IDLE_TIMEOUT_S
+    ) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout_s = idle_timeout_s
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, list[tuple[float, http.client.HTTPConnection]]] = {}
+        self._tls_sessions: dict[PoolKey, ssl.SSLSession] = {}
+
+    def _connect(self, key: PoolKey, timeout_s: float) -> http.client.HTTPConnection:
+        scheme, host, port, verify_ssl = key
+        if scheme != "https":
+            return _HTTPConnection(host, port, timeout_s)
+        with self._lock:
+            session = self._tls_sessions.get(key)
+        return _ResumingHTTPSConnection(host, port, timeout_s, _ssl_context(verify_ssl), session)
+
+    def _remember_session(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        session = getattr(conn, "tls_session", None)
+        if session is not None:
+            with self._lock:
+                self._tls_sessions[key] = session
+
+    def _evict_expired(self, now: float) -> list[http.client.HTTPConnection]:
+        expired = []
+        for key in list(self._idle):
+            keep = []
+            for last_used, conn in self._idle[key]:
+                if now - last_used > self.idle_timeout_s:
+                    expired.append(conn)
+                else:
+                    keep.append((last_used, conn))
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        return expired
+
+    def acquire(self, key: PoolKey, timeout_s: float) -> tuple[http.client.HTTPConnection, bool]:
+        conn = None
+        with self._lock:
+            expired = self._evict_expired(time.monotonic())
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()[1]
+        for c in expired:
+            c.close()
+        if conn is None:
+            return self._connect(key, timeout_s), False
+        conn.timeout = timeout_s
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout_s)
+        return conn, True
+
+    def release(self, key: PoolKey, conn: http.client.HTTPConnection, reusable: bool = True) -> None:
+        self._remember_session(key, conn)
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append((time.monotonic(), conn))
+                    return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [conn for idle in self._idle.values() for _, conn in idle]
+            self._idle.clear()
+            self._tls_sessions.clear()
+        for conn in conns:
+            conn.close()
+
+
+_POOL = ConnectionPool()
+
+
+def close_connections() -> None:
+    _POOL.close()
+
+
+def _pool_key(parts: SplitResult, verify_ssl: bool) -> PoolKey:
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme: {parts.scheme}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    return scheme, parts.hostname or "", port, verify_ssl and scheme == "https"
+
+
+def _uses_proxy(parts: SplitResult) -> bool:
+    proxies = urllib.request.getproxies()
+    return parts.scheme.lower() in proxies and not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _urllib_open(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    body: bytes | None,
+    timeout_s: float,
+    verify_ssl: bool,
+    decode: bool,
+) -> StreamingResponse:
+    req = urllib.request.Request(url=url, data=body, method=method, headers=dict(headers))
+    trace = timing.start(method, url)
+    started = time.perf_counter()
+    try:
+        resp = urllib.request.urlopen(req, timeout=timeout_s, context=_ssl_context(verify_ssl))
+        status, resp_headers = int(resp.status), dict(resp.headers.items())
+    except urllib.error.HTTPError as e:
+        resp, status, resp_headers = e, int(e.code), dict(e.headers.items())
+    except BaseException as e:
+        _trace_failed(trace, e)
+        raise
+    if trace is not None:
+        # Proxied requests go through urllib, which does not expose connection phases.
+        trace.status, trace.ttfb_s, trace.bytes_sent = status, time.perf_counter() - started, len(body or b"")
+    return StreamingResponse(status, resp_headers, resp, decode=decode, trace=trace)
+
+
+def _trace_failed(trace: timing.RequestTiming | None, error: BaseException) -> None:
+    if trace is not None:
+        trace.error = type(error).__name__
+        timing.finish(trace)
+
+
+def _pooled_open(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    body: bytes | None,
+    timeout_s: float,
+    verify_ssl: bool,
+    decode: bool,
+) -> StreamingResponse:
+    parts = urlsplit(url)
+    key = _pool_key(parts, verify_ssl)
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+    while True:
+        trace = timing.start(method, url)
+        conn, reused = _POOL.acquire(key, timeout_s)
+        try:
+            conn.request(method, target, body=body, headers=dict(headers))
+            sent = time.perf_counter()
+            resp = conn.getresponse()
+        except (http.client.BadStatusLine, ConnectionError) as e:
+            conn.close()
+            _trace_failed(trace, e)
+            # The server may drop a keep-alive connection while it sits idle in the pool.
+            if reused:
+                continue
+            raise
+        except BaseException as e:
+            conn.close()
+            _trace_failed(trace, e)
+            raise
+        if trace is not None:
+            trace.status, trace.reused, trace.bytes_sent = int(resp.status), reused, len(body or b"")
+            trace.ttfb_s = time.perf_counter() - sent
+            if not reused:
+                trace.set_phases(conn.phases)
+        return StreamingResponse(
+            int(resp.status), dict(resp.getheaders()), resp, conn=conn, pool_key=key, decode=decode, trace=trace
+        )
+
+
+def _prepare_headers(headers: Mapping[str, str] | None, compressed: bool) -> tuple[dict[str, str], bool]:
+    h = dict(headers or {})
+    h.setdefault("User-Agent", USER_AGENT)
+    decode = compressed and not any(k.lower() == "accept-encoding" for k in h)
+    if decode:
+        h["Accept-Encoding"] = ACCEPT_ENCODING
+    return h, decode
+
+
+def _next_hop(
+    method: str, url: str, headers: dict[str, str], body: bytes | None, status: int, location: str
+) -> tuple[str, str, dict[str, str], bytes | None] | None:
+    """Return the request to send after a redirect, following it the way urllib's default handler does."""
+    if status not in _REDIRECT_CODES or not location:
+        return None
+    if not (method in ("GET", "HEAD") or (status in (301, 302, 303) and method == "POST")):
+        return None
+    if method == "POST":
+        method, body = "GET", None
+    headers = {k: v for k, v in headers.items() if k.lower() not in _CONTENT_HEADERS}
+    return method, urljoin(url, location), headers, body
+
+
+def _open(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    body: bytes | None,
+    timeout_s: float,
+    verify_ssl: bool,
+    decode: bool,
+    retry: RetryPolicy,
+) -> StreamingResponse:
+    opener = _urllib_open if _uses_proxy(urlsplit(url)) else _pooled_open
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            resp = opener(method, url, headers, body, timeout_s, verify_ssl, decode)
+        except RETRYABLE_ERRORS:
+            wait = retry.delay(method, attempt, time.monotonic() - started)
+            if wait is None:
+                if attempt > 1:
+                    metrics.incr("http.retries_exhausted")
+                raise
+            _count_retry(0, wait)
+            time.sleep(wait)
+            continue
+        if resp.status not in retry.statuses:
+            return resp
+        wait = retry.delay(method, attempt, time.monotonic() - started, resp.status, resp.header("Retry-After"))
+        if wait is None:
+            if attempt > 1:
+                metrics.incr("http.retries_exhausted")
+            return resp
+        resp.read()
+        resp.close()
+        _count_retry(resp.status, wait)
+        time.sleep(wait)
+
+
+def stream_request(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    body: bytes | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    compressed: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> StreamingResponse:
+    """Open ``url`` and return the response with its body still unread.
+
+    ``compressed`` advertises gzip/deflate (and br when ``brotli`` is installed)
+    and decodes the body transparently. It is off by default so artifact
+    downloads and byte ranges always see the stored bytes. Transient failures
+    are re-sent according to ``retry``; the last response is returned as is.
+    """
+    h, decode = _prepare_headers(headers, compressed)
+    method = method.upper()
+    if _uses_proxy(urlsplit(url)):
+        # urllib follows redirects itself.
+        return _open(method, url, h, body, timeout_s, verify_ssl, decode, retry)
+
+    for _ in range(MAX_REDIRECTS):
+        resp = _open(method, url, h, body, timeout_s, verify_ssl, decode, retry)
+        hop = _next_hop(method, url, h, body, resp.status, resp.header("Location"))
+        if hop is None:
+            return resp
+        resp.read()
+        resp.close()
+        method, url, h, body = hop
+    return _open(method, url, h, body, timeout_s, verify_ssl, decode, retry)
+
+
 def request(
     method: str,
     url: str,
@@ -33,19 +616,40 @@ def request(
     body: bytes | None = None,
     timeout_s: float = 60.0,
     verify_ssl: bool = False,
+    compressed: bool = True,
+    retry: RetryPolicy = DEFAULT_RETRY,
 ) -> HttpResponse:
-    h = dict(headers or {})
-    h.setdefault("User-Agent", USER_AGENT)
-    req = urllib.request.Request(url=url, data=body, method=method.upper(), headers=h)
-    try:
-        with urllib.request.urlopen(req, timeout=timeout_s, context=_ssl_context(verify_ssl)) as resp:
-            return HttpResponse(
-                status=int(resp.status),
-                headers=dict(resp.headers.items()),
-                body=resp.read(),
-            )
-    except urllib.error.HTTPError as e:
-        return HttpResponse(status=int(e.code), headers=dict(e.headers.items()), body=e.read())
+    with stream_request(
+        method,
+        url,
+        headers=headers,
+        body=body,
+        timeout_s=timeout_s,
+        verify_ssl=verify_ssl,
+        compressed=compressed,
+        retry=retry,
+    ) as resp:
+        return HttpResponse(status=resp.status, headers=resp.headers, body=resp.read())
+
+
+def download_to_file(
+    url: str,
+    out_path: str | os.PathLike[str],
+    headers: Mapping[str, str] | None = None,
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> tuple[int, int]:
+    """GET ``url`` straight into ``out_path``; returns ``(status, bytes_written)``.
+
+    The file is only created when the server answers 200.
+    """
+    with stream_request("GET", url, headers=headers, timeout_s=timeout_s, verify_ssl=verify_ssl, retry=retry) as resp:
+        if resp.status != 200:
+            resp.read()
+            return resp.status, 0
+        with open(out_path, "wb") as f:
+            return resp.status, resp.copy_to(f)
 
 
 def get_json(
@@ -53,17 +657,25 @@ def get_json(
     headers: Mapping[str, str] | None = None,
     timeout_s: float = 60.0,
     verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
 ) -> tuple[int, Any]:
+    h = {"Content-Type": "application/json", **(dict(headers or {}))}
+    cached = http_cache.lookup("GET", url, h)
+    if cached is not None and cached.fresh():
+        return cached.status, http_cache.hit(cached, revalidated=False)
     resp = request(
         method="GET",
         url=url,
-        headers={"Content-Type": "application/json", **(dict(headers or {}))},
+        headers={**h, **cached.validators()} if cached is not None else h,
         timeout_s=timeout_s,
         verify_ssl=verify_ssl,
+        retry=retry,
     )
-    if not resp.body:
-        return resp.status, None
-    return resp.status, json.loads(resp.body.decode("utf-8", errors="replace"))
+    if resp.status == 304 and cached is not None:
+        return cached.status, http_cache.hit(cached, revalidated=True)
+    payload = json.loads(resp.body.decode("utf-8", errors="replace")) if resp.body else None
+    http_cache.store("GET", url, h, resp.status, resp.headers, payload)
+    return resp.status, payload
 
 
 def post_json(
@@ -72,6 +684,7 @@ def post_json(
     headers: Mapping[str, str] | None = None,
     timeout_s: float = 60.0,
     verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
 ) -> tuple[int, Any]:
     body = json.dumps(payload).encode("utf-8")
     resp = request(
@@ -81,6 +694,7 @@ def post_json(
         body=body,
         timeout_s=timeout_s,
         verify_ssl=verify_ssl,
+        retry=retry,
     )
     if not resp.body:
         return resp.status, None
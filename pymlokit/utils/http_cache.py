@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from pymlokit.utils import metrics
+
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+_FORMAT_VERSION = 1
+
+_lock = threading.Lock()
+_enabled = False
+_directory = ""
+_max_bytes = CACHE_MAX_BYTES
+_max_age_s = 0.0
+_scope = ""
+# name -> (size, last used), loaded from the directory on first use.
+_index: dict[str, tuple[int, float]] | None = None
+# Per-job switch for batch runs; None follows enable()/disable(). Pools started by a
+# job (iterators.ContextThreadPool, asyncio) carry it into their threads.
+_active: ContextVar[bool | None] = ContextVar("pymlokit_http_cache_active", default=None)
+
+
+@dataclass
+class CacheEntry:
+    """A cached JSON response.
+
+    ``validated_at`` is when the server last confirmed the entry (stored as the
+    file's mtime); the file's atime tracks last use for LRU eviction.
+    """
+
+    path: str
+    status: int
+    payload: Any
+    etag: str
+    last_modified: str
+    validated_at: float
+
+    def fresh(self) -> bool:
+        return _max_age_s > 0 and time.time() - self.validated_at < _max_age_s
+
+    def validators(self) -> dict[str, str]:
+        h = {}
+        if self.etag:
+            h["If-None-Match"] = self.etag
+        if self.last_modified:
+            h["If-Modified-Since"] = self.last_modified
+        return h
+
+
+def root_directory() -> str:
+    """PyMLOKit's per-user state directory.
+
+    The response cache, the inventory, the token file and partial downloads live under it.
+    """
+    override = os.environ.get("PYMLOKIT_CACHE_DIR")
+    if override:
+        return override
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return os.path.join(os.environ["LOCALAPPDATA"], "pymlokit", "cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pymlokit")
+
+
+def default_directory() -> str:
+    # A directory of its own: every file in it is an entry that LRU eviction may delete.
+    return os.path.join(root_directory(), "http")
+
+
+def enable(credential: str = "", directory: str = "", max_bytes: int = CACHE_MAX_BYTES, max_age_s: float = 0.0) -> None:
+    """Cache GET JSON responses on disk for the given credential.
+
+    Entries are always revalidated with the stored ETag/Last-Modified, unless
+    ``max_age_s`` is set and the entry was validated less than that many
+    seconds ago, in which case it is served without touching the network.
+    """
+    global _enabled, _directory, _max_bytes, _max_age_s, _scope, _index
+    with _lock:
+        directory = directory or default_directory()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if directory != _directory:
+            _index = None
+        _enabled = True
+        _directory = directory
+        _max_bytes = max_bytes
+        _max_age_s = max_age_s
+        _scope = hashlib.sha256(credential.encode("utf-8")).hexdigest() if credential else ""
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_active(active: bool | None) -> None:
+    """Switch the cache on or off for the current context only (one batch job); None defers to enable()."""
+    _active.set(active)
+
+
+def _in_use() -> bool:
+    return _enabled and _active.get() is not False
+
+
+def _key(method: str, url: str, headers: Mapping[str, str]) -> str:
+    scope = _scope
+    if not scope:
+        auth = "\n".join(f"{k.lower()}:{v}" for k, v in sorted(headers.items()) if k.lower() in ("authorization", "cookie"))
+        scope = hashlib.sha256(auth.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{method.upper()}\n{url}\n{scope}".encode("utf-8")).hexdigest()
+
+
+def _load_index() -> dict[str, tuple[int, float]]:
+    global _index
+    if _index is None:
+        _index = {}
+        with os.scandir(_directory) as it:
+            for de in it:
+                if de.is_file() and not de.name.startswith("."):
+                    st = de.stat()
+                    _index[de.name] = (st.st_size, st.st_atime)
+    return _index
+
+
+def lookup(method: str, url: str, headers: Mapping[str, str]) -> CacheEntry | None:
+    if not _in_use():
+        return None
+    path = os.path.join(_directory, _key(method, url, headers))
+    try:
+        with open(path, "rb") as f:
+            meta = json.loads(f.readline())
+            if meta.get("v") != _FORMAT_VERSION or meta.get("marshal") != [marshal.version, *sys.version_info[:2]]:
+                raise ValueError("cache entry written by another format or Python version")
+            payload = marshal.loads(f.read())
+        validated_at = os.stat(path).st_mtime
+    except (OSError, ValueError, EOFError, TypeError):
+        metrics.incr("http_cache.misses")
+        return None
+    return CacheEntry(
+        path=path,
+        status=int(meta["status"]),
+        payload=payload,
+        etag=meta.get("etag", ""),
+        last_modified=meta.get("last_modified", ""),
+        validated_at=validated_at,
+    )
+
+
+def _touch(entry: CacheEntry, validated: bool) -> None:
+    now = time.time()
+    if validated:
+        entry.validated_at = now
+    try:
+        os.utime(entry.path, (now, entry.validated_at))
+    except OSError:
+        return
+    with _lock:
+        index = _load_index()
+        name = os.path.basename(entry.path)
+        if name in index:
+            index[name] = (index[name][0], now)
+
+
+def hit(entry: CacheEntry, revalidated: bool) -> Any:
+    """Record a use of ``entry`` (fresh, or confirmed by a 304) and return its payload."""
+    metrics.incr("http_cache.revalidated" if revalidated else "http_cache.hits")
+    _touch(entry, validated=revalidated)
+    return entry.payload
+
+
+def store(method: str, url: str, headers: Mapping[str, str], status: int, resp_headers: Mapping[str, str], payload: Any) -> None:
+    if not _in_use() or status != 200:
+        return
+    lowered = {k.lower(): v for k, v in resp_headers.items()}
+    if "no-store" in lowered.get("cache-control", "").lower():
+        return
+    meta = {
+        "v": _FORMAT_VERSION,
+        "marshal": [marshal.version, *sys.version_info[:2]],
+        "status": status,
+        "etag": lowered.get("etag", ""),
+        "last_modified": lowered.get("last-modified", ""),
+    }
+    try:
+        data = json.dumps(meta).encode("utf-8") + b"\n" + marshal.dumps(payload)
+    except ValueError:
+        return
+    name = _key(method, url, headers)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=_directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(_directory, name))
+    except OSError:
+        return
+    metrics.incr("http_cache.stores")
+    with _lock:
+        index = _load_index()
+        index[name] = (len(data), time.time())
+        _evict(index)
+
+
+def _evict(index: dict[str, tuple[int, float]]) -> None:
+    total = sum(size for size, _ in index.values())
+    if total <= _max_bytes:
+        return
+    for name, (size, _) in sorted(index.items(), key=lambda kv: kv[1][1]):
+        try:
+            os.remove(os.path.join(_directory, name))
+        except OSError:
+            pass
+        del index[name]
+        total -= size
+        metrics.incr("http_cache.evictions")
+        if total <= _max_bytes:
+            return
+
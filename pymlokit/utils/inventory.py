@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple, TypeVar
+from urllib.parse import quote
+
+from pymlokit.utils import http_cache
+
+if TYPE_CHECKING:
+    import sqlite3
+
+T = TypeVar("T")
+
+# Records are written in transactions of this many rows while a listing streams past.
+BATCH_ROWS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    platform TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (platform, scope, kind, resource_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS resources_resource_id ON resources (resource_id COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS resources_name ON resources (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS resources_modified ON resources (modified);
+"""
+
+_COLUMNS = "platform, scope, kind, resource_id, name, modified, seen_at, data"
+
+_lock = threading.Lock()
+_path = ""
+_conn: sqlite3.Connection | None = None
+
+
+class InventoryRecord(NamedTuple):
+    """One stored resource; ``scope`` is where it lives (workspace, project, server URL, tenant...)."""
+
+    platform: str
+    scope: str
+    kind: str
+    resource_id: str
+    name: str
+    modified: str
+    seen_at: float
+    data: dict
+
+
+def default_path() -> str:
+    # Beside the response cache, not in it: its LRU eviction deletes any file in its directory.
+    return os.path.join(http_cache.root_directory(), "inventory.sqlite3")
+
+
+_FRACTION = re.compile(r"(\.\d{1,6})\d*")
+
+
+def normalize_time(value: Any) -> str:
+    """``value`` as a UTC ``YYYY-MM-DDTHH:MM:SSZ`` string, so timestamps from every platform compare as text.
+
+    Accepts ISO 8601 / RFC 3339 (any offset, ``Z``, up to nanoseconds; naive
+    means UTC), RFC 2822 dates and epoch seconds or milliseconds. Anything
+    else is returned unchanged; empty stays empty.
+    """
+    text = str(value or "").strip()
+    if not text:
+        return ""
+    try:
+        if text.isdigit():
+            seconds = int(text)
+            dt = datetime.fromtimestamp(seconds / 1000 if seconds > 100_000_000_000 else seconds, tz=timezone.utc)
+        else:
+            try:
+                # Python 3.10's fromisoformat wants exactly 3 or 6 fraction digits and no "Z".
+                iso = text.replace("Z", "+00:00").replace("z", "+00:00")
+                dt = datetime.fromisoformat(_FRACTION.sub(lambda m: m.group(1).ljust(7, "0"), iso, 1))
+            except ValueError:
+                dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return text
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    # Imported here: every module that lists or downloads imports this one, and most runs never open a database.
+    import sqlite3
+
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def enable(path: str = "") -> None:
+    """Record what list modules enumerate into the SQLite file at ``path`` and resolve names from it."""
+    global _path, _conn
+    path = path or default_path()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    with _lock:
+        if _conn is not None and path == _path:
+            return
+        if _conn is not None:
+            _conn.close()
+        _conn = _connect(path)
+        _path = path
+
+
+def disable() -> None:
+    global _path, _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn = None
+        _path = ""
+
+
+def is_enabled() -> bool:
+    return _conn is not None
+
+
+def _write(rows: list[tuple]) -> None:
+    with _lock:
+        if _conn is None:
+            return
+        with _conn:
+            _conn.execute("BEGIN")
+            _conn.executemany(f"INSERT OR REPLACE INTO resources ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def track(
+    records: Iterable[T], platform: str, scope: str, kind: str, *, id: str = "id", name: str = "name", modified: str = ""
+) -> Iterable[T]:
+    """Pass ``records`` through unchanged, upserting each into the inventory on the way when it is enabled.
+
+    ``id``, ``name`` and ``modified`` name the record fields stored in the
+    indexed columns; the whole record is kept as JSON. Rows are written every
+    BATCH_ROWS records and when the iteration ends, so a listing that stops
+    early still records what it saw.
+    """
+    if _conn is None:
+        return records
+    return _tracked(records, platform, scope, kind, id, name, modified)
+
+
+def _tracked(
+    records: Iterable[T], platform: str, scope: str, kind: str, id_field: str, name_field: str, modified_field: str
+) -> Iterator[T]:
+    rows: list[tuple] = []
+    now = time.time()
+    try:
+        for r in records:
+            rid = str(getattr(r, id_field) or "")
+            if rid:
+                rows.append(
+                    (
+                        platform,
+                        scope,
+                        kind,
+                        rid,
+                        str(getattr(r, name_field) or ""),
+                        normalize_time(getattr(r, modified_field)) if modified_field else "",
+                        now,
+                        json.dumps(r._asdict(), default=str, separators=(",", ":")),
+                    )
+                )
+                if len(rows) >= BATCH_ROWS:
+                    _write(rows)
+                    rows = []
+            yield r
+    finally:
+        if rows:
+            _write(rows)
+
+
+def _record(row: tuple) -> InventoryRecord:
+    return InventoryRecord(*row[:7], data=json.loads(row[7]))
+
+
+def lookup(platform: str, scope: str, kind: str, ref: str) -> InventoryRecord | None:
+    """Find ``ref`` among stored resources by ID, then by name (both case-insensitive; newest wins)."""
+    if _conn is None or not ref:
+        return None
+    with _lock:
+        if _conn is None:
+            return None
+        for column in ("resource_id", "name"):
+            row = _conn.execute(
+                f"SELECT {_COLUMNS} FROM resources WHERE {column} = ? COLLATE NOCASE "
+                "AND platform = ? AND scope = ? AND kind = ? ORDER BY modified DESC, seen_at DESC LIMIT 1",
+                (ref, platform, scope, kind),
+            ).fetchone()
+            if row is not None:
+                return _record(row)
+    return None
+
+
+def resolve_id(platform: str, scope: str, kind: str, ref: str) -> str:
+    """Return the stored ID for ``ref`` (an ID or a name), or ``ref`` itself when the inventory has no match."""
+    found = lookup(platform, scope, kind, ref)
+    return found.resource_id if found is not None else ref
+
+
+def find(record_type: Callable[..., T], platform: str, scope: str, kind: str, ref: str) -> T | None:
+    """Like lookup, but rebuild the stored record as ``record_type``; None if absent or stored in another shape."""
+    found = lookup(platform, scope, kind, ref)
+    if found is None:
+        return None
+    try:
+        return record_type(**found.data)
+    except TypeError:
+        return None
+
+
+def query(
+    path: str,
+    platform: str = "",
+    scope: str = "",
+    kind: str = "",
+    name: str = "",
+    resource_id: str = "",
+    since: str = "",
+    limit: int = 0,
+) -> list[InventoryRecord]:
+    """Search the inventory at ``path`` (opened read-only); every filter is optional.
+
+    ``name`` and ``resource_id`` match case-insensitively, exactly or as ``*``
+    wildcard patterns; ``since`` keeps resources modified at or after that
+    timestamp (any form normalize_time accepts, e.g. ``2024-01-01``).
+    """
+    where: list[str] = []
+    params: list[Any] = []
+    for column, value in (("platform", platform.lower()), ("scope", scope), ("kind", kind.lower())):
+        if value:
+            where.append(f"{column} = ?")
+            params.append(value)
+    for column, value in (("name", name), ("resource_id", resource_id)):
+        if not value:
+            continue
+        if "*" in value:
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("*", "%")
+            where.append(f"{column} LIKE ? ESCAPE '\\'")
+            params.append(escaped)
+        else:
+            where.append(f"{column} = ? COLLATE NOCASE")
+            params.append(value)
+    if since:
+        where.append("modified >= ?")
+        params.append(normalize_time(since))
+    sql = f"SELECT {_COLUMNS} FROM resources"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY platform, scope, kind, name"
+    if limit > 0:
+        sql += f" LIMIT {int(limit)}"
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{quote(os.path.abspath(path))}?mode=ro", uri=True)
+    try:
+        return [_record(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
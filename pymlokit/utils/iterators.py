@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Any, Awaitable, Callable, Iterable, Iterator, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+# fetch(link) -> (payload, next link or ""); parse(payload) -> the page's records.
+PageFetch = Callable[[str], tuple[Any, str]]
+
+
+class ContextThreadPool(ThreadPoolExecutor):
+    """A ThreadPoolExecutor whose tasks see the submitting thread's context variables.
+
+    Plain pool threads start from an empty context, which would drop per-job
+    settings such as a batch job's response-cache switch.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def unique_by(records: Iterable[T], key: str) -> Iterator[T]:
+    """Yield each record whose ``key`` field is non-empty and not yet seen, keeping the first one and the input order."""
+    seen: set[str] = set()
+    for r in records:
+        k = getattr(r, key)
+        if not k or k in seen:
+            continue
+        seen.add(k)
+        yield r
+
+
+def started(items: Iterable[T]) -> Iterator[T]:
+    """Run ``items`` up to its first element now and return an iterator over all of it.
+
+    A generator makes no request until it is iterated; calling this inside a
+    ``try`` makes the first page's errors (InvalidCredentials, HTTP failures)
+    surface there instead of halfway through printing the results.
+    """
+    it = iter(items)
+    for first in it:
+        return chain((first,), it)
+    return iter(())
+
+
+def prefetch_pages(fetch: PageFetch, parse: Callable[[Any], Iterable[T]], link: str) -> Iterator[T]:
+    """Yield the records of ``link`` and of every page after it, one page ahead of the caller.
+
+    The first page is fetched in the calling thread. As soon as a page's next
+    link is known, the following page is requested on a background thread
+    while this one is parsed and consumed, so the response time of one page
+    overlaps the work on the previous one. Stopping early leaves at most one
+    request in flight, whose result is dropped.
+    """
+    if not link:
+        return
+    payload, link = fetch(link)
+    pool: ContextThreadPool | None = None
+    try:
+        while True:
+            pending = None
+            if link:
+                pool = pool or ContextThreadPool(max_workers=1, thread_name_prefix="pymlokit-page")
+                pending = pool.submit(fetch, link)
+            yield from parse(payload)
+            if pending is None:
+                return
+            payload, link = pending.result()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def prefetch_pages_async(
+    fetch: Callable[[str], Awaitable[tuple[Any, str]]], parse: Callable[[Any], Iterable[T]], link: str
+) -> list[T]:
+    """prefetch_pages for coroutines: the next page's request is started before this page is parsed."""
+    # Imported here so that sync modules importing this file do not pay for asyncio.
+    import asyncio
+
+    out: list[T] = []
+    if not link:
+        return out
+    payload, link = await fetch(link)
+    while True:
+        pending = asyncio.ensure_future(fetch(link)) if link else None
+        if pending is not None:
+            # Let the request go out before parsing holds the loop.
+            await asyncio.sleep(0)
+        try:
+            out.extend(parse(payload))
+        except BaseException:
+            if pending is not None:
+                pending.cancel()
+            raise
+        if pending is None:
+            return out
+        payload, link = await pending
+
+
+def fan_out(keys: Iterable[K], fetch: Callable[[K], Iterable[T]], workers: int) -> Iterator[T]:
+    """Yield everything ``fetch`` returns for each key, fetching up to ``workers`` keys at once.
+
+    Results come out in the order of ``keys`` however the fetches finish: a
+    key's items are yielded once it and every key before it are done, while
+    the later ones keep running. The first failing fetch (in key order) raises
+    here; stopping early drops the fetches not yet started.
+    """
+    key_list = list(keys)
+    if not key_list:
+        return
+    pool = ContextThreadPool(max_workers=max(1, min(workers, len(key_list))), thread_name_prefix="pymlokit-fan-out")
+    try:
+        futures = [pool.submit(lambda k: list(fetch(k)), k) for k in key_list]
+        for future in futures:
+            yield from future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def first_match(
+    keys: Iterable[K], fetch: Callable[[K], Iterable[T]], predicate: Callable[[T], bool], workers: int
+) -> T | None:
+    """The first item ``predicate`` accepts from any key's ``fetch``, scanning up to ``workers`` keys at once.
+
+    Once a match is found, fetches not yet started are cancelled and running
+    ones stop before their next item (so before their next page). If several
+    keys hold a match, whichever is found first wins.
+    """
+    key_list = list(keys)
+    if not key_list:
+        return None
+    found = threading.Event()
+
+    def scan(key: K) -> T | None:
+        for item in fetch(key):
+            if found.is_set():
+                return None
+            if predicate(item):
+                found.set()
+                return item
+        return None
+
+    pool = ContextThreadPool(max_workers=max(1, min(workers, len(key_list))), thread_name_prefix="pymlokit-fan-out")
+    try:
+        for future in as_completed([pool.submit(scan, k) for k in key_list]):
+            item = future.result()
+            if item is not None:
+                return item
+        return None
+    finally:
+        found.set()
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import Iterable, Sequence, Any
+import csv
+import json
+import sys
+import threading
+from itertools import chain
+from typing import Any, Iterable, Sequence, TextIO
+
+OUTPUT_FORMATS = ("table", "ndjson", "csv")
+
+_lock = threading.Lock()
+_format = "table"
+_stream: TextIO | None = None
 
 
 def format_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> str:
@@ -24,34 +35,70 @@ def format_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> st
     return "\n".join([header_line, sep_line, *body_lines])
 
 
+def set_output(fmt: str, stream: TextIO | None = None) -> None:
+    """Make print_table write ``fmt`` records to ``stream`` (default: sys.stdout at call time).
+
+    "ndjson" and "csv" write and flush each row as soon as it is produced, so a
+    generator of rows is never held in memory; "table" needs every row up front
+    to size the columns.
+    """
+    global _format, _stream
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    _format = fmt
+    _stream = stream
+
+
+def reset_output() -> TextIO | None:
+    """Go back to the text table; returns the stream machine formats were written to, if any."""
+    global _format, _stream
+    stream = _stream
+    _format = "table"
+    _stream = None
+    return stream
+
+
+def _write_records(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+    stream = _stream or sys.stdout
+    if _format == "csv":
+        writer = csv.writer(stream, lineterminator="\n")
+        with _lock:
+            writer.writerow(headers)
+            stream.flush()
+        for row in rows:
+            with _lock:
+                writer.writerow(["" if c is None else c for c in row])
+                stream.flush()
+        return
+    for row in rows:
+        line = json.dumps(dict(zip(headers, row)), default=str)
+        with _lock:
+            stream.write(line + "\n")
+            stream.flush()
+
+
 def print_table(
-    headers_or_data: Sequence[str] | Sequence[dict[str, Any]], 
+    headers_or_data: Sequence[str] | Iterable[dict[str, Any]],
     rows: Iterable[Sequence[object]] | None = None
 ) -> None:
     """
-    Prints a table. 
+    Prints a table (or streams records, see set_output).
     Usage 1: print_table(["Header1", "Header2"], [["Row1Col1", "Row1Col2"], ...])
     Usage 2: print_table([{"Header1": "Val1", "Header2": "Val2"}, ...])
+    Rows may be any iterable, including a generator.
     """
     if rows is None:
-        # Assume usage 2: list of dicts
-        data = headers_or_data
-        if not data:
-            return
-            
-        # Check if it's actually a list of dicts
-        if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            # Infer headers from first item keys
-            headers = list(data[0].keys())
-            # Extract rows
-            extracted_rows = [[d.get(h, "") for h in headers] for d in data]
-            print(format_table(headers, extracted_rows))
+        # Usage 2: dicts; headers come from the first one's keys
+        data = iter(headers_or_data)
+        first = next(data, None)
+        if not isinstance(first, dict):
             return
-        else:
-            # Empty list or not list of dicts?
-            # If it was intended as headers but rows is None, that's invalid usage 1
-            pass
-            
-    # Usage 1
-    if rows is not None:
-        print(format_table(headers_or_data, rows))
+        headers = list(first.keys())
+        rows = ([d.get(h, "") for h in headers] for d in chain([first], data))
+    else:
+        headers = list(headers_or_data)
+
+    if _format != "table":
+        _write_records(headers, rows)
+        return
+    print(format_table(headers, rows))
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Mapping, TextIO
+from urllib.parse import parse_qsl, urlsplit
+
+from pymlokit.utils import metrics
+from pymlokit.utils.table import format_table
+
+# Path segments that identify a resource rather than an endpoint: numbers, UUIDs and
+# hex digests, Palantir RIDs and long opaque tokens.
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F-]{16,}|ri\..+|[A-Za-z0-9_\-.~%]{32,})$")
+
+_lock = threading.Lock()
+_enabled = False
+_records: list[RequestTiming] = []
+_log: TextIO | None = None
+
+
+@dataclass
+class RequestTiming:
+    """Phase timings of one HTTP request, in seconds.
+
+    ``dns_s``, ``connect_s`` and ``tls_s`` are zero when a pooled connection
+    was reused. ``ttfb_s`` runs from the request being sent to the response
+    head arriving; ``transfer_s`` from there until the body was consumed.
+    """
+
+    method: str
+    url: str
+    host: str
+    started_at: float
+    status: int = 0
+    reused: bool = False
+    dns_s: float = 0.0
+    connect_s: float = 0.0
+    tls_s: float = 0.0
+    ttfb_s: float = 0.0
+    transfer_s: float = 0.0
+    total_s: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: str = ""
+
+    def set_phases(self, phases: Mapping[str, float]) -> None:
+        self.dns_s = phases.get("dns", 0.0)
+        self.connect_s = phases.get("connect", 0.0)
+        self.tls_s = phases.get("tls", 0.0)
+
+
+def redact_url(url: str) -> str:
+    """Reduce ``url`` to a template without credentials, query values or resource IDs."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if parts.port:
+        host = f"{host}:{parts.port}"
+    path = "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in parts.path.split("/"))
+    keys = sorted({k for k, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    query = "&".join(f"{k}={{}}" for k in keys)
+    return f"{parts.scheme}://{host}{path}" + (f"?{query}" if query else "")
+
+
+def enable(log_path: str = "") -> None:
+    """Start recording request timings; with ``log_path`` each record is also appended there as JSON."""
+    global _enabled, _log
+    with _lock:
+        _enabled = True
+        if log_path and _log is None:
+            _log = open(log_path, "a", encoding="utf-8")
+
+
+def disable() -> None:
+    global _enabled, _log
+    with _lock:
+        _enabled = False
+        if _log is not None:
+            _log.close()
+            _log = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def start(method: str, url: str) -> RequestTiming | None:
+    """Begin timing a request, or return None when instrumentation is off."""
+    if not _enabled:
+        return None
+    host = urlsplit(url).netloc.rpartition("@")[2]
+    return RequestTiming(method=method, url=redact_url(url), host=host, started_at=time.time())
+
+
+def finish(rec: RequestTiming) -> None:
+    rec.total_s = time.time() - rec.started_at
+    with _lock:
+        _records.append(rec)
+        if _log is not None:
+            _log.write(json.dumps(asdict(rec)) + "\n")
+            _log.flush()
+
+
+def records() -> list[RequestTiming]:
+    with _lock:
+        return list(_records)
+
+
+def reset() -> None:
+    with _lock:
+        _records.clear()
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return ""
+
+
+def summary_rows() -> list[list[str]]:
+    by_host: dict[str, list[RequestTiming]] = {}
+    for rec in records():
+        by_host.setdefault(rec.host, []).append(rec)
+    rows = []
+    for host in sorted(by_host):
+        recs = by_host[host]
+        totals = sorted(r.total_s for r in recs)
+        ttfbs = sorted(r.ttfb_s for r in recs)
+        fresh = [r for r in recs if not r.reused and not r.error]
+        setup = sum(r.dns_s + r.connect_s + r.tls_s for r in fresh) / len(fresh) if fresh else 0.0
+        received = sum(r.bytes_received for r in recs)
+        # Wall-clock span, so concurrent requests are not double counted.
+        span = max(r.started_at + r.total_s for r in recs) - min(r.started_at for r in recs)
+        rows.append(
+            [
+                host,
+                str(len(recs)),
+                str(sum(1 for r in recs if r.error or r.status >= 400)),
+                f"{_percentile(totals, 50) * 1000:.0f}",
+                f"{_percentile(totals, 95) * 1000:.0f}",
+                f"{_percentile(totals, 99) * 1000:.0f}",
+                f"{_percentile(ttfbs, 50) * 1000:.0f}",
+                f"{len(fresh)} / {setup * 1000:.0f}",
+                _format_bytes(received),
+                f"{_format_bytes(received / span)}/s" if span > 0 else "-",
+            ]
+        )
+    return rows
+
+
+def counter_rows() -> list[list[str]]:
+    """The retry, response-cache and token-cache counters from utils.metrics, by name."""
+    counters = sorted(metrics.snapshot().items())
+    return [[name, f"{value:.2f}" if name.endswith("_s") else f"{value:.0f}"] for name, value in counters]
+
+
+def print_summary() -> None:
+    rows = summary_rows()
+    counters = counter_rows()
+    # Diagnostics, not records: always text tables, even with /output:ndjson|csv.
+    if rows:
+        _print_timing_table(rows)
+    if counters:
+        print("")
+        print("[*] INFO: Retry and cache counters")
+        print("")
+        print(format_table(["Counter", "Value"], counters))
+        print("")
+
+
+def _print_timing_table(rows: list[list[str]]) -> None:
+    print("")
+    print("[*] INFO: HTTP timing summary (ms)")
+    print("")
+    print(
+        format_table(
+            [
+                "Host",
+                "Requests",
+                "Failed",
+                "p50",
+                "p95",
+                "p99",
+                "TTFB p50",
+                "New conns / setup avg",
+                "Received",
+                "Throughput",
+            ],
+            rows,
+        )
+    )
+    print("")
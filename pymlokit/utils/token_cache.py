@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from pymlokit.utils import metrics
+
+# Tokens this close to expiry are treated as expired, so a request never goes out
+# with a token that lapses in flight.
+EXPIRY_MARGIN_S = 60.0
+# Used when the token carries no readable expiry.
+DEFAULT_TTL_S = 3600.0
+
+_lock = threading.Lock()
+_tokens: dict[str, tuple[str, float]] = {}
+_path = ""
+
+
+def cache_key(*parts: str) -> str:
+    """Hash the identifying parts (user, secret, endpoint) so no raw credential is used as a key."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Return the ``exp`` claim of a JWT, or None if ``token`` is not a JWT with one."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def enable_file(path: str) -> None:
+    """Also persist tokens to ``path`` (created 0600) so later runs can reuse them."""
+    global _path
+    with _lock:
+        _path = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(stored, dict):
+            for key, entry in stored.items():
+                if isinstance(entry, list) and len(entry) == 2 and key not in _tokens:
+                    _tokens[key] = (str(entry[0]), float(entry[1]))
+
+
+def disable_file() -> None:
+    global _path
+    with _lock:
+        _path = ""
+
+
+def _save() -> None:
+    if not _path:
+        return
+    now = time.time()
+    live = {k: [t, exp] for k, (t, exp) in _tokens.items() if exp > now}
+    directory = os.path.dirname(os.path.abspath(_path))
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(live, f)
+        os.replace(tmp, _path)
+    except OSError:
+        pass
+
+
+def get(key: str) -> str:
+    """Return the cached token for ``key``, or "" when there is none or it is about to expire."""
+    with _lock:
+        entry = _tokens.get(key)
+    if entry is None or entry[1] - EXPIRY_MARGIN_S <= time.time():
+        return ""
+    metrics.incr("token_cache.hits")
+    return entry[0]
+
+
+def put(key: str, token: str) -> None:
+    expires_at = jwt_expiry(token) or time.time() + DEFAULT_TTL_S
+    with _lock:
+        _tokens[key] = (token, expires_at)
+        _save()
+
+
+def invalidate(key: str) -> None:
+    with _lock:
+        if _tokens.pop(key, None) is not None:
+            _save()
@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterable, Mapping
+from urllib.parse import urlsplit
+
+from pymlokit.utils import http_cache
+from pymlokit.utils.http import (
+    DEFAULT_RETRY,
+    POOL_MAX_IDLE_PER_HOST,
+    STREAM_CHUNK_SIZE,
+    RetryPolicy,
+    StreamingResponse,
+    download_to_file,
+    stream_request,
+)
+from pymlokit.utils.iterators import ContextThreadPool
+
+SEGMENT_SIZE = 8 * 1024 * 1024
+# Where the size is known up front (S3), objects below this are one GET rather than ranges.
+MIN_SEGMENTED_SIZE = 2 * SEGMENT_SIZE
+SEGMENT_WORKERS = 8
+TRANSFER_WORKERS = 8
+TRANSFER_PER_HOST = 4
+# Connections download_many opens to one host at once, shared by the range workers of its files.
+# The pool does not cap open connections itself; matching its idle limit means none are closed on return.
+HOST_CONNECTIONS = POOL_MAX_IDLE_PER_HOST
+
+# Upper bound on range workers per file; download_many lowers it for the files it runs.
+_segment_workers: ContextVar[int] = ContextVar("pymlokit_segment_workers", default=SEGMENT_WORKERS)
+
+# Called with (method, headers) right before each request; returns the headers to send.
+# Storage APIs that sign every request (Azure SharedKey) plug in here.
+HeaderSigner = Callable[[str, dict[str, str]], dict[str, str]]
+
+# Called with (fd, start, end) to write bytes start..end (inclusive) at their offsets in fd.
+RangeFetcher = Callable[[int, int, int], int]
+
+
+@dataclass(frozen=True)
+class RemoteObject:
+    status: int
+    size: int
+    accept_ranges: bool
+    etag: str
+    last_modified: str
+
+
+@dataclass(frozen=True)
+class TransferJob:
+    source: str
+    destination: str
+    # Called with the destination path; returns the number of bytes written.
+    fetch: Callable[[str], int]
+
+
+@dataclass(frozen=True)
+class TransferResult:
+    job: TransferJob
+    size: int = 0
+    error: str = ""
+
+
+class ObjectChanged(Exception):
+    """Raised by a RangeFetcher when the object no longer matches the validators it was started with."""
+
+
+class _RangeIgnored(ObjectChanged):
+    pass
+
+
+class _SegmentFailed(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+def partial_dir() -> str:
+    return os.path.join(http_cache.root_directory(), "partial")
+
+
+class PartialDownload:
+    """On-disk state of an interrupted ranged download.
+
+    Bytes land in ``<digest>.part`` and ``<digest>.json`` records the source, its
+    validators and the byte ranges already written, so a later run with the same
+    resume key only fetches what is missing.
+    """
+
+    def __init__(self, resume_key: str, url: str, remote: RemoteObject) -> None:
+        digest = hashlib.sha256(resume_key.encode("utf-8")).hexdigest()
+        os.makedirs(partial_dir(), exist_ok=True)
+        self.part_path = os.path.join(partial_dir(), f"{digest}.part")
+        self.state_path = os.path.join(partial_dir(), f"{digest}.json")
+        # Query strings can carry credentials (SAS tokens, api_key=...), so only the path is recorded.
+        self.url = url.split("?", 1)[0]
+        self.remote = remote
+        self._lock = threading.Lock()
+        self.done: list[tuple[int, int]] = self._load()
+
+    def _load(self) -> list[tuple[int, int]]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(state, dict) or not os.path.isfile(self.part_path):
+            return []
+        same = (
+            state.get("url") == self.url
+            and state.get("size") == self.remote.size
+            and state.get("etag", "") == self.remote.etag
+            and state.get("last_modified", "") == self.remote.last_modified
+            and (self.remote.etag or self.remote.last_modified)
+        )
+        if not same or os.path.getsize(self.part_path) != self.remote.size:
+            return []
+        done = state.get("done")
+        if not isinstance(done, list):
+            return []
+        return [(int(s), int(e)) for s, e in done]
+
+    def _save(self) -> None:
+        state = {
+            "url": self.url,
+            "etag": self.remote.etag,
+            "last_modified": self.remote.last_modified,
+            "size": self.remote.size,
+            "done": self.done,
+        }
+        tmp = f"{self.state_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.done)
+
+    def missing(self, segment_size: int) -> list[tuple[int, int]]:
+        out = []
+        pos = 0
+        for start, end in sorted(self.done) + [(self.remote.size, self.remote.size)]:
+            while pos < start:
+                seg_end = min(pos + segment_size, start) - 1
+                out.append((pos, seg_end))
+                pos = seg_end + 1
+            pos = max(pos, end + 1)
+        return out
+
+    def mark_done(self, start: int, end: int) -> None:
+        with self._lock:
+            merged: list[tuple[int, int]] = []
+            for s, e in sorted(self.done + [(start, end)]):
+                if merged and s <= merged[-1][1] + 1:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+                else:
+                    merged.append((s, e))
+            self.done = merged
+            self._save()
+
+    def open(self) -> int:
+        flags = os.O_RDWR | os.O_CREAT | (0 if self.resumed else os.O_TRUNC)
+        fd = os.open(self.part_path, flags, 0o644)
+        if not self.resumed:
+            os.ftruncate(fd, self.remote.size)
+            with self._lock:
+                self._save()
+        return fd
+
+    def finish(self, out_path: str) -> None:
+        shutil.move(self.part_path, out_path)
+        self.discard()
+
+    def discard(self) -> None:
+        for p in (self.part_path, self.state_path):
+            if os.path.exists(p):
+                os.remove(p)
+
+
+def _headers_for(
+    method: str, headers: Mapping[str, str] | None, extra: Mapping[str, str], sign: HeaderSigner | None
+) -> dict[str, str]:
+    h = {**(headers or {}), **extra}
+    return sign(method, h) if sign else h
+
+
+def _total_size(content_range: str) -> int:
+    """The complete length from a ``Content-Range: bytes <start>-<end>/<total>`` header, or -1."""
+    unit, _, rest = content_range.strip().partition(" ")
+    total = rest.rpartition("/")[2]
+    if unit.lower() != "bytes" or not total.isdigit():
+        return -1
+    return int(total)
+
+
+def _pwrite_all(fd: int, data: memoryview | bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        n = os.pwrite(fd, view, offset)
+        view = view[n:]
+        offset += n
+
+
+def write_chunks_at(fd: int, chunks: Iterable[bytes], offset: int) -> int:
+    written = 0
+    for chunk in chunks:
+        _pwrite_all(fd, chunk, offset + written)
+        written += len(chunk)
+    return written
+
+
+def _fetch_range(
+    url: str,
+    headers: Mapping[str, str] | None,
+    sign: HeaderSigner | None,
+    range_header: str,
+    validator: str,
+    timeout_s: float,
+    verify_ssl: bool,
+    retry: RetryPolicy,
+    fd: int,
+    start: int,
+    end: int,
+) -> int:
+    extra = {range_header: f"bytes={start}-{end}"}
+    if validator:
+        extra["If-Range"] = validator
+    h = _headers_for("GET", headers, extra, sign)
+    with stream_request("GET", url, headers=h, timeout_s=timeout_s, verify_ssl=verify_ssl, retry=retry) as resp:
+        if resp.status == 200:
+            raise _RangeIgnored()
+        if resp.status != 206:
+            raise _SegmentFailed(resp.status)
+        return _read_range(resp, fd, start, end)
+
+
+def _read_range(resp: StreamingResponse, fd: int, start: int, end: int) -> int:
+    buf = memoryview(bytearray(min(STREAM_CHUNK_SIZE, end - start + 1)))
+    offset = start
+    while offset <= end:
+        n = resp.readinto(buf[: end - offset + 1])
+        if not n:
+            break
+        _pwrite_all(fd, buf[:n], offset)
+        offset += n
+    return offset - start
+
+
+def download_ranges(
+    resume_key: str,
+    url: str,
+    out_path: str,
+    remote: RemoteObject,
+    fetch: RangeFetcher,
+    workers: int = SEGMENT_WORKERS,
+) -> int:
+    """Fetch ``remote`` range by range into ``out_path``, resuming earlier partial state.
+
+    Ranges already recorded for ``resume_key`` are skipped; every finished range is
+    recorded immediately so an interrupted run loses at most the in-flight ranges.
+    If ``fetch`` raises ObjectChanged the partial state is discarded before it propagates.
+    """
+    state = PartialDownload(resume_key, url, remote)
+    workers = min(workers, _segment_workers.get())
+
+    def run(start: int, end: int) -> None:
+        n = fetch(fd, start, end)
+        if n != end - start + 1:
+            raise ConnectionError(f"Connection closed after {n} bytes of range {start}-{end}")
+        state.mark_done(start, end)
+
+    missing = state.missing(SEGMENT_SIZE)
+    fd = state.open()
+    try:
+        try:
+            if missing:
+                pool = ContextThreadPool(max_workers=max(1, min(workers, len(missing))))
+                try:
+                    futures = [pool.submit(run, start, end) for start, end in missing]
+                    for f in futures:
+                        f.result()
+                finally:
+                    pool.shutdown(wait=True, cancel_futures=True)
+        finally:
+            os.close(fd)
+    except ObjectChanged:
+        state.discard()
+        raise
+    state.finish(out_path)
+    return remote.size
+
+
+def download_file(
+    url: str,
+    out_path: str,
+    headers: Mapping[str, str] | None = None,
+    sign: HeaderSigner | None = None,
+    range_header: str = "Range",
+    workers: int = SEGMENT_WORKERS,
+    resume_key: str = "",
+    timeout_s: float = 60.0,
+    verify_ssl: bool = False,
+    retry: RetryPolicy = DEFAULT_RETRY,
+) -> tuple[int, int]:
+    """Download ``url`` into ``out_path``; returns ``(status, bytes_written)``.
+
+    The first request asks for the first SEGMENT_SIZE bytes, so an object that
+    fits (or a server that ignores ranges and answers 200) takes one GET. The
+    rest of a larger object is fetched as concurrent byte ranges written in
+    place, starting from the bytes the first response already carries, and
+    can be resumed by a later call with the same ``resume_key`` (default: the
+    URL). ``workers=1`` is one plain streamed GET.
+    """
+    workers = min(workers, _segment_workers.get())
+    if hasattr(os, "pwrite") and workers > 1:
+        h = _headers_for("GET", headers, {range_header: f"bytes=0-{SEGMENT_SIZE - 1}"}, sign)
+        with stream_request("GET", url, headers=h, timeout_s=timeout_s, verify_ssl=verify_ssl, retry=retry) as first:
+            size = _total_size(first.header("Content-Range")) if first.status == 206 else -1
+            if first.status == 200 or 0 <= size <= SEGMENT_SIZE:
+                with open(out_path, "wb") as f:
+                    return 200, first.copy_to(f)
+            if first.status not in (206, 416):
+                first.read()
+                return first.status, 0
+            if size > 0:
+                remote = RemoteObject(200, size, True, first.header("ETag"), first.header("Last-Modified"))
+                try:
+                    return 200, download_ranges(
+                        resume_key or url,
+                        url,
+                        out_path,
+                        remote,
+                        _ranges_after(first, url, headers, sign, range_header, remote, timeout_s, verify_ssl, retry),
+                        workers,
+                    )
+                except _SegmentFailed as e:
+                    return e.status, 0
+                except _RangeIgnored:
+                    # The object changed while its ranges were fetched, or the server stopped honouring ranges.
+                    pass
+        # 416 (an empty object has no byte 0), an unreadable Content-Range or a changed object: start over plainly.
+    return download_to_file(
+        url,
+        out_path,
+        headers=_headers_for("GET", headers, {}, sign),
+        timeout_s=timeout_s,
+        verify_ssl=verify_ssl,
+        retry=retry,
+    )
+
+
+def _ranges_after(
+    first: StreamingResponse,
+    url: str,
+    headers: Mapping[str, str] | None,
+    sign: HeaderSigner | None,
+    range_header: str,
+    remote: RemoteObject,
+    timeout_s: float,
+    verify_ssl: bool,
+    retry: RetryPolicy,
+) -> RangeFetcher:
+    """A RangeFetcher that serves the range starting at byte 0 from ``first`` and requests every other one."""
+    # If-Range prefers the strong ETag; Last-Modified is the fallback validator.
+    validator = remote.etag or remote.last_modified
+    fetch = partial(_fetch_range, url, headers, sign, range_header, validator, timeout_s, verify_ssl, retry)
+    unread = [first]
+
+    def fetch_or_reuse(fd: int, start: int, end: int) -> int:
+        if start == 0 and end < SEGMENT_SIZE and unread:
+            return _read_range(unread.pop(), fd, start, end)
+        return fetch(fd, start, end)
+
+    return fetch_or_reuse
+
+
+def download_many(
+    jobs: Iterable[TransferJob],
+    workers: int = TRANSFER_WORKERS,
+    per_host: int = TRANSFER_PER_HOST,
+    on_result: Callable[[TransferResult], None] | None = None,
+) -> list[TransferResult]:
+    """Run ``jobs`` on a bounded thread pool with at most ``per_host`` transfers per host.
+
+    Each file may split into HOST_CONNECTIONS // ``per_host`` concurrent ranges,
+    so one host never sees more than HOST_CONNECTIONS connections. A job whose
+    host is at its limit waits in a per-host queue without holding a thread,
+    so jobs for other hosts keep running.
+    ``jobs`` is consumed lazily: each job starts as soon as it is produced, so a
+    generator that is still discovering files keeps the pool busy meanwhile.
+    A failing job is reported in its result instead of stopping the others.
+    ``on_result`` is called from the calling thread as each job finishes; the
+    returned list keeps the order of ``jobs``.
+    """
+    per_host = max(1, per_host)
+    segments = max(1, HOST_CONNECTIONS // per_host)
+
+    def run(job: TransferJob) -> TransferResult:
+        _segment_workers.set(min(_segment_workers.get(), segments))
+        try:
+            parent = os.path.dirname(job.destination)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            return TransferResult(job=job, size=job.fetch(job.destination))
+        except Exception as e:
+            return TransferResult(job=job, error=str(e) or type(e).__name__)
+
+    results: list[TransferResult] = []
+    # Future -> (index in results, host).
+    running: dict[Future[TransferResult], tuple[int, str]] = {}
+    active: dict[str, int] = {}
+    queued: dict[str, deque[int]] = {}
+    pool: ContextThreadPool | None = None
+
+    def start(index: int, host: str) -> None:
+        nonlocal pool
+        pool = pool or ContextThreadPool(max_workers=max(1, workers))
+        active[host] = active.get(host, 0) + 1
+        running[pool.submit(run, results[index].job)] = (index, host)
+
+    def collect(done: Iterable[Future[TransferResult]]) -> None:
+        for future in done:
+            index, host = running.pop(future)
+            active[host] -= 1
+            if queued.get(host):
+                start(queued[host].popleft(), host)
+            results[index] = future.result()
+            if on_result is not None:
+                on_result(results[index])
+
+    try:
+        for job in jobs:
+            host = urlsplit(job.source).netloc.lower()
+            results.append(TransferResult(job=job))
+            if active.get(host, 0) < per_host:
+                start(len(results) - 1, host)
+            else:
+                queued.setdefault(host, deque()).append(len(results) - 1)
+            collect([f for f in running if f.done()])
+        while running:
+            collect(wait(running, return_when=FIRST_COMPLETED).done)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
@@ -0,0 +1,67 @@
+"""Startup regression checks: a command imports only what its own platform and module need.
+
+Each case runs ``python -X importtime -m pymlokit ...`` in a fresh interpreter
+and reads the imported module names from stderr. The commands fail before any
+request is sent, so no network is needed.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+
+# Optional SDKs and heavy stdlib modules no unrelated command should load.
+HEAVY = ("boto3", "botocore", "wandb", "asyncio", "sqlite3")
+PLATFORMS = tuple(p.stem for p in (REPO / "pymlokit" / "platforms").glob("*_api.py"))
+
+
+def imported_modules(tmp_path: Path, *args: str) -> set[str]:
+    env = {**os.environ, "PYTHONPATH": str(REPO), "PYMLOKIT_CACHE_DIR": str(tmp_path / "cache")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pymlokit", *args],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    # "import time: <self us> | <cumulative us> | <indented module name>"
+    names = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            names.add(line.rsplit("|", 1)[1].strip())
+    names.discard("package")
+    assert names, proc.stderr
+    return names
+
+
+def assert_not_imported(names: set[str], forbidden: tuple[str, ...]) -> None:
+    loaded = sorted(n for n in names for f in forbidden if n == f or n.startswith(f + "."))
+    assert not loaded, f"unexpected imports: {', '.join(loaded)}"
+
+
+def test_help_imports_no_platform(tmp_path: Path) -> None:
+    names = imported_modules(tmp_path, "--help")
+    assert_not_imported(names, HEAVY + ("pymlokit.platforms", "pymlokit.utils.http"))
+
+
+def test_missing_option_stops_before_platform_imports(tmp_path: Path) -> None:
+    names = imported_modules(tmp_path, "download-model", "/platform:mlflow", "/credential:user;pass")
+    assert_not_imported(names, HEAVY + ("pymlokit.platforms", "pymlokit.utils.http"))
+
+
+@pytest.mark.parametrize("platform", ["mlflow", "bigml"])
+def test_check_imports_only_its_platform(tmp_path: Path, platform: str) -> None:
+    # An unparseable credential fails inside the module, after its imports, without a request.
+    names = imported_modules(
+        tmp_path, "check", f"/platform:{platform}", "/credential:x", "/url:http://127.0.0.1:1"
+    )
+    assert f"pymlokit.platforms.{platform}_api" in names
+    others = tuple(f"pymlokit.platforms.{p}" for p in PLATFORMS if p != f"{platform}_api")
+    assert_not_imported(names, HEAVY + others + ("pymlokit.utils.async_http",))
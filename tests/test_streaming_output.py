@@ -0,0 +1,86 @@
+"""Machine output formats stream: the first record is written before the listing's next page is served.
+
+Each case runs a list module with ``/output:ndjson`` against a local mock
+ClearML server whose second page is held back until the test has read the
+first record from the module's stdout.
+"""
+
+from __future__ import annotations
+
+import http.server
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+PAGE_SIZE = 500
+
+
+class _ClearML(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        endpoint = self.path.rsplit("/", 1)[-1]
+        if endpoint == "auth.login":
+            payload = {"data": {"token": "token"}}
+        else:
+            page = body.get("page", 0)
+            if page > 0:
+                self.server.release.wait(10)
+                self.server.later_page_served.set()
+            key = {"models.get_all": "models", "tasks.get_all": "tasks", "projects.get_all": "projects"}[endpoint]
+            count = PAGE_SIZE if page == 0 else 1
+            payload = {"data": {key: [{"id": f"{key}-{page}-{i}", "name": f"n{i}"} for i in range(count)]}}
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _ClearML)
+        self.release = threading.Event()
+        self.later_page_served = threading.Event()
+
+
+@pytest.mark.parametrize("module", ["list-models", "list-datasets", "list-projects"])
+def test_clearml_ndjson_streams_before_last_page(tmp_path: Path, module: str) -> None:
+    server = _Server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    env = {**os.environ, "PYTHONPATH": str(REPO), "PYMLOKIT_CACHE_DIR": str(tmp_path / "cache")}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "pymlokit", module, "/platform:clearml", "/credential:key;secret",
+         f"/api-url:http://127.0.0.1:{server.server_port}", "/output:ndjson"],
+        cwd=tmp_path,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        first = json.loads(proc.stdout.readline())
+        assert not server.later_page_served.is_set()
+        server.release.set()
+        rest = proc.stdout.read().splitlines()
+        assert proc.wait(30) == 0
+    finally:
+        server.release.set()
+        proc.kill()
+        server.shutdown()
+    assert first["ID"].endswith("-0-0")
+    assert len(rest) == PAGE_SIZE